@@ -0,0 +1,212 @@
+"""
+Benchmarks the time it takes to import the layer explorer using `python -X importtime`.
+Maya, Qt and dcc are replaced by stub modules so only the cost of this package is measured.
+This script does not require Maya, for example: `python benchmarks/importtime.py --repeat 5`.
+"""
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+STUB_PACKAGES = (
+    'maya',
+    'maya.api',
+    'maya.app',
+    'maya.app.general',
+    'dcc',
+    'dcc.ui',
+    'dcc.maya',
+    'dcc.maya.libs',
+    'dcc.maya.decorators'
+)
+
+STUB_MODULES = (
+    'Qt',
+    'maya.cmds',
+    'maya.standalone',
+    'maya.api.OpenMaya',
+    'maya.app.general.mayaMixin'
+)
+
+STUB_BASE_NAME = '_layerexplorerstubs'
+
+STUB_BASE_SOURCE = '''"""
+Shared placeholder classes so stubs from different modules can be mixed as base classes.
+"""
+class _StubType(type):
+
+    def __getattr__(cls, name):
+
+        return getStub(name)
+
+
+class _Stub(metaclass=_StubType):
+
+    def __init__(self, *args, **kwargs):
+
+        pass
+
+    def __call__(self, *args, **kwargs):
+
+        return args[0] if (len(args) == 1 and callable(args[0])) else self
+
+    def __getattr__(self, name):
+
+        return getStub(name)
+
+
+__stubs__ = {}
+
+
+def getStub(name):
+
+    if name.startswith('__'):
+
+        raise AttributeError(name)
+
+    stub = __stubs__.get(name, None)
+
+    if stub is None:
+
+        stub = _StubType(name, (_Stub,), {})
+        __stubs__[name] = stub
+
+    return stub
+'''
+
+STUB_SOURCE = '''"""
+Stub module that returns a placeholder class for every requested attribute.
+"""
+from _layerexplorerstubs import getStub as __getattr__
+'''
+
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+
+def createStubs(directory):
+    """
+    Writes the stub packages and modules to the supplied directory.
+
+    :type directory: str
+    :rtype: None
+    """
+
+    with open(os.path.join(directory, STUB_BASE_NAME + '.py'), 'w') as stream:
+
+        stream.write(STUB_BASE_SOURCE)
+
+    for name in STUB_PACKAGES:
+
+        packageDirectory = os.path.join(directory, *name.split('.'))
+        os.makedirs(packageDirectory, exist_ok=True)
+
+        with open(os.path.join(packageDirectory, '__init__.py'), 'w') as stream:
+
+            stream.write(STUB_SOURCE)
+
+    for name in STUB_MODULES:
+
+        with open(os.path.join(directory, *name.split('.')) + '.py', 'w') as stream:
+
+            stream.write(STUB_SOURCE)
+
+
+def measureImportTime(moduleName, pythonPath):
+    """
+    Imports the specified module in a fresh interpreter and returns the cumulative import times in microseconds.
+
+    :type moduleName: str
+    :type pythonPath: List[str]
+    :rtype: Dict[str, int]
+    """
+
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(pythonPath), PYTHONDONTWRITEBYTECODE='1')
+    command = [sys.executable, '-X', 'importtime', '-c', 'import {moduleName}'.format(moduleName=moduleName)]
+
+    process = subprocess.run(command, env=environment, capture_output=True, text=True)
+
+    if process.returncode != 0:
+
+        raise RuntimeError(process.stderr)
+
+    timings = {}
+
+    for line in process.stderr.splitlines():
+
+        match = IMPORT_TIME_PATTERN.match(line)
+
+        if match is not None:
+
+            timings[match.group(4)] = int(match.group(2))
+
+    return timings
+
+
+def main():
+    """
+    Main entry point for this benchmark.
+
+    :rtype: None
+    """
+
+    # Parse command line arguments
+    #
+    parser = argparse.ArgumentParser(description='Measures the import time of the layer explorer against stub modules.')
+    parser.add_argument('--repeat', type=int, default=5, help='The number of fresh interpreters to sample.')
+    parser.add_argument('--output', type=str, default='', help='An optional path to write the results to as JSON.')
+
+    args = parser.parse_args()
+
+    # Locate package
+    #
+    packageDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    packageName = os.path.basename(packageDirectory)
+    moduleName = '{packageName}.ui.qlayerexplorer'.format(packageName=packageName)
+
+    # Sample import times
+    #
+    stubDirectory = tempfile.mkdtemp(prefix='layerexplorer_stubs_')
+
+    try:
+
+        createStubs(stubDirectory)
+        pythonPath = [stubDirectory, os.path.dirname(packageDirectory)]
+
+        samples = [measureImportTime(moduleName, pythonPath) for _ in range(args.repeat)]
+
+    finally:
+
+        shutil.rmtree(stubDirectory, ignore_errors=True)
+
+    # Summarize package modules
+    #
+    moduleNames = sorted({name for sample in samples for name in sample if name.startswith(packageName)})
+    results = {name: min(sample.get(name, 0) for sample in samples) for name in moduleNames}
+
+    for (name, microseconds) in results.items():
+
+        log.info('%s: %.3f ms' % (name, microseconds / 1000.0))
+
+    resourcesName = '{packageName}.ui.resources'.format(packageName=packageName)
+    log.info('%s imported on module import: %s' % (resourcesName, resourcesName in results))
+
+    if args.output:
+
+        with open(args.output, 'w') as stream:
+
+            json.dump({'module': moduleName, 'repeat': args.repeat, 'microseconds': results}, stream, indent=4)
+
+
+if __name__ == '__main__':
+
+    main()
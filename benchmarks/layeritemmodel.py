@@ -0,0 +1,324 @@
+"""
+Benchmarks the layer item model, filter model and delegate against synthetic scenes from the stub layer backend.
+Measures model throughput, full-expand time, filter latency per keystroke, selection synchronization time and offscreen paint rate.
+This script does not require Maya, for example: `python -m layerexplorer.benchmarks.layeritemmodel --managers 4 --layers 50 --members 1000 --output results.json`.
+"""
+import os
+import time
+import json
+import argparse
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # Views are rendered without a display!
+
+from Qt import QtCore, QtWidgets
+from ..libs import stublayerbackend
+from ..ui.models import qlayeritemmodel, qlayeritemfiltermodel, qstyledlayeritemdelegate
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def summarize(numCalls, elapsed):
+    """
+    Returns a summary of the supplied number of calls and elapsed time in seconds.
+
+    :type numCalls: int
+    :type elapsed: float
+    :rtype: Dict[str, float]
+    """
+
+    return {'calls': numCalls, 'seconds': elapsed, 'callsPerSecond': (numCalls / elapsed) if elapsed > 0.0 else 0.0}
+
+
+def createView(backend, width=800, height=600):
+    """
+    Returns a tree view, configured like the layer explorer, that displays the supplied backend.
+
+    :type backend: stublayerbackend.StubLayerBackend
+    :type width: int
+    :type height: int
+    :rtype: QtWidgets.QTreeView
+    """
+
+    # Initialize view
+    #
+    view = QtWidgets.QTreeView()
+    view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+    view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+    view.setAlternatingRowColors(True)
+    view.setUniformRowHeights(True)
+    view.setAnimated(False)
+    view.resize(width, height)
+
+    # Initialize models
+    # The item model requires the view as its parent to evaluate size hints!
+    #
+    model = qlayeritemmodel.QLayerItemModel(backend=backend, parent=view)
+    model.setLayerManagers(backend.layerManagers())
+
+    proxyModel = qlayeritemfiltermodel.QLayerItemFilterModel(parent=view)
+    proxyModel.setSourceModel(model)
+
+    view.setModel(proxyModel)
+    view.sortByColumn(0, QtCore.Qt.AscendingOrder)
+
+    delegate = qstyledlayeritemdelegate.QStyledLayerItemDelegate(parent=view)
+    view.setItemDelegate(delegate)
+
+    view.show()
+    QtWidgets.QApplication.processEvents()
+
+    return view
+
+
+def measureThroughput(model):
+    """
+    Measures the throughput of the `rowCount`, `index`, `parent` and `data` methods over every item in the supplied model.
+
+    :type model: qlayeritemmodel.QLayerItemModel
+    :rtype: Dict[str, Dict[str, float]]
+    """
+
+    # Collect parents and their row counts
+    #
+    parents = [QtCore.QModelIndex()]
+    numRows = []
+    indices = []
+
+    numColumns = model.columnCount()
+    rowCountTime = indexTime = 0.0
+
+    while len(parents) > 0:
+
+        parent = parents.pop()
+
+        startTime = time.perf_counter()
+        rowCount = model.rowCount(parent)
+        rowCountTime += time.perf_counter() - startTime
+
+        numRows.append(rowCount)
+
+        # Create indices for every column
+        #
+        startTime = time.perf_counter()
+        children = [model.index(row, column, parent) for row in range(rowCount) for column in range(numColumns)]
+        indexTime += time.perf_counter() - startTime
+
+        indices.extend(children)
+        parents.extend(children[::numColumns])
+
+    # Measure parent lookups
+    #
+    startTime = time.perf_counter()
+
+    for index in indices:
+
+        model.parent(index)
+
+    parentTime = time.perf_counter() - startTime
+
+    # Measure data lookups
+    #
+    roles = (QtCore.Qt.DisplayRole, QtCore.Qt.CheckStateRole, QtCore.Qt.DecorationRole)
+    startTime = time.perf_counter()
+
+    for index in indices:
+
+        for role in roles:
+
+            model.data(index, role)
+
+    dataTime = time.perf_counter() - startTime
+
+    return {
+        'rowCount': summarize(len(numRows), rowCountTime),
+        'index': summarize(len(indices), indexTime),
+        'parent': summarize(len(indices), parentTime),
+        'data': summarize(len(indices) * len(roles), dataTime)
+    }
+
+
+def measureExpand(view):
+    """
+    Measures the time it takes to expand every item in the supplied view and process the resulting layout.
+
+    :type view: QtWidgets.QTreeView
+    :rtype: float
+    """
+
+    view.collapseAll()
+    QtWidgets.QApplication.processEvents()
+
+    startTime = time.perf_counter()
+
+    view.expandAll()
+    QtWidgets.QApplication.processEvents()
+
+    return time.perf_counter() - startTime
+
+
+def measureFilter(view, query):
+    """
+    Measures the latency of each keystroke while the supplied query is typed into the filter model.
+    The filter is cleared afterwards!
+
+    :type view: QtWidgets.QTreeView
+    :type query: str
+    :rtype: Dict[str, Any]
+    """
+
+    proxyModel = view.model()
+    latencies = []
+
+    for i in range(1, len(query) + 1):
+
+        startTime = time.perf_counter()
+
+        proxyModel.setFilterWildcard(query[:i])
+        QtWidgets.QApplication.processEvents()
+
+        latencies.append(time.perf_counter() - startTime)
+
+    proxyModel.setFilterWildcard('')
+    QtWidgets.QApplication.processEvents()
+
+    numKeystrokes = len(latencies)
+
+    return {
+        'query': query,
+        'seconds': latencies,
+        'meanSeconds': (sum(latencies) / numKeystrokes) if numKeystrokes > 0 else 0.0,
+        'maxSeconds': max(latencies) if numKeystrokes > 0 else 0.0
+    }
+
+
+def measureSelection(view, stride=2):
+    """
+    Measures the time it takes to synchronize the view's selection with every n-th layer member.
+    The selection is created through the same `createItemSelection` method the layer explorer uses to synchronize the scene selection!
+
+    :type view: QtWidgets.QTreeView
+    :type stride: int
+    :rtype: Dict[str, float]
+    """
+
+    proxyModel = view.model()
+    model = proxyModel.sourceModel()  # type: qlayeritemmodel.QLayerItemModel
+    selectionModel = view.selectionModel()
+
+    hashCodes = list(model.iterLayerNodeHashCodes(includeDefault=True))[::max(stride, 1)]
+
+    startTime = time.perf_counter()
+
+    items = model.createItemSelection(map(model.indexFromHashCode, hashCodes), proxyModel=proxyModel)
+    selectionModel.select(items, QtCore.QItemSelectionModel.ClearAndSelect | QtCore.QItemSelectionModel.Rows)
+    QtWidgets.QApplication.processEvents()
+
+    elapsed = time.perf_counter() - startTime
+
+    selectionModel.clearSelection()
+    QtWidgets.QApplication.processEvents()
+
+    return {'nodes': len(hashCodes), 'ranges': len(items), 'seconds': elapsed}
+
+
+def measurePaint(view, numFrames=60):
+    """
+    Measures the offscreen paint rate of the supplied view while it is scrolled from top to bottom.
+
+    :type view: QtWidgets.QTreeView
+    :type numFrames: int
+    :rtype: Dict[str, float]
+    """
+
+    scrollBar = view.verticalScrollBar()
+    maximum = scrollBar.maximum()
+    viewport = view.viewport()
+
+    startTime = time.perf_counter()
+
+    for frame in range(numFrames):
+
+        scrollBar.setValue(int(maximum * frame / max(numFrames - 1, 1)))
+        viewport.repaint()
+
+    elapsed = time.perf_counter() - startTime
+
+    return {'frames': numFrames, 'seconds': elapsed, 'framesPerSecond': (numFrames / elapsed) if elapsed > 0.0 else 0.0}
+
+
+def main():
+    """
+    Main entry point for this benchmark.
+
+    :rtype: None
+    """
+
+    # Parse command line arguments
+    #
+    parser = argparse.ArgumentParser(description='Measures the layer item models and delegate against a synthetic scene.')
+    parser.add_argument('--managers', type=int, default=1, help='The number of layer managers, every manager except the first is referenced.')
+    parser.add_argument('--layers', type=int, default=10, help='The number of display layers per layer manager.')
+    parser.add_argument('--members', type=int, default=100, help='The number of members per display layer.')
+    parser.add_argument('--namespace-depth', type=int, default=0, help='The number of nested namespaces per layer manager.')
+    parser.add_argument('--query', type=str, default='node123', help='The filter text that is typed one keystroke at a time.')
+    parser.add_argument('--stride', type=int, default=2, help='Selects every n-th layer member when synchronizing the selection.')
+    parser.add_argument('--frames', type=int, default=60, help='The number of frames to paint.')
+    parser.add_argument('--output', type=str, default='', help='An optional path to write the results to as JSON.')
+
+    args = parser.parse_args()
+
+    application = QtWidgets.QApplication.instance()
+
+    if application is None:
+
+        application = QtWidgets.QApplication([])
+
+    # Create synthetic scene
+    #
+    startTime = time.perf_counter()
+    backend = stublayerbackend.createScene(numLayerManagers=args.managers, numDisplayLayers=args.layers, numLayerNodes=args.members, namespaceDepth=args.namespace_depth)
+    sceneTime = time.perf_counter() - startTime
+
+    log.info('Created %s nodes in %.3f seconds.' % (backend.numNodes(), sceneTime))
+
+    # Measure models and view
+    #
+    view = createView(backend)
+    model = view.model().sourceModel()
+
+    results = {'scene': {'nodes': backend.numNodes(), 'seconds': sceneTime}}
+    results['throughput'] = measureThroughput(model)
+
+    for (name, summary) in results['throughput'].items():
+
+        log.info('%s: %.0f calls per second.' % (name, summary['callsPerSecond']))
+
+    results['expand'] = {'seconds': measureExpand(view)}
+    log.info('Expanded all items in %.3f seconds.' % results['expand']['seconds'])
+
+    results['filter'] = measureFilter(view, args.query)
+    log.info('Filtered %s keystrokes in %.3f seconds on average (%.3f max).' % (len(args.query), results['filter']['meanSeconds'], results['filter']['maxSeconds']))
+
+    results['selection'] = measureSelection(view, stride=args.stride)
+    log.info('Selected %s nodes in %s ranges in %.3f seconds.' % (results['selection']['nodes'], results['selection']['ranges'], results['selection']['seconds']))
+
+    results['paint'] = measurePaint(view, numFrames=args.frames)
+    log.info('Painted %s frames at %.1f frames per second.' % (args.frames, results['paint']['framesPerSecond']))
+
+    # Write results
+    #
+    if args.output:
+
+        arguments = {'managers': args.managers, 'layers': args.layers, 'members': args.members, 'namespaceDepth': args.namespace_depth}
+
+        with open(args.output, 'w') as stream:
+
+            json.dump({'arguments': arguments, 'results': results}, stream, indent=4)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmarks toggling the check-state of display layer members through the `QLayerItemFilterModel`.
+Must be executed from `mayapy`, for example: `mayapy -m layerexplorer.benchmarks.togglecheckstates`.
+"""
+import time
+
+from maya import standalone
+standalone.initialize()
+
+from maya import cmds as mc
+from Qt import QtCore, QtWidgets
+from dcc.maya.libs import dagutils
+from ..ui.models import qmayalayeritemmodel, qlayeritemfiltermodel
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def createScene(numNodes=10000):
+    """
+    Creates a display layer with the specified number of member nodes.
+
+    :type numNodes: int
+    :rtype: str
+    """
+
+    mc.file(new=True, force=True)
+
+    nodes = [mc.createNode('transform', name='node{}'.format(i), skipSelect=True) for i in range(numNodes)]
+    layer = mc.createDisplayLayer(nodes, name='benchmarkLayer', noRecurse=True)
+
+    return layer
+
+
+def toggleCheckStates(skipStateChanges=True):
+    """
+    Toggles the check-state of every layer member and returns the elapsed time in seconds.
+    Dynamic sorting stays enabled so only the filter model's handling of check-state changes is compared!
+
+    :type skipStateChanges: bool
+    :rtype: float
+    """
+
+    # Initialize models
+    #
+    model = qmayalayeritemmodel.QMayaLayerItemModel()
+    model.setLayerManagers(model.backend().layerManagers())
+
+    proxyModel = qlayeritemfiltermodel.QLayerItemFilterModel(skipStateChanges=skipStateChanges)
+    proxyModel.setSourceModel(model)
+    proxyModel.sort(0, QtCore.Qt.AscendingOrder)
+
+    # Collect layer members
+    # Mapping the rows forces the proxy model to create its internal mappings!
+    #
+    layer = dagutils.getMObject('benchmarkLayer')
+    layerIndex = model.indexFromNode(layer)
+    proxyModel.rowCount(proxyModel.mapFromSource(layerIndex))
+
+    numRows = model.rowCount(layerIndex)
+    indices = [model.index(row, 0, parent=layerIndex) for row in range(numRows)]
+
+    # Toggle check-states
+    #
+    startTime = time.perf_counter()
+
+    for index in indices:
+
+        model.setData(index, QtCore.Qt.Unchecked, role=QtCore.Qt.CheckStateRole)
+
+    return time.perf_counter() - startTime
+
+
+def main(numNodes=10000):
+    """
+    Main entry point for this benchmark.
+
+    :type numNodes: int
+    :rtype: None
+    """
+
+    application = QtWidgets.QApplication.instance()
+
+    if application is None:
+
+        application = QtWidgets.QApplication([])
+
+    for skipStateChanges in (False, True):
+
+        createScene(numNodes=numNodes)
+        elapsed = toggleCheckStates(skipStateChanges=skipStateChanges)
+
+        log.info('Toggled %s rows with skipStateChanges=%s in %.3f seconds.' % (numNodes, skipStateChanges, elapsed))
+
+
+if __name__ == '__main__':
+
+    main()
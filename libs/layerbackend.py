@@ -0,0 +1,261 @@
+"""
+Scene access interface used by the layer item models.
+Backends identify nodes by integer ids, which double as the models' internal ids, so the models never handle scene objects directly!
+This module has no dependencies on Maya so models, filters and delegates can be driven by any backend.
+"""
+from abc import ABCMeta, abstractmethod
+from enum import IntEnum
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+VISIBILITY = 'visibility'
+DISPLAY_TYPE = 'displayType'
+HIDE_ON_PLAYBACK = 'hideOnPlayback'
+TEMPLATE = 'template'
+STATE_ATTRIBUTES = (VISIBILITY, DISPLAY_TYPE, HIDE_ON_PLAYBACK, TEMPLATE)
+
+NORMAL = 0
+TEMPLATED = 1
+REFERENCED = 2
+
+SCENE_OPENING = 'sceneOpening'
+SCENE_OPENED = 'sceneOpened'
+SCENE_SAVED = 'sceneSaved'
+REFERENCE_CHANGED = 'referenceChanged'
+SELECTION_CHANGED = 'selectionChanged'
+BATCH_STARTED = 'batchStarted'
+BATCH_FINISHED = 'batchFinished'
+
+
+class NodeType(IntEnum):
+    """
+    Enum class of all node types exposed by a backend.
+    """
+
+    NONE = 0
+    LAYER_MANAGER = 1
+    DISPLAY_LAYER = 2
+    NODE = 3
+
+
+class AbstractLayerBackend(object, metaclass=ABCMeta):
+    """
+    Abstract base class that outlines the scene access required by the layer item models.
+    Subscribers are notified of scene changes by calling their method with the same name as the event, for example `sceneOpened`.
+    """
+
+    # region Methods
+    @abstractmethod
+    def subscribe(self, subscriber):
+        """
+        Subscribes the supplied object to scene change notifications.
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, subscriber):
+        """
+        Unsubscribes the supplied object from scene change notifications.
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        pass
+
+    @abstractmethod
+    def layerManagers(self):
+        """
+        Returns the ids of every layer manager in the scene.
+
+        :rtype: Tuple[int]
+        """
+
+        pass
+
+    @abstractmethod
+    def displayLayers(self, layerManagerId, force=False):
+        """
+        Returns the ids of the display layers under the supplied layer manager, sorted by display order.
+        Backends may reuse cached layers unless forced!
+
+        :type layerManagerId: int
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        pass
+
+    @abstractmethod
+    def numDisplayLayers(self, layerManagerId):
+        """
+        Returns the number of display layers under the supplied layer manager.
+        This is used to validate cached rows so it should be cheaper than `displayLayers`!
+
+        :type layerManagerId: int
+        :rtype: int
+        """
+
+        pass
+
+    @abstractmethod
+    def layerNodes(self, displayLayerId, force=False):
+        """
+        Returns the ids of the members of the supplied display layer.
+        Backends may reuse cached members unless forced!
+
+        :type displayLayerId: int
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        pass
+
+    @abstractmethod
+    def numLayerNodes(self, displayLayerId):
+        """
+        Returns the number of members of the supplied display layer.
+        This is used to validate cached rows so it should be cheaper than `layerNodes`!
+
+        :type displayLayerId: int
+        :rtype: int
+        """
+
+        pass
+
+    @abstractmethod
+    def isAlive(self, nodeId):
+        """
+        Evaluates if the supplied id still refers to a node in the scene.
+
+        :type nodeId: int
+        :rtype: bool
+        """
+
+        pass
+
+    @abstractmethod
+    def nodeType(self, nodeId):
+        """
+        Returns the type of the supplied node.
+        Dead or unknown ids return `NodeType.NONE`!
+
+        :type nodeId: int
+        :rtype: NodeType
+        """
+
+        pass
+
+    @abstractmethod
+    def parent(self, nodeId):
+        """
+        Returns the id of the display layer, or layer manager, the supplied node belongs to.
+        If the node has no parent then none is returned!
+
+        :type nodeId: int
+        :rtype: Union[int, None]
+        """
+
+        pass
+
+    @abstractmethod
+    def nodeName(self, nodeId, includeNamespace=True):
+        """
+        Returns the name of the supplied node.
+
+        :type nodeId: int
+        :type includeNamespace: bool
+        :rtype: str
+        """
+
+        pass
+
+    @abstractmethod
+    def renameNode(self, nodeId, name):
+        """
+        Renames the supplied node.
+        Returns a boolean that indicates if the node was renamed.
+
+        :type nodeId: int
+        :type name: str
+        :rtype: bool
+        """
+
+        pass
+
+    @abstractmethod
+    def typeName(self, nodeId):
+        """
+        Returns the type name of the supplied node, for example `displayLayer`.
+
+        :type nodeId: int
+        :rtype: str
+        """
+
+        pass
+
+    @abstractmethod
+    def isReferenced(self, nodeId):
+        """
+        Evaluates if the supplied node is from a referenced file.
+
+        :type nodeId: int
+        :rtype: bool
+        """
+
+        pass
+
+    @abstractmethod
+    def getState(self, nodeId, attribute):
+        """
+        Returns the specified state for the supplied node.
+        Nodes without the specified state return none!
+
+        :type nodeId: int
+        :type attribute: str
+        :rtype: Union[int, None]
+        """
+
+        pass
+
+    @abstractmethod
+    def setStates(self, states):
+        """
+        Updates the supplied states, keyed by node id and attribute, as a single undoable operation.
+        Returns the keys of the states that required updating.
+
+        :type states: Dict[Tuple[int, str], int]
+        :rtype: List[Tuple[int, str]]
+        """
+
+        pass
+
+    def isDefaultLayer(self, displayLayerId):
+        """
+        Evaluates if the supplied display layer is a default layer.
+
+        :type displayLayerId: int
+        :rtype: bool
+        """
+
+        return self.nodeName(displayLayerId).endswith('defaultLayer')
+
+    def nodeIcon(self, nodeId):
+        """
+        Returns the icon for the supplied node.
+        Backends without icons return none, in which case the models fall back on their own icons!
+
+        :type nodeId: int
+        :rtype: Any
+        """
+
+        return None
+    # endregion
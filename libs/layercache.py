@@ -0,0 +1,296 @@
+"""
+Memory-mapped warm-start cache of the display layer tree.
+Each scene is cached in its own file keyed by the scene path, the scene's modification time and the node UUIDs are then used to validate the cached tree!
+"""
+import os
+import mmap
+import struct
+import hashlib
+
+from uuid import UUID
+from maya import cmds as mc
+from maya.api import OpenMaya as om
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+MAGIC = b'LXWC'
+VERSION = 1
+
+HEADER = struct.Struct('<4sIdIII')  # magic, version, scene time, path length, manager count, layer count
+MANAGER_RECORD = struct.Struct('<16sI')  # uuid, layer count
+LAYER_RECORD = struct.Struct('<16s')  # uuid
+
+
+class LayerTreeCache(object):
+    """
+    Read-only view over a memory-mapped layer tree cache file.
+    """
+
+    # region Dunderscores
+    def __init__(self, path):
+        """
+        Private method called after a new instance has been created.
+
+        :type path: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(LayerTreeCache, self).__init__()
+
+        # Map cache file
+        #
+        self._path = path
+        self._stream = open(path, 'rb')
+        self._buffer = mmap.mmap(self._stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Read header
+        #
+        magic, version, self._sceneTime, pathLength, self._numManagers, self._numLayers = HEADER.unpack_from(self._buffer, 0)
+
+        if magic != MAGIC or version != VERSION:
+
+            self.close()
+            raise TypeError('LayerTreeCache() expects a version %s cache file!' % VERSION)
+
+        offset = HEADER.size
+        self._scenePath = bytes(self._buffer[offset:offset + pathLength]).decode('utf-8')
+
+        self._managerOffset = offset + pathLength
+        self._layerOffset = self._managerOffset + (MANAGER_RECORD.size * self._numManagers)
+
+    def __enter__(self):
+        """
+        Private method called when entering a with statement.
+
+        :rtype: LayerTreeCache
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method called when exiting a with statement.
+
+        :rtype: None
+        """
+
+        self.close()
+    # endregion
+
+    # region Mutators
+    def scenePath(self):
+        """
+        Returns the scene path this cache was written for.
+
+        :rtype: str
+        """
+
+        return self._scenePath
+
+    def sceneTime(self):
+        """
+        Returns the modification time of the scene when this cache was written.
+
+        :rtype: float
+        """
+
+        return self._sceneTime
+    # endregion
+
+    # region Methods
+    def iterLayerManagers(self):
+        """
+        Returns a generator that yields the UUID of each cached layer manager along with the UUIDs of its display layers.
+
+        :rtype: Iterator[Tuple[str, List[str]]]
+        """
+
+        layerIndex = 0
+
+        for i in range(self._numManagers):
+
+            uuid, numLayers = MANAGER_RECORD.unpack_from(self._buffer, self._managerOffset + (MANAGER_RECORD.size * i))
+            displayLayers = []
+
+            for j in range(layerIndex, layerIndex + numLayers):
+
+                layerUuid, = LAYER_RECORD.unpack_from(self._buffer, self._layerOffset + (LAYER_RECORD.size * j))
+                displayLayers.append(str(UUID(bytes=layerUuid)).upper())
+
+            layerIndex += numLayers
+
+            yield str(UUID(bytes=uuid)).upper(), displayLayers
+
+    def close(self):
+        """
+        Unmaps the cache file.
+
+        :rtype: None
+        """
+
+        if not self._buffer.closed:
+
+            self._buffer.close()
+
+        if not self._stream.closed:
+
+            self._stream.close()
+    # endregion
+
+
+def getCacheDirectory():
+    """
+    Returns the directory the cache files are stored in.
+
+    :rtype: str
+    """
+
+    return os.path.join(mc.internalVar(userAppDir=True), 'layerExplorer', 'cache')
+
+
+def getCachePath(scenePath):
+    """
+    Returns the cache file path for the supplied scene path.
+
+    :type scenePath: str
+    :rtype: str
+    """
+
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(scenePath)).encode('utf-8')).hexdigest()
+    return os.path.join(getCacheDirectory(), '{key}.lxc'.format(key=key))
+
+
+def getSceneTime(scenePath):
+    """
+    Returns the modification time of the supplied scene path.
+    If the scene does not exist on disk then none is returned!
+
+    :type scenePath: str
+    :rtype: Union[float, None]
+    """
+
+    return os.path.getmtime(scenePath) if os.path.isfile(scenePath) else None
+
+
+def writeCache(scenePath, layerTree):
+    """
+    Writes the supplied layer tree to the cache file associated with the specified scene path.
+    The layer tree consists of layer manager UUIDs paired with the UUIDs of their display layers in row order.
+
+    :type scenePath: str
+    :type layerTree: List[Tuple[str, List[str]]]
+    :rtype: bool
+    """
+
+    # Check if scene exists on disk
+    #
+    sceneTime = getSceneTime(scenePath)
+
+    if sceneTime is None:
+
+        return False
+
+    # Serialize layer tree
+    #
+    path = scenePath.encode('utf-8')
+    numLayers = sum(len(displayLayers) for (_, displayLayers) in layerTree)
+
+    chunks = [HEADER.pack(MAGIC, VERSION, sceneTime, len(path), len(layerTree), numLayers), path]
+    chunks.extend(MANAGER_RECORD.pack(UUID(uuid).bytes, len(displayLayers)) for (uuid, displayLayers) in layerTree)
+    chunks.extend(LAYER_RECORD.pack(UUID(uuid).bytes) for (_, displayLayers) in layerTree for uuid in displayLayers)
+
+    # Write cache file
+    # A temporary file is swapped in so readers never map a partially written cache!
+    #
+    cachePath = getCachePath(scenePath)
+    os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+
+    tempPath = '{cachePath}.tmp'.format(cachePath=cachePath)
+
+    with open(tempPath, 'wb') as stream:
+
+        stream.write(b''.join(chunks))
+
+    os.replace(tempPath, cachePath)
+
+    return True
+
+
+def readCache(scenePath):
+    """
+    Returns the cache associated with the supplied scene path.
+    If the cache does not exist or is out-of-date then none is returned!
+
+    :type scenePath: str
+    :rtype: Union[LayerTreeCache, None]
+    """
+
+    # Check if cache exists
+    #
+    cachePath = getCachePath(scenePath)
+    sceneTime = getSceneTime(scenePath)
+
+    if sceneTime is None or not os.path.isfile(cachePath):
+
+        return None
+
+    # Map cache file
+    #
+    try:
+
+        cache = LayerTreeCache(cachePath)
+
+    except (OSError, ValueError, TypeError, struct.error) as exception:
+
+        log.debug('Unable to read layer cache: %s (%s)' % (cachePath, exception))
+        return None
+
+    # Check if cache is up-to-date
+    #
+    isUpToDate = cache.sceneTime() == sceneTime and os.path.normcase(cache.scenePath()) == os.path.normcase(scenePath)
+
+    if not isUpToDate:
+
+        cache.close()
+        return None
+
+    return cache
+
+
+def getNodeUuid(node):
+    """
+    Returns the UUID of the supplied node.
+
+    :type node: om.MObject
+    :rtype: str
+    """
+
+    return om.MFnDependencyNode(node).uuid().asString()
+
+
+def getNodesFromUuid(uuid):
+    """
+    Returns every node associated with the supplied UUID.
+    Nodes from a file that is referenced more than once share their UUIDs so more than one node can be returned!
+
+    :type uuid: str
+    :rtype: List[om.MObject]
+    """
+
+    selectionList = om.MSelectionList()
+
+    try:
+
+        selectionList.add(om.MUuid(uuid))
+
+    except RuntimeError:
+
+        return []
+
+    return [selectionList.getDependNode(i) for i in range(selectionList.length())]
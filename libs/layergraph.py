@@ -0,0 +1,514 @@
+"""
+Process-wide, reference-counted cache of the display layer graph.
+Any number of models and views can subscribe to the same graph, the scene is only queried and observed once no matter how many are open!
+"""
+from maya import cmds as mc
+from maya.api import OpenMaya as om
+from dcc.maya.libs import dagutils, plugutils
+from functools import partial
+from .layerbackend import SCENE_OPENING, SCENE_OPENED, SCENE_SAVED, REFERENCE_CHANGED, SELECTION_CHANGED, BATCH_STARTED, BATCH_FINISHED
+
+import hashlib
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+REFERENCE_MESSAGES = (
+    om.MSceneMessage.kAfterCreateReference,
+    om.MSceneMessage.kAfterRemoveReference,
+    om.MSceneMessage.kAfterLoadReference,
+    om.MSceneMessage.kAfterUnloadReference,
+    om.MSceneMessage.kAfterImportReference
+)
+
+BATCH_OPENING_MESSAGES = (
+    om.MSceneMessage.kBeforeImport,
+    om.MSceneMessage.kBeforeCreateReference,
+    om.MSceneMessage.kBeforeLoadReference,
+    om.MSceneMessage.kBeforeImportReference
+)
+
+BATCH_CLOSING_MESSAGES = (
+    om.MSceneMessage.kAfterImport,
+    om.MSceneMessage.kAfterCreateReference,
+    om.MSceneMessage.kAfterLoadReference,
+    om.MSceneMessage.kAfterImportReference
+)
+
+
+class LayerGraph(object):
+    """
+    Shared cache of layer managers, display layers and layer members.
+    Subscribers are notified of scene changes by calling their method with the same name as the event, for example `sceneOpened`.
+    """
+
+    # region Dunderscores
+    __instance__ = None
+
+    def __init__(self):
+        """
+        Private method called after a new instance has been created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(LayerGraph, self).__init__()
+
+        # Declare private variables
+        #
+        self._subscribers = []  # type: list[object]
+        self._callbackIds = om.MCallbackIdArray()
+        self._handles = {}  # type: dict[int, om.MObjectHandle]
+        self._displayLayers = {}  # type: dict[int, tuple[int]]
+        self._layerNodes = {}  # type: dict[int, tuple[int]]
+        self._batchDepth = 0
+    # endregion
+
+    # region Mutators
+    def subscriberCount(self):
+        """
+        Returns the number of subscribers keeping this graph alive.
+
+        :rtype: int
+        """
+
+        return len(self._subscribers)
+
+    def isBatching(self):
+        """
+        Evaluates if an import or reference operation is currently in progress.
+
+        :rtype: bool
+        """
+
+        return self._batchDepth > 0
+    # endregion
+
+    # region Methods
+    @classmethod
+    def getInstance(cls):
+        """
+        Returns the shared layer graph.
+
+        :rtype: LayerGraph
+        """
+
+        if cls.__instance__ is None:
+
+            cls.__instance__ = cls()
+
+        return cls.__instance__
+
+    def isSubscribed(self, subscriber):
+        """
+        Evaluates if the supplied object is subscribed to this graph.
+
+        :type subscriber: object
+        :rtype: bool
+        """
+
+        return any(other is subscriber for other in self._subscribers)
+
+    def subscribe(self, subscriber):
+        """
+        Subscribes the supplied object to scene change notifications.
+        The scene callbacks are only added for the first subscriber!
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        if self.isSubscribed(subscriber):
+
+            return
+
+        self._subscribers.append(subscriber)
+
+        if len(self._subscribers) == 1:
+
+            self.addCallbacks()
+
+    def unsubscribe(self, subscriber):
+        """
+        Unsubscribes the supplied object from scene change notifications.
+        Once the last subscriber is gone the scene callbacks are removed and the cache is released!
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        if not self.isSubscribed(subscriber):
+
+            return
+
+        self._subscribers = [other for other in self._subscribers if other is not subscriber]
+
+        if len(self._subscribers) == 0:
+
+            self.removeCallbacks()
+            self.clear()
+
+    def notify(self, event, *args, **kwargs):
+        """
+        Notifies every subscriber of the specified event.
+        A failing subscriber does not prevent the remaining subscribers from being notified!
+
+        :type event: str
+        :rtype: None
+        """
+
+        for subscriber in tuple(self._subscribers):
+
+            func = getattr(subscriber, event, None)
+
+            if not callable(func):
+
+                continue
+
+            try:
+
+                func(*args, **kwargs)
+
+            except RuntimeError as exception:
+
+                log.warning('Unable to notify %s of %s event: %s' % (subscriber, event, exception))
+
+    def addCallbacks(self):
+        """
+        Adds the scene callbacks shared by every subscriber.
+
+        :rtype: None
+        """
+
+        # Check if callbacks already exist
+        #
+        hasCallbacks = len(self._callbackIds) > 0
+
+        if hasCallbacks:
+
+            return
+
+        # Add callbacks
+        #
+        callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeNew, self.onSceneOpening)
+        self._callbackIds.append(callbackId)
+
+        callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeOpen, self.onSceneOpening)
+        self._callbackIds.append(callbackId)
+
+        callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kSceneUpdate, self.onSceneOpened)
+        self._callbackIds.append(callbackId)
+
+        callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kAfterSave, self.onSceneSaved)
+        self._callbackIds.append(callbackId)
+
+        for message in REFERENCE_MESSAGES:
+
+            callbackId = om.MSceneMessage.addReferenceCallback(message, self.onReferenceChanged, clientData=message)
+            self._callbackIds.append(callbackId)
+
+        for message in BATCH_OPENING_MESSAGES:
+
+            callbackId = om.MSceneMessage.addCallback(message, self.onBatchStarted, clientData=message)
+            self._callbackIds.append(callbackId)
+
+        callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kAfterImport, self.onBatchFinished, clientData=om.MSceneMessage.kAfterImport)
+        self._callbackIds.append(callbackId)
+
+        callbackId = om.MEventMessage.addEventCallback('SelectionChanged', self.onSelectionChanged)
+        self._callbackIds.append(callbackId)
+
+    def removeCallbacks(self):
+        """
+        Removes the scene callbacks shared by every subscriber.
+
+        :rtype: None
+        """
+
+        hasCallbacks = len(self._callbackIds) > 0
+
+        if hasCallbacks:
+
+            om.MMessage.removeCallbacks(self._callbackIds)
+            self._callbackIds.clear()
+
+        self._batchDepth = 0
+
+    def clear(self):
+        """
+        Clears the cached layer graph.
+
+        :rtype: None
+        """
+
+        self._handles.clear()
+        self._displayLayers.clear()
+        self._layerNodes.clear()
+
+    def invalidate(self, *hashCodes):
+        """
+        Invalidates the cached children of the supplied layer managers or display layers.
+        Structural edits that preserve the number of children, such as re-ordering layers, must invalidate the graph!
+
+        :type hashCodes: Union[int, List[int]]
+        :rtype: None
+        """
+
+        for hashCode in hashCodes:
+
+            self._displayLayers.pop(hashCode, None)
+            self._layerNodes.pop(hashCode, None)
+
+    def getHandle(self, hashCode):
+        """
+        Returns the cached handle associated with the supplied hash code.
+
+        :type hashCode: int
+        :rtype: Union[om.MObjectHandle, None]
+        """
+
+        return self._handles.get(hashCode, None)
+
+    def registerNode(self, node):
+        """
+        Caches a handle for the supplied node and returns its hash code.
+
+        :type node: om.MObject
+        :rtype: int
+        """
+
+        handle = dagutils.getMObjectHandle(node)
+        hashCode = handle.hashCode()
+
+        self._handles[hashCode] = handle
+
+        return hashCode
+
+    def getDisplayLayers(self, layerManager, force=False):
+        """
+        Returns the hash codes of the display layers connected to the supplied layer manager, sorted by display order.
+        The cached layers are reused as long as the number of connected layers is unchanged, unless forced!
+
+        :type layerManager: om.MObject
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        # Check if cache is up-to-date
+        #
+        layerManagerHashCode = self.registerNode(layerManager)
+        displayLayers = self._displayLayers.get(layerManagerHashCode, None)
+
+        displayLayerIdPlug = plugutils.findPlug(layerManager, 'displayLayerId')
+        numConnectedElements = displayLayerIdPlug.numConnectedElements()
+
+        if displayLayers is not None and len(displayLayers) == numConnectedElements and not force:
+
+            return displayLayers
+
+        # Query display layers
+        #
+        displayOrders = {}
+
+        for i in range(numConnectedElements):
+
+            displayLayerIdElement = displayLayerIdPlug.connectionByPhysicalIndex(i)
+            displayLayer = displayLayerIdElement.destinations()[0].node()
+            displayLayerHashCode = self.registerNode(displayLayer)
+
+            displayOrders[displayLayerHashCode] = plugutils.findPlug(displayLayer, 'displayOrder').asInt()
+
+        # Sort layers by display order
+        # This matches the order used by the layer editor!
+        #
+        displayLayers = tuple(sorted(displayOrders.keys(), key=displayOrders.get))
+        self._displayLayers[layerManagerHashCode] = displayLayers
+
+        return displayLayers
+
+    def getLayerNodes(self, displayLayer, force=False):
+        """
+        Returns the hash codes of the nodes associated with the supplied display layer.
+        The cached members are reused as long as the number of members is unchanged, unless forced!
+
+        :type displayLayer: om.MObject
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        # Check if cache is up-to-date
+        #
+        displayLayerHashCode = self.registerNode(displayLayer)
+        layerNodes = self._layerNodes.get(displayLayerHashCode, None)
+
+        drawInfoPlug = plugutils.findPlug(displayLayer, 'drawInfo')
+        destinations = drawInfoPlug.destinations()
+
+        if layerNodes is not None and len(layerNodes) == len(destinations) and not force:
+
+            return layerNodes
+
+        # Query layer nodes
+        #
+        layerNodes = tuple(self.registerNode(destination.node()) for destination in destinations)
+        self._layerNodes[displayLayerHashCode] = layerNodes
+
+        return layerNodes
+
+    def getLayerFingerprint(self, layerManager):
+        """
+        Returns a cheap structural fingerprint of the supplied layer manager.
+        The fingerprint covers the display layers, in display order, along with their number of members.
+        Members are never visited so this only scales with the number of layers, see `getMemberFingerprint` for the members!
+
+        :type layerManager: om.MObject
+        :rtype: str
+        """
+
+        digest = hashlib.sha1()
+        fnDependNode = om.MFnDependencyNode()
+
+        displayLayerIdPlug = plugutils.findPlug(layerManager, 'displayLayerId')
+        numConnectedElements = displayLayerIdPlug.numConnectedElements()
+
+        for i in range(numConnectedElements):
+
+            displayLayerIdElement = displayLayerIdPlug.connectionByPhysicalIndex(i)
+            displayLayer = displayLayerIdElement.destinations()[0].node()
+
+            fnDependNode.setObject(displayLayer)
+            uuid = fnDependNode.uuid().asString()
+            displayOrder = plugutils.findPlug(displayLayer, 'displayOrder').asInt()
+            numMembers = len(plugutils.findPlug(displayLayer, 'drawInfo').destinations())
+
+            digest.update('{uuid}:{displayOrder}:{count};'.format(uuid=uuid, displayOrder=displayOrder, count=numMembers).encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def getMemberFingerprint(self, displayLayer):
+        """
+        Returns a fingerprint of the members of the supplied display layer.
+        Unlike member counts, this also detects members that swapped layers!
+
+        :type displayLayer: om.MObject
+        :rtype: str
+        """
+
+        digest = hashlib.sha1()
+        fnDependNode = om.MFnDependencyNode()
+
+        for destination in plugutils.findPlug(displayLayer, 'drawInfo').destinations():
+
+            fnDependNode.setObject(destination.node())
+            digest.update(fnDependNode.uuid().asString().encode('utf-8'))
+
+        return digest.hexdigest()
+    # endregion
+
+    # region Callbacks
+    def onSceneOpening(self, *args, **kwargs):
+        """
+        Callback method for any pre-scene open notifications.
+        The cached graph is released before any subscribers are notified!
+
+        :rtype: None
+        """
+
+        self._batchDepth = 0  # Failed imports never close their bracket!
+
+        self.clear()
+        self.notify(SCENE_OPENING, *args, **kwargs)
+
+    def onSceneOpened(self, *args, **kwargs):
+        """
+        Callback method for any post-scene open notifications.
+
+        :rtype: None
+        """
+
+        mc.evalDeferred(partial(self.notify, SCENE_OPENED, *args, **kwargs))  # Allows scene to fully load before processing changes!
+
+    def onSceneSaved(self, *args, **kwargs):
+        """
+        Callback method for any post-scene save notifications.
+
+        :rtype: None
+        """
+
+        self.notify(SCENE_SAVED, *args, **kwargs)
+
+    def onReferenceChanged(self, referenceNode, resolvedPath, clientData=None):
+        """
+        Callback method for any reference change notifications.
+        Reference messages that close an import or reference bracket are delivered before the bracket is closed!
+
+        :type referenceNode: om.MObject
+        :type resolvedPath: om.MFileObject
+        :type clientData: int
+        :rtype: None
+        """
+
+        self.notify(REFERENCE_CHANGED, referenceNode, resolvedPath, clientData)
+
+        if clientData in BATCH_CLOSING_MESSAGES:
+
+            self.onBatchFinished(clientData)
+
+    def onBatchStarted(self, clientData=None):
+        """
+        Callback method for any import or reference bracket opening notifications.
+        Only the outermost bracket is delivered to subscribers!
+
+        :type clientData: int
+        :rtype: None
+        """
+
+        self._batchDepth += 1
+
+        if self._batchDepth == 1:
+
+            self.notify(BATCH_STARTED, clientData)
+
+    def onBatchFinished(self, clientData=None):
+        """
+        Callback method for any import or reference bracket closing notifications.
+        Only the outermost bracket is delivered to subscribers!
+
+        :type clientData: int
+        :rtype: None
+        """
+
+        if self._batchDepth == 0:
+
+            return
+
+        self._batchDepth -= 1
+
+        if self._batchDepth == 0:
+
+            self.notify(BATCH_FINISHED, clientData)
+
+    def onSelectionChanged(self, *args, **kwargs):
+        """
+        Callback method for any selection change notifications.
+
+        :rtype: None
+        """
+
+        self.notify(SELECTION_CHANGED, *args, **kwargs)
+    # endregion
+
+
+def getLayerGraph():
+    """
+    Returns the shared layer graph.
+
+    :rtype: LayerGraph
+    """
+
+    return LayerGraph.getInstance()
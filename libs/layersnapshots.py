@@ -0,0 +1,222 @@
+"""
+Named snapshots of the display states of display layers and their member nodes.
+Snapshots are stored on the scene, inside the file info, as compressed blobs keyed by node UUID and namespace.
+"""
+import json
+import zlib
+import base64
+
+from maya import cmds as mc
+from maya.api import OpenMaya as om
+from . import layerstates
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+SNAPSHOT_PREFIX = 'layerExplorerSnapshot_'
+KEY_SEPARATOR = ':'
+
+
+def getSnapshotKey(node):
+    """
+    Returns the snapshot key for the supplied node.
+    Nodes from a file that is referenced more than once share their UUIDs so the key also includes the node's namespace!
+
+    :type node: om.MObject
+    :rtype: str
+    """
+
+    fnDependNode = om.MFnDependencyNode(node)
+    uuid = fnDependNode.uuid().asString()
+    namespace = fnDependNode.namespace
+
+    if namespace:
+
+        return KEY_SEPARATOR.join([uuid, namespace])
+
+    else:
+
+        return uuid
+
+
+def iterNodesFromSnapshotKey(key):
+    """
+    Returns a generator that yields the nodes that match the supplied snapshot key.
+    Keys without a namespace only match nodes outside of any namespace!
+
+    :type key: str
+    :rtype: Iterator[om.MObject]
+    """
+
+    # Collect nodes with UUID
+    # UUIDs never contain the separator so everything after the first separator is the namespace!
+    #
+    uuid, _, namespace = key.partition(KEY_SEPARATOR)
+    selectionList = om.MSelectionList()
+
+    try:
+
+        selectionList.add(om.MUuid(uuid))
+
+    except RuntimeError:
+
+        log.debug('Unable to locate node with UUID: %s' % uuid)
+        return
+
+    # Yield nodes with matching namespace
+    #
+    for i in range(selectionList.length()):
+
+        node = selectionList.getDependNode(i)
+
+        if om.MFnDependencyNode(node).namespace == namespace:
+
+            yield node
+
+
+def captureSnapshot(nodes):
+    """
+    Returns a snapshot of every state for the supplied nodes.
+    Each node's snapshot key is mapped to a list of states in the same order as `layerstates.STATE_ATTRIBUTES`.
+
+    :type nodes: List[om.MObject]
+    :rtype: Dict[str, List[Union[int, None]]]
+    """
+
+    states = layerstates.getAllStates(nodes)
+    keys = [getSnapshotKey(node) for node in nodes]
+
+    return {key: [states[attribute][i] for attribute in layerstates.STATE_ATTRIBUTES] for (i, key) in enumerate(keys)}
+
+
+def restoreSnapshot(snapshot, modifier=None, nodesByKey=None):
+    """
+    Restores the supplied snapshot through a single modifier.
+    Every node that matches a snapshot key is updated, however, only the states that differ from the snapshot are changed while any missing nodes are skipped!
+    If no modifier is supplied then a new one is created and executed, otherwise the caller is responsible for executing it!
+    Keys are resolved against the optional nodes, keyed by snapshot key, before falling back on a UUID lookup!
+
+    :type snapshot: Dict[str, List[Union[int, None]]]
+    :type modifier: Union[om.MDGModifier, None]
+    :type nodesByKey: Union[Dict[str, List[om.MObject]], None]
+    :rtype: Tuple[om.MDGModifier, int]
+    """
+
+    execute = modifier is None
+
+    if execute:
+
+        modifier = om.MDGModifier()
+
+    if nodesByKey is None:
+
+        nodesByKey = {}
+
+    numChanges = 0
+
+    for (key, values) in snapshot.items():
+
+        # Update changed states on every matching node
+        #
+        nodes = nodesByKey.get(key, None)
+
+        if nodes is None:
+
+            nodes = iterNodesFromSnapshotKey(key)
+
+        for node in nodes:
+
+            for (attribute, value) in zip(layerstates.STATE_ATTRIBUTES, values):
+
+                if value is None:
+
+                    continue
+
+                plug = layerstates.findStatePlug(node, attribute)
+                numChanges += int(layerstates.setState(plug, value, modifier))
+
+    if execute and numChanges > 0:
+
+        modifier.doIt()
+
+    return modifier, numChanges
+
+
+def encodeSnapshot(snapshot):
+    """
+    Encodes the supplied snapshot into a compact string.
+
+    :type snapshot: Dict[str, List[Union[int, None]]]
+    :rtype: str
+    """
+
+    data = json.dumps(snapshot, separators=(',', ':')).encode('utf-8')
+    return base64.b64encode(zlib.compress(data)).decode('ascii')
+
+
+def decodeSnapshot(blob):
+    """
+    Decodes the supplied compact string into a snapshot.
+
+    :type blob: str
+    :rtype: Dict[str, List[Union[int, None]]]
+    """
+
+    data = zlib.decompress(base64.b64decode(blob.encode('ascii')))
+    return json.loads(data.decode('utf-8'))
+
+
+def listSnapshots():
+    """
+    Returns the names of the snapshots stored on the scene.
+
+    :rtype: List[str]
+    """
+
+    fileInfo = mc.fileInfo(query=True) or []
+    keys = fileInfo[0::2]
+
+    return sorted(key[len(SNAPSHOT_PREFIX):] for key in keys if key.startswith(SNAPSHOT_PREFIX))
+
+
+def saveSnapshot(name, snapshot):
+    """
+    Stores the supplied snapshot on the scene under the specified name.
+
+    :type name: str
+    :type snapshot: Dict[str, List[Union[int, None]]]
+    :rtype: None
+    """
+
+    mc.fileInfo(SNAPSHOT_PREFIX + name, encodeSnapshot(snapshot))
+
+
+def loadSnapshot(name):
+    """
+    Returns the snapshot stored on the scene under the specified name.
+
+    :type name: str
+    :rtype: Union[Dict[str, List[Union[int, None]]], None]
+    """
+
+    values = mc.fileInfo(SNAPSHOT_PREFIX + name, query=True) or []
+
+    if len(values) == 0:
+
+        return None
+
+    return decodeSnapshot(values[0])
+
+
+def deleteSnapshot(name):
+    """
+    Removes the snapshot stored on the scene under the specified name.
+
+    :type name: str
+    :rtype: None
+    """
+
+    mc.fileInfo(remove=SNAPSHOT_PREFIX + name)
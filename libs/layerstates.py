@@ -0,0 +1,221 @@
+"""
+Vectorized access to the display states of display layers and their member nodes.
+None of these functions depend on the user interface so they can be used from batch `mayapy` jobs as well!
+"""
+from maya.api import OpenMaya as om
+from dcc.maya.libs import dagutils, plugutils
+from .layerbackend import VISIBILITY, DISPLAY_TYPE, HIDE_ON_PLAYBACK, TEMPLATE, STATE_ATTRIBUTES, NORMAL, TEMPLATED, REFERENCED
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def findStatePlug(node, attribute):
+    """
+    Returns the plug that stores the specified state for the supplied node.
+    If a member node's plug has an incoming connection then the source plug is returned instead!
+
+    :type node: Union[str, om.MObject, om.MObjectHandle]
+    :type attribute: str
+    :rtype: Union[om.MPlug, None]
+    """
+
+    # Check if node has attribute
+    #
+    node = dagutils.getMObject(node)
+    fnDependNode = om.MFnDependencyNode(node)
+
+    if not fnDependNode.hasAttribute(attribute):
+
+        return None
+
+    # Check if plug has an incoming connection
+    # Display layers drive their members through `drawOverride` so this only applies to member nodes!
+    #
+    plug = plugutils.findPlug(node, attribute)
+
+    if plug.isDestination and not node.hasFn(om.MFn.kDisplayLayer):
+
+        return plug.source()
+
+    else:
+
+        return plug
+
+
+def iterStatePlugs(nodes, attribute):
+    """
+    Returns a generator that yields the state plugs for the supplied nodes.
+    Nodes without the specified attribute yield none!
+
+    :type nodes: Sequence[Union[str, om.MObject, om.MObjectHandle]]
+    :type attribute: str
+    :rtype: Iterator[Union[om.MPlug, None]]
+    """
+
+    for node in nodes:
+
+        yield findStatePlug(node, attribute)
+
+
+def getState(plug):
+    """
+    Returns the state stored by the supplied plug.
+
+    :type plug: Union[om.MPlug, None]
+    :rtype: Union[int, None]
+    """
+
+    if plug is None:
+
+        return None
+
+    elif plug.partialName(useLongNames=True) == DISPLAY_TYPE:
+
+        return plug.asInt()
+
+    else:
+
+        return int(plug.asBool())
+
+
+def getStates(nodes, attribute):
+    """
+    Returns the specified state for each of the supplied nodes.
+    Nodes without the specified attribute return none!
+
+    :type nodes: Sequence[Union[str, om.MObject, om.MObjectHandle]]
+    :type attribute: str
+    :rtype: List[Union[int, None]]
+    """
+
+    return [getState(plug) for plug in iterStatePlugs(nodes, attribute)]
+
+
+def getAllStates(nodes):
+    """
+    Returns every state for each of the supplied nodes.
+
+    :type nodes: Sequence[Union[str, om.MObject, om.MObjectHandle]]
+    :rtype: Dict[str, List[Union[int, None]]]
+    """
+
+    return {attribute: getStates(nodes, attribute) for attribute in STATE_ATTRIBUTES}
+
+
+def setState(plug, value, modifier):
+    """
+    Adds a state change for the supplied plug to the specified modifier.
+    Returns a boolean that indicates if the plug required updating!
+
+    :type plug: Union[om.MPlug, None]
+    :type value: Union[bool, int]
+    :type modifier: om.MDGModifier
+    :rtype: bool
+    """
+
+    # Check if plug requires updating
+    #
+    currentValue = getState(plug)
+
+    if currentValue is None or currentValue == int(value):
+
+        return False
+
+    # Update modifier
+    #
+    if plug.partialName(useLongNames=True) == DISPLAY_TYPE:
+
+        modifier.newPlugValueInt(plug, int(value))
+
+    else:
+
+        modifier.newPlugValueBool(plug, bool(value))
+
+    return True
+
+
+def setStates(nodes, attribute, values, modifier=None):
+    """
+    Updates the specified state for each of the supplied nodes through a single modifier.
+    The values can either be a sequence, with one value per node, or a single value for all nodes.
+    If no modifier is supplied then a new one is created and executed, otherwise the caller is responsible for executing it!
+
+    :type nodes: Sequence[Union[str, om.MObject, om.MObjectHandle]]
+    :type attribute: str
+    :type values: Union[bool, int, Sequence[Union[bool, int]]]
+    :type modifier: Union[om.MDGModifier, None]
+    :rtype: Tuple[om.MDGModifier, int]
+    """
+
+    # Evaluate supplied values
+    #
+    numNodes = len(nodes)
+
+    if isinstance(values, (bool, int)):
+
+        values = [values] * numNodes
+
+    else:
+
+        values = list(values)
+        numValues = len(values)
+
+        if numValues != numNodes:
+
+            raise ValueError('setStates() expects %s values (%s given)!' % (numNodes, numValues))
+
+    # Collect state changes
+    #
+    execute = modifier is None
+
+    if execute:
+
+        modifier = om.MDGModifier()
+
+    numChanges = 0
+
+    for (plug, value) in zip(iterStatePlugs(nodes, attribute), values):
+
+        numChanges += int(setState(plug, value, modifier))
+
+    # Check if modifier should be executed
+    #
+    if execute and numChanges > 0:
+
+        modifier.doIt()
+
+    return modifier, numChanges
+
+
+def setAllStates(nodes, states, modifier=None):
+    """
+    Updates multiple states for each of the supplied nodes through a single modifier.
+    The states are keyed by attribute name, see `setStates` for the supported values.
+
+    :type nodes: Sequence[Union[str, om.MObject, om.MObjectHandle]]
+    :type states: Dict[str, Union[bool, int, Sequence[Union[bool, int]]]]
+    :type modifier: Union[om.MDGModifier, None]
+    :rtype: Tuple[om.MDGModifier, int]
+    """
+
+    execute = modifier is None
+
+    if execute:
+
+        modifier = om.MDGModifier()
+
+    numChanges = 0
+
+    for (attribute, values) in states.items():
+
+        modifier, changes = setStates(nodes, attribute, values, modifier=modifier)
+        numChanges += changes
+
+    if execute and numChanges > 0:
+
+        modifier.doIt()
+
+    return modifier, numChanges
@@ -0,0 +1,356 @@
+"""
+Maya implementation of the layer backend interface.
+Node ids are the hash codes of their `MObjectHandle`, all queries are routed through the shared layer graph!
+"""
+from maya.api import OpenMaya as om
+from dcc.maya.libs import dagutils, layerutils, plugutils
+from dcc.maya.decorators import undo
+from . import layerbackend, layergraph, layerstates
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class MayaLayerBackend(layerbackend.AbstractLayerBackend):
+    """
+    Overload of `AbstractLayerBackend` that interfaces with the display layers of the open Maya scene.
+    """
+
+    # region Dunderscores
+    def __init__(self, layerGraph=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type layerGraph: Union[layergraph.LayerGraph, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(MayaLayerBackend, self).__init__()
+
+        # Declare private variables
+        #
+        self._layerGraph = layerGraph if layerGraph is not None else layergraph.getLayerGraph()
+    # endregion
+
+    # region Mutators
+    def layerGraph(self):
+        """
+        Returns the shared layer graph this backend queries.
+
+        :rtype: layergraph.LayerGraph
+        """
+
+        return self._layerGraph
+    # endregion
+
+    # region Methods
+    def registerNode(self, node):
+        """
+        Registers the supplied node with the shared layer graph and returns its id.
+
+        :type node: Union[str, om.MObject, om.MObjectHandle]
+        :rtype: int
+        """
+
+        return self._layerGraph.registerNode(dagutils.getMObject(node))
+
+    def getNode(self, nodeId):
+        """
+        Returns the node associated with the supplied id.
+        If the node is no longer alive then a null object is returned!
+
+        :type nodeId: int
+        :rtype: om.MObject
+        """
+
+        handle = self._layerGraph.getHandle(nodeId)
+
+        if isinstance(handle, om.MObjectHandle) and handle.isAlive():
+
+            return handle.object()
+
+        else:
+
+            return om.MObject.kNullObj
+
+    def subscribe(self, subscriber):
+        """
+        Subscribes the supplied object to scene change notifications.
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        self._layerGraph.subscribe(subscriber)
+
+    def unsubscribe(self, subscriber):
+        """
+        Unsubscribes the supplied object from scene change notifications.
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        self._layerGraph.unsubscribe(subscriber)
+
+    def layerManagers(self):
+        """
+        Returns the ids of every layer manager in the scene.
+
+        :rtype: Tuple[int]
+        """
+
+        return tuple(self._layerGraph.registerNode(layerManager) for layerManager in dagutils.iterNodes(om.MFn.kDisplayLayerManager))
+
+    def displayLayers(self, layerManagerId, force=False):
+        """
+        Returns the ids of the display layers under the supplied layer manager, sorted by display order.
+
+        :type layerManagerId: int
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        layerManager = self.getNode(layerManagerId)
+
+        if layerManager.isNull():
+
+            return ()
+
+        return self._layerGraph.getDisplayLayers(layerManager, force=force)
+
+    def numDisplayLayers(self, layerManagerId):
+        """
+        Returns the number of display layers under the supplied layer manager.
+
+        :type layerManagerId: int
+        :rtype: int
+        """
+
+        layerManager = self.getNode(layerManagerId)
+
+        if layerManager.isNull():
+
+            return 0
+
+        return plugutils.findPlug(layerManager, 'displayLayerId').numConnectedElements()
+
+    def layerNodes(self, displayLayerId, force=False):
+        """
+        Returns the ids of the members of the supplied display layer.
+
+        :type displayLayerId: int
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        displayLayer = self.getNode(displayLayerId)
+
+        if displayLayer.isNull():
+
+            return ()
+
+        return self._layerGraph.getLayerNodes(displayLayer, force=force)
+
+    def numLayerNodes(self, displayLayerId):
+        """
+        Returns the number of members of the supplied display layer.
+
+        :type displayLayerId: int
+        :rtype: int
+        """
+
+        displayLayer = self.getNode(displayLayerId)
+
+        if displayLayer.isNull():
+
+            return 0
+
+        return len(plugutils.findPlug(displayLayer, 'drawInfo').destinations())
+
+    def isAlive(self, nodeId):
+        """
+        Evaluates if the supplied id still refers to a node in the scene.
+
+        :type nodeId: int
+        :rtype: bool
+        """
+
+        handle = self._layerGraph.getHandle(nodeId)
+        return isinstance(handle, om.MObjectHandle) and handle.isAlive()
+
+    def nodeType(self, nodeId):
+        """
+        Returns the type of the supplied node.
+
+        :type nodeId: int
+        :rtype: layerbackend.NodeType
+        """
+
+        node = self.getNode(nodeId)
+
+        if node.isNull():
+
+            return layerbackend.NodeType.NONE
+
+        elif node.hasFn(om.MFn.kDisplayLayerManager):
+
+            return layerbackend.NodeType.LAYER_MANAGER
+
+        elif node.hasFn(om.MFn.kDisplayLayer):
+
+            return layerbackend.NodeType.DISPLAY_LAYER
+
+        elif node.hasFn(om.MFn.kDagNode):
+
+            return layerbackend.NodeType.NODE
+
+        else:
+
+            return layerbackend.NodeType.NONE
+
+    def parent(self, nodeId):
+        """
+        Returns the id of the display layer, or layer manager, the supplied node belongs to.
+
+        :type nodeId: int
+        :rtype: Union[int, None]
+        """
+
+        node = self.getNode(nodeId)
+
+        if node.isNull():
+
+            return None
+
+        elif node.hasFn(om.MFn.kDagNode):
+
+            displayLayer = layerutils.getLayerFromNode(node)
+            return self._layerGraph.registerNode(displayLayer) if displayLayer is not None else None
+
+        elif node.hasFn(om.MFn.kDisplayLayer):
+
+            layerManager = layerutils.getManagerFromLayer(node)
+            return self._layerGraph.registerNode(layerManager) if not layerManager.isNull() else None
+
+        else:
+
+            return None
+
+    def nodeName(self, nodeId, includeNamespace=True):
+        """
+        Returns the name of the supplied node.
+
+        :type nodeId: int
+        :type includeNamespace: bool
+        :rtype: str
+        """
+
+        return dagutils.getNodeName(self.getNode(nodeId), includeNamespace=includeNamespace)
+
+    def renameNode(self, nodeId, name):
+        """
+        Renames the supplied node.
+
+        :type nodeId: int
+        :type name: str
+        :rtype: bool
+        """
+
+        node = self.getNode(nodeId)
+
+        if node.isNull():
+
+            return False
+
+        dagutils.renameNode(node, name)
+        return True
+
+    def typeName(self, nodeId):
+        """
+        Returns the type name of the supplied node.
+
+        :type nodeId: int
+        :rtype: str
+        """
+
+        return str(om.MFnDependencyNode(self.getNode(nodeId)).typeName)
+
+    def isReferenced(self, nodeId):
+        """
+        Evaluates if the supplied node is from a referenced file.
+
+        :type nodeId: int
+        :rtype: bool
+        """
+
+        return om.MFnDependencyNode(self.getNode(nodeId)).isFromReferencedFile
+
+    def nodeIcon(self, nodeId):
+        """
+        Returns the outliner icon for the supplied node.
+
+        :type nodeId: int
+        :rtype: QtGui.QIcon
+        """
+
+        return dagutils.getNodeIcon(self.getNode(nodeId), forOutliner=True)
+
+    def getState(self, nodeId, attribute):
+        """
+        Returns the specified state for the supplied node.
+
+        :type nodeId: int
+        :type attribute: str
+        :rtype: Union[int, None]
+        """
+
+        node = self.getNode(nodeId)
+
+        if node.isNull():
+
+            return None
+
+        return layerstates.getState(layerstates.findStatePlug(node, attribute))
+
+    @undo.Undo(name='Set Layer States')
+    def setStates(self, states):
+        """
+        Updates the supplied states, keyed by node id and attribute, through a single modifier.
+
+        :type states: Dict[Tuple[int, str], int]
+        :rtype: List[Tuple[int, str]]
+        """
+
+        # Collect state changes
+        #
+        modifier = om.MDGModifier()
+        changed = []
+
+        for ((nodeId, attribute), state) in states.items():
+
+            node = self.getNode(nodeId)
+
+            if node.isNull():
+
+                continue
+
+            plug = layerstates.findStatePlug(node, attribute)
+
+            if layerstates.setState(plug, state, modifier):
+
+                changed.append((nodeId, attribute))
+
+        # Execute modifier
+        #
+        if len(changed) > 0:
+
+            modifier.doIt()
+            undo.commit(modifier.doIt, modifier.undoIt)
+
+        return changed
+    # endregion
@@ -0,0 +1,479 @@
+"""
+In-memory implementation of the layer backend interface.
+Nodes are stored in flat arrays indexed by their id, and names are derived on demand, so synthetic scenes with millions of nodes stay cheap to build!
+This module has no dependencies on Maya, for example: `scene = createScene(numLayerManagers=10, numDisplayLayers=100, numLayerNodes=1000)`.
+"""
+from array import array
+from . import layerbackend
+from .layerbackend import NodeType
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class StubLayerBackend(layerbackend.AbstractLayerBackend):
+    """
+    Overload of `AbstractLayerBackend` that stores a synthetic scene in memory.
+    """
+
+    # region Dunderscores
+    __type_names__ = {
+        NodeType.LAYER_MANAGER: 'displayLayerManager',
+        NodeType.DISPLAY_LAYER: 'displayLayer',
+        NodeType.NODE: 'transform'
+    }
+
+    __name_prefixes__ = {
+        NodeType.LAYER_MANAGER: 'layerManager',
+        NodeType.DISPLAY_LAYER: 'layer',
+        NodeType.NODE: 'node'
+    }
+
+    __default_states__ = {
+        layerbackend.VISIBILITY: 1,
+        layerbackend.DISPLAY_TYPE: layerbackend.NORMAL,
+        layerbackend.HIDE_ON_PLAYBACK: 0,
+        layerbackend.TEMPLATE: 0
+    }
+
+    __state_attributes__ = {
+        NodeType.DISPLAY_LAYER: (layerbackend.VISIBILITY, layerbackend.DISPLAY_TYPE, layerbackend.HIDE_ON_PLAYBACK),
+        NodeType.NODE: (layerbackend.VISIBILITY, layerbackend.HIDE_ON_PLAYBACK, layerbackend.TEMPLATE)
+    }
+
+    def __init__(self):
+        """
+        Private method called after a new instance has been created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(StubLayerBackend, self).__init__()
+
+        # Declare private variables
+        # Id zero is reserved so that a parent of zero means no parent!
+        #
+        self._subscribers = []  # type: list[object]
+        self._types = bytearray(1)
+        self._parents = array('q', [0])
+        self._children = {}  # type: dict[int, array]
+        self._layerManagers = array('q')
+        self._names = {}  # type: dict[int, str]
+        self._namespaces = {}  # type: dict[int, str]
+        self._referenced = set()  # type: set[int]
+        self._states = {attribute: bytearray([value]) for (attribute, value) in self.__default_states__.items()}
+    # endregion
+
+    # region Mutators
+    def numNodes(self):
+        """
+        Returns the number of nodes in this scene, including layer managers and display layers.
+
+        :rtype: int
+        """
+
+        return len(self._types) - 1
+    # endregion
+
+    # region Methods
+    def addNodes(self, nodeType, parent, count):
+        """
+        Adds the specified number of nodes, of the supplied type, under the given parent.
+        Returns the ids of the new nodes.
+
+        :type nodeType: NodeType
+        :type parent: int
+        :type count: int
+        :rtype: range
+        """
+
+        start = len(self._types)
+        nodeIds = range(start, start + count)
+
+        self._types.extend(bytes([nodeType]) * count)
+        self._parents.extend([parent] * count)
+
+        for (attribute, states) in self._states.items():
+
+            states.extend(bytes([self.__default_states__[attribute]]) * count)
+
+        if parent != 0:
+
+            self._children.setdefault(parent, array('q')).extend(nodeIds)
+
+        return nodeIds
+
+    def createLayerManager(self, namespace='', referenced=False):
+        """
+        Creates a new layer manager, along with its default layer, and returns its id.
+
+        :type namespace: str
+        :type referenced: bool
+        :rtype: int
+        """
+
+        layerManagerId, = self.addNodes(NodeType.LAYER_MANAGER, 0, 1)
+        self._layerManagers.append(layerManagerId)
+
+        self._children[layerManagerId] = array('q')
+        self._namespaces[layerManagerId] = '{namespace}:'.format(namespace=namespace) if namespace else ''
+
+        if referenced:
+
+            self._referenced.add(layerManagerId)
+
+        self.createDisplayLayer(layerManagerId, name='defaultLayer')
+
+        return layerManagerId
+
+    def createDisplayLayer(self, layerManagerId, name=None):
+        """
+        Creates a new display layer under the supplied layer manager and returns its id.
+
+        :type layerManagerId: int
+        :type name: Union[str, None]
+        :rtype: int
+        """
+
+        displayLayerId, = self.addNodes(NodeType.DISPLAY_LAYER, layerManagerId, 1)
+        self._children[displayLayerId] = array('q')
+
+        if name:
+
+            self._names[displayLayerId] = name
+
+        return displayLayerId
+
+    def createNodes(self, displayLayerId, count):
+        """
+        Creates the specified number of nodes as members of the supplied display layer.
+
+        :type displayLayerId: int
+        :type count: int
+        :rtype: range
+        """
+
+        return self.addNodes(NodeType.NODE, displayLayerId, count)
+
+    def moveNodes(self, nodeIds, displayLayerId):
+        """
+        Moves the supplied nodes to the specified display layer.
+
+        :type nodeIds: Iterable[int]
+        :type displayLayerId: int
+        :rtype: int
+        """
+
+        # Group nodes by their current layer
+        #
+        nodesByLayer = {}
+
+        for nodeId in nodeIds:
+
+            parent = self._parents[nodeId]
+
+            if self._types[nodeId] == NodeType.NODE and parent != displayLayerId:
+
+                nodesByLayer.setdefault(parent, set()).add(nodeId)
+
+        # Reparent nodes
+        #
+        targetNodes = self._children.setdefault(displayLayerId, array('q'))
+        numNodes = 0
+
+        for (parent, members) in nodesByLayer.items():
+
+            if parent != 0:
+
+                self._children[parent] = array('q', (nodeId for nodeId in self._children[parent] if nodeId not in members))
+
+            for nodeId in members:
+
+                self._parents[nodeId] = displayLayerId
+
+            targetNodes.extend(sorted(members))
+            numNodes += len(members)
+
+        return numNodes
+
+    def notify(self, event, *args, **kwargs):
+        """
+        Notifies every subscriber of the specified event.
+
+        :type event: str
+        :rtype: None
+        """
+
+        for subscriber in tuple(self._subscribers):
+
+            func = getattr(subscriber, event, None)
+
+            if callable(func):
+
+                func(*args, **kwargs)
+
+    def subscribe(self, subscriber):
+        """
+        Subscribes the supplied object to scene change notifications.
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        if not any(other is subscriber for other in self._subscribers):
+
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber):
+        """
+        Unsubscribes the supplied object from scene change notifications.
+
+        :type subscriber: object
+        :rtype: None
+        """
+
+        self._subscribers = [other for other in self._subscribers if other is not subscriber]
+
+    def layerManagers(self):
+        """
+        Returns the ids of every layer manager in the scene.
+
+        :rtype: Tuple[int]
+        """
+
+        return tuple(self._layerManagers)
+
+    def displayLayers(self, layerManagerId, force=False):
+        """
+        Returns the ids of the display layers under the supplied layer manager, in creation order.
+
+        :type layerManagerId: int
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        return tuple(self._children.get(layerManagerId, ()))
+
+    def numDisplayLayers(self, layerManagerId):
+        """
+        Returns the number of display layers under the supplied layer manager.
+
+        :type layerManagerId: int
+        :rtype: int
+        """
+
+        return len(self._children.get(layerManagerId, ()))
+
+    def layerNodes(self, displayLayerId, force=False):
+        """
+        Returns the ids of the members of the supplied display layer.
+
+        :type displayLayerId: int
+        :type force: bool
+        :rtype: Tuple[int]
+        """
+
+        return tuple(self._children.get(displayLayerId, ()))
+
+    def numLayerNodes(self, displayLayerId):
+        """
+        Returns the number of members of the supplied display layer.
+
+        :type displayLayerId: int
+        :rtype: int
+        """
+
+        return len(self._children.get(displayLayerId, ()))
+
+    def isAlive(self, nodeId):
+        """
+        Evaluates if the supplied id still refers to a node in the scene.
+
+        :type nodeId: int
+        :rtype: bool
+        """
+
+        return 0 < nodeId < len(self._types) and self._types[nodeId] != NodeType.NONE
+
+    def nodeType(self, nodeId):
+        """
+        Returns the type of the supplied node.
+
+        :type nodeId: int
+        :rtype: NodeType
+        """
+
+        return NodeType(self._types[nodeId]) if 0 < nodeId < len(self._types) else NodeType.NONE
+
+    def parent(self, nodeId):
+        """
+        Returns the id of the display layer, or layer manager, the supplied node belongs to.
+
+        :type nodeId: int
+        :rtype: Union[int, None]
+        """
+
+        parent = self._parents[nodeId] if self.isAlive(nodeId) else 0
+        return parent if parent != 0 else None
+
+    def layerManager(self, nodeId):
+        """
+        Returns the id of the layer manager the supplied node ultimately belongs to.
+        Nodes without a layer return zero!
+
+        :type nodeId: int
+        :rtype: int
+        """
+
+        nodeType = self.nodeType(nodeId)
+
+        if nodeType == NodeType.NODE:
+
+            nodeId = self._parents[nodeId]
+            nodeType = NodeType.DISPLAY_LAYER if nodeId != 0 else NodeType.NONE
+
+        if nodeType == NodeType.DISPLAY_LAYER:
+
+            return self._parents[nodeId]
+
+        elif nodeType == NodeType.LAYER_MANAGER:
+
+            return nodeId
+
+        else:
+
+            return 0
+
+    def nodeName(self, nodeId, includeNamespace=True):
+        """
+        Returns the name of the supplied node.
+        Unnamed nodes derive their name from their type and id!
+
+        :type nodeId: int
+        :type includeNamespace: bool
+        :rtype: str
+        """
+
+        name = self._names.get(nodeId, None)
+
+        if name is None:
+
+            name = '{prefix}{nodeId}'.format(prefix=self.__name_prefixes__.get(self.nodeType(nodeId), 'node'), nodeId=nodeId)
+
+        if includeNamespace:
+
+            return self._namespaces.get(self.layerManager(nodeId), '') + name
+
+        else:
+
+            return name
+
+    def renameNode(self, nodeId, name):
+        """
+        Renames the supplied node.
+        Referenced nodes cannot be renamed!
+
+        :type nodeId: int
+        :type name: str
+        :rtype: bool
+        """
+
+        if not self.isAlive(nodeId) or self.isReferenced(nodeId):
+
+            return False
+
+        self._names[nodeId] = name
+        return True
+
+    def typeName(self, nodeId):
+        """
+        Returns the type name of the supplied node.
+
+        :type nodeId: int
+        :rtype: str
+        """
+
+        return self.__type_names__.get(self.nodeType(nodeId), '')
+
+    def isReferenced(self, nodeId):
+        """
+        Evaluates if the supplied node belongs to a referenced layer manager.
+
+        :type nodeId: int
+        :rtype: bool
+        """
+
+        return self.layerManager(nodeId) in self._referenced
+
+    def getState(self, nodeId, attribute):
+        """
+        Returns the specified state for the supplied node.
+
+        :type nodeId: int
+        :type attribute: str
+        :rtype: Union[int, None]
+        """
+
+        if attribute not in self.__state_attributes__.get(self.nodeType(nodeId), ()):
+
+            return None
+
+        return self._states[attribute][nodeId]
+
+    def setStates(self, states):
+        """
+        Updates the supplied states, keyed by node id and attribute.
+
+        :type states: Dict[Tuple[int, str], int]
+        :rtype: List[Tuple[int, str]]
+        """
+
+        changed = []
+
+        for ((nodeId, attribute), state) in states.items():
+
+            currentState = self.getState(nodeId, attribute)
+
+            if currentState is None or currentState == int(state):
+
+                continue
+
+            self._states[attribute][nodeId] = int(state)
+            changed.append((nodeId, attribute))
+
+        return changed
+    # endregion
+
+
+def createScene(numLayerManagers=1, numDisplayLayers=10, numLayerNodes=100, namespaceDepth=0):
+    """
+    Returns a synthetic scene with the specified number of layer managers, display layers per manager and members per layer.
+    Every layer manager, except the first, is referenced and the members of each layer manager are nested under the specified number of namespaces.
+
+    :type numLayerManagers: int
+    :type numDisplayLayers: int
+    :type numLayerNodes: int
+    :type namespaceDepth: int
+    :rtype: StubLayerBackend
+    """
+
+    scene = StubLayerBackend()
+
+    for i in range(numLayerManagers):
+
+        isReferenced = i > 0
+        namespaces = ['ref{index}'.format(index=i)] if isReferenced else []
+        namespaces.extend('ns{depth}'.format(depth=depth) for depth in range(namespaceDepth))
+
+        layerManagerId = scene.createLayerManager(namespace=':'.join(namespaces), referenced=isReferenced)
+
+        for j in range(numDisplayLayers):
+
+            displayLayerId = scene.createDisplayLayer(layerManagerId)
+            scene.createNodes(displayLayerId, numLayerNodes)
+
+    return scene
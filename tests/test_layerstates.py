@@ -0,0 +1,302 @@
+"""
+Tests the vectorized layer state helpers against a stubbed scene graph.
+The stubs only implement the parts of `maya.api.OpenMaya` and `dcc.maya.libs` that `layerstates` touches, so Maya is not required!
+"""
+import os
+import sys
+import types
+import importlib
+import pytest
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class StubPlug(object):
+    """
+    Stub plug that stores a single state value.
+    """
+
+    def __init__(self, node, name, value, source=None):
+
+        self.node = node
+        self.name = name
+        self.value = value
+        self._source = source
+
+    @property
+    def isDestination(self):
+
+        return self._source is not None
+
+    def source(self):
+
+        return self._source
+
+    def partialName(self, useLongNames=False):
+
+        return self.name
+
+    def asInt(self):
+
+        return int(self.value)
+
+    def asBool(self):
+
+        return bool(self.value)
+
+
+class StubNode(object):
+    """
+    Stub node that owns a plug for each of its state attributes.
+    """
+
+    def __init__(self, name, isDisplayLayer=False, **states):
+
+        self.name = name
+        self.isDisplayLayer = isDisplayLayer
+        self.plugs = {attribute: StubPlug(self, attribute, value) for (attribute, value) in states.items()}
+
+    def hasFn(self, fn):
+
+        return fn == StubFn.kDisplayLayer and self.isDisplayLayer
+
+
+class StubFn(object):
+    """
+    Stub function set constants.
+    """
+
+    kDisplayLayer = 1
+
+
+class StubFnDependencyNode(object):
+    """
+    Stub dependency node function set.
+    """
+
+    def __init__(self, node):
+
+        self.node = node
+
+    def hasAttribute(self, attribute):
+
+        return attribute in self.node.plugs
+
+
+class StubDGModifier(object):
+    """
+    Stub modifier that queues plug values until it is executed.
+    """
+
+    def __init__(self):
+
+        self.queue = []
+        self.numExecutions = 0
+
+    def newPlugValueInt(self, plug, value):
+
+        self.queue.append((plug, int(value)))
+
+    def newPlugValueBool(self, plug, value):
+
+        self.queue.append((plug, bool(value)))
+
+    def doIt(self):
+
+        self.numExecutions += 1
+
+        for (plug, value) in self.queue:
+
+            plug.value = value
+
+
+def createStubs():
+    """
+    Returns the stubbed Maya and dcc modules keyed by their module names.
+
+    :rtype: Dict[str, module]
+    """
+
+    om = types.ModuleType('maya.api.OpenMaya')
+    om.MFn = StubFn
+    om.MFnDependencyNode = StubFnDependencyNode
+    om.MDGModifier = StubDGModifier
+
+    dagutils = types.ModuleType('dcc.maya.libs.dagutils')
+    dagutils.getMObject = lambda node: node
+
+    plugutils = types.ModuleType('dcc.maya.libs.plugutils')
+    plugutils.findPlug = lambda node, attribute: node.plugs[attribute]
+
+    modules = {
+        'maya': types.ModuleType('maya'),
+        'maya.api': types.ModuleType('maya.api'),
+        'maya.api.OpenMaya': om,
+        'dcc': types.ModuleType('dcc'),
+        'dcc.maya': types.ModuleType('dcc.maya'),
+        'dcc.maya.libs': types.ModuleType('dcc.maya.libs'),
+        'dcc.maya.libs.dagutils': dagutils,
+        'dcc.maya.libs.plugutils': plugutils
+    }
+
+    modules['maya.api'].OpenMaya = om
+    modules['dcc.maya.libs'].dagutils = dagutils
+    modules['dcc.maya.libs'].plugutils = plugutils
+
+    return modules
+
+
+@pytest.fixture
+def layerstates(monkeypatch):
+    """
+    Installs the stubbed Maya and dcc modules and returns a freshly imported `layerstates` module.
+    Every module imported against the stubs is dropped on teardown so the stubs never leak into other tests!
+
+    :rtype: module
+    """
+
+    for (name, module) in createStubs().items():
+
+        monkeypatch.setitem(sys.modules, name, module)
+
+    # Import package by its directory name
+    #
+    rootDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parentDirectory, packageName = os.path.split(rootDirectory)
+
+    if parentDirectory not in sys.path:
+
+        monkeypatch.syspath_prepend(parentDirectory)
+
+    moduleName = '%s.libs.layerstates' % packageName
+    monkeypatch.delitem(sys.modules, moduleName, raising=False)
+
+    moduleNames = set(sys.modules)
+
+    try:
+
+        yield importlib.import_module(moduleName)
+
+    finally:
+
+        for name in set(sys.modules).difference(moduleNames):
+
+            del sys.modules[name]
+
+
+@pytest.fixture
+def nodes():
+    """
+    Returns a display layer and members with a mix of state values.
+    The last member is missing the `hideOnPlayback` attribute and the second member's visibility is driven by the first!
+
+    :rtype: List[StubNode]
+    """
+
+    layer = StubNode('layer1', isDisplayLayer=True, visibility=True, displayType=0, hideOnPlayback=False)
+    member1 = StubNode('node1', visibility=True, displayType=0, hideOnPlayback=False)
+    member2 = StubNode('node2', visibility=False, displayType=2, hideOnPlayback=True)
+    member3 = StubNode('node3', visibility=True, displayType=1)
+
+    member2.plugs['visibility']._source = member1.plugs['visibility']
+
+    return [layer, member1, member2, member3]
+
+
+def test_getStates(layerstates, nodes):
+
+    assert layerstates.getStates(nodes, 'visibility') == [1, 1, 1, 1]
+    assert layerstates.getStates(nodes, 'displayType') == [0, 0, 2, 1]
+    assert layerstates.getStates(nodes, 'hideOnPlayback') == [0, 0, 1, None]
+
+
+def test_getStatesIgnoresDisplayLayerConnections(layerstates, nodes):
+
+    layer = nodes[0]
+    layer.plugs['visibility'].value = False
+    layer.plugs['visibility']._source = nodes[1].plugs['visibility']
+
+    assert layerstates.getStates([layer], 'visibility') == [0]
+
+
+def test_getAllStates(layerstates, nodes):
+
+    states = layerstates.getAllStates(nodes)
+
+    assert sorted(states.keys()) == sorted(layerstates.STATE_ATTRIBUTES)
+    assert states['template'] == [None, None, None, None]
+
+
+def test_setStatesBroadcastsValue(layerstates, nodes):
+
+    modifier, numChanges = layerstates.setStates(nodes, 'displayType', layerstates.REFERENCED)
+
+    assert numChanges == 3
+    assert modifier.numExecutions == 1
+    assert layerstates.getStates(nodes, 'displayType') == [2, 2, 2, 2]
+
+
+def test_setStatesPerNodeValues(layerstates, nodes):
+
+    modifier, numChanges = layerstates.setStates(nodes, 'hideOnPlayback', [True, False, False, True])
+
+    assert numChanges == 2
+    assert modifier.numExecutions == 1
+    assert layerstates.getStates(nodes, 'hideOnPlayback') == [1, 0, 0, None]
+
+
+def test_setStatesUpdatesConnectedSource(layerstates, nodes):
+
+    modifier, numChanges = layerstates.setStates(nodes[2:3], 'visibility', False)
+
+    assert numChanges == 1
+    assert nodes[1].plugs['visibility'].value is False
+    assert nodes[2].plugs['visibility'].value is False
+
+
+def test_setStatesValueCountMismatch(layerstates, nodes):
+
+    with pytest.raises(ValueError):
+
+        layerstates.setStates(nodes, 'visibility', [True, False])
+
+
+def test_setStatesSkipsUnchangedValues(layerstates, nodes):
+
+    modifier, numChanges = layerstates.setStates(nodes, 'visibility', True)
+
+    assert numChanges == 0
+    assert modifier.numExecutions == 0
+    assert len(modifier.queue) == 0
+
+
+def test_setStatesSharedModifier(layerstates, nodes):
+
+    modifier = StubDGModifier()
+
+    sharedModifier, numChanges = layerstates.setStates(nodes, 'visibility', False, modifier=modifier)
+    sharedModifier, changes = layerstates.setStates(nodes, 'displayType', 1, modifier=sharedModifier)
+    numChanges += changes
+
+    assert sharedModifier is modifier
+    assert numChanges == 7
+    assert modifier.numExecutions == 0
+    assert layerstates.getStates(nodes, 'visibility') == [1, 1, 1, 1]
+
+    modifier.doIt()
+
+    assert layerstates.getStates(nodes, 'visibility') == [0, 0, 0, 0]
+    assert layerstates.getStates(nodes, 'displayType') == [1, 1, 1, 1]
+
+
+def test_setAllStates(layerstates, nodes):
+
+    modifier, numChanges = layerstates.setAllStates(nodes, {'visibility': False, 'hideOnPlayback': [False, False, False, False]})
+
+    assert numChanges == 5
+    assert modifier.numExecutions == 1
+    assert layerstates.getStates(nodes, 'visibility') == [0, 0, 0, 0]
+    assert layerstates.getStates(nodes, 'hideOnPlayback') == [0, 0, 0, None]
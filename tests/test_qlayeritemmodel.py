@@ -0,0 +1,178 @@
+"""
+Tests the layer item model against the in-memory layer backend.
+These tests are skipped whenever a Qt binding is not available!
+"""
+import os
+import sys
+import importlib
+import pytest
+
+pytest.importorskip('Qt')
+
+from Qt import QtCore, QtWidgets
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def importPackageModule(name):
+    """
+    Imports the specified module from this package by its directory name.
+
+    :type name: str
+    :rtype: module
+    """
+
+    rootDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parentDirectory, packageName = os.path.split(rootDirectory)
+
+    if parentDirectory not in sys.path:
+
+        sys.path.insert(0, parentDirectory)
+
+    return importlib.import_module('%s.%s' % (packageName, name))
+
+
+layerbackend = importPackageModule('libs.layerbackend')
+stublayerbackend = importPackageModule('libs.stublayerbackend')
+qlayeritemmodel = importPackageModule('ui.models.qlayeritemmodel')
+
+
+@pytest.fixture(scope='module')
+def application():
+    """
+    Returns the running application, creating an offscreen one if required.
+
+    :rtype: QtWidgets.QApplication
+    """
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def scene():
+    """
+    Returns a scene with a single layer manager that has two display layers of four members.
+
+    :rtype: stublayerbackend.StubLayerBackend
+    """
+
+    return stublayerbackend.createScene(numLayerManagers=1, numDisplayLayers=2, numLayerNodes=4)
+
+
+@pytest.fixture
+def model(application, scene):
+    """
+    Returns a layer item model populated from the supplied scene.
+
+    :rtype: qlayeritemmodel.QLayerItemModel
+    """
+
+    model = qlayeritemmodel.QLayerItemModel(backend=scene)
+    model.setLayerManagers(scene.layerManagers())
+
+    return model
+
+
+def layerIndex(model, row):
+    """
+    Returns the index of the display layer at the specified row under the first layer manager.
+
+    :type model: qlayeritemmodel.QLayerItemModel
+    :type row: int
+    :rtype: QtCore.QModelIndex
+    """
+
+    return model.index(row, 0, model.index(0, 0))
+
+
+def test_rowCount(model, scene):
+
+    layerManager = scene.layerManagers()[0]
+    layerManagerIndex = model.index(0, 0)
+
+    assert model.rowCount() == 1
+    assert layerManagerIndex.internalId() == layerManager
+    assert model.rowCount(layerManagerIndex) == 3
+    assert model.rowCount(layerIndex(model, 0)) == 0
+    assert model.rowCount(layerIndex(model, 1)) == 4
+
+    displayLayer = scene.displayLayers(layerManager)[1]
+    node = scene.layerNodes(displayLayer)[0]
+
+    assert layerIndex(model, 1).data() == scene.nodeName(displayLayer)
+    assert model.index(0, 0, layerIndex(model, 1)).data() == scene.nodeName(node)
+    assert model.indexFromHashCode(node) == model.index(0, 0, layerIndex(model, 1))
+
+
+def test_setDataCheckState(model, scene):
+
+    index = model.index(0, 0, layerIndex(model, 1))
+    changes = []
+    model.dataChanged.connect(lambda topLeft, bottomRight, roles: changes.append((topLeft.row(), bottomRight.row())))
+
+    assert index.data(QtCore.Qt.CheckStateRole) == QtCore.Qt.Checked
+    assert model.setData(index, QtCore.Qt.Unchecked, QtCore.Qt.CheckStateRole)
+    assert scene.getState(index.internalId(), layerbackend.VISIBILITY) == 0
+    assert index.data(QtCore.Qt.CheckStateRole) == QtCore.Qt.Unchecked
+    assert changes == [(0, 0)]
+
+
+def test_setCheckStates(model, scene):
+
+    parent = layerIndex(model, 1)
+    indices = [model.index(row, 0, parent) for row in (0, 2, 3)]
+    changes = []
+    model.dataChanged.connect(lambda topLeft, bottomRight, roles: changes.append((topLeft.row(), bottomRight.row())))
+
+    assert model.setCheckStates(indices, QtCore.Qt.Unchecked)
+    assert [scene.getState(index.internalId(), layerbackend.VISIBILITY) for index in indices] == [0, 0, 0]
+    assert scene.getState(model.index(1, 0, parent).internalId(), layerbackend.VISIBILITY) == 1
+    assert changes == [(0, 3)]
+
+    assert not model.setCheckStates(indices, QtCore.Qt.Unchecked)
+
+
+def test_stagedEdits(model, scene):
+
+    index = model.index(0, 0, layerIndex(model, 1))
+    hashCode = index.internalId()
+
+    model.setStagedEdits(True)
+
+    assert model.setData(index, QtCore.Qt.Unchecked, QtCore.Qt.CheckStateRole)
+    assert scene.getState(hashCode, layerbackend.VISIBILITY) == 1
+    assert index.data(QtCore.Qt.CheckStateRole) == QtCore.Qt.Unchecked
+    assert index.data(QtCore.Qt.BackgroundRole) is not None
+
+    assert model.commitPendingStates()
+    assert scene.getState(hashCode, layerbackend.VISIBILITY) == 0
+    assert index.data(QtCore.Qt.BackgroundRole) is None
+
+
+def test_reconcileDisplayLayer(model, scene):
+
+    sourceIndex, targetIndex = layerIndex(model, 1), layerIndex(model, 2)
+    sourceLayer, targetLayer = sourceIndex.internalId(), targetIndex.internalId()
+    nodes = scene.layerNodes(sourceLayer)
+
+    assert model.rowCount(targetIndex) == 4
+
+    persistentIndex = QtCore.QPersistentModelIndex(model.index(3, 0, sourceIndex))
+    removed, inserted = [], []
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((parent.internalId(), first, last)))
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((parent.internalId(), first, last)))
+
+    scene.moveNodes(nodes[1:3], targetLayer)
+
+    assert model.reconcileDisplayLayer(sourceLayer)
+    assert model.reconcileDisplayLayer(targetLayer)
+    assert not model.reconcileDisplayLayer(targetLayer)
+
+    assert removed == [(sourceLayer, 1, 2)]
+    assert inserted == [(targetLayer, 4, 5)]
+    assert persistentIndex.row() == 1
+    assert persistentIndex.internalId() == nodes[3]
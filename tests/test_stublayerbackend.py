@@ -0,0 +1,144 @@
+"""
+Tests the in-memory layer backend that drives the models and benchmarks without Maya.
+"""
+import os
+import sys
+import importlib
+import pytest
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def importPackageModule(name):
+    """
+    Imports the specified module from this package by its directory name.
+
+    :type name: str
+    :rtype: module
+    """
+
+    rootDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parentDirectory, packageName = os.path.split(rootDirectory)
+
+    if parentDirectory not in sys.path:
+
+        sys.path.insert(0, parentDirectory)
+
+    return importlib.import_module('%s.%s' % (packageName, name))
+
+
+layerbackend = importPackageModule('libs.layerbackend')
+stublayerbackend = importPackageModule('libs.stublayerbackend')
+NodeType = layerbackend.NodeType
+
+
+@pytest.fixture
+def scene():
+    """
+    Returns a scene with a local and a referenced layer manager, each with two display layers of three members.
+    The members of each layer manager are nested under two namespaces!
+
+    :rtype: stublayerbackend.StubLayerBackend
+    """
+
+    return stublayerbackend.createScene(numLayerManagers=2, numDisplayLayers=2, numLayerNodes=3, namespaceDepth=2)
+
+
+def test_createScene(scene):
+
+    layerManagers = scene.layerManagers()
+
+    assert len(layerManagers) == 2
+    assert scene.numNodes() == 2 * (1 + 3 + 6)
+
+    for layerManager in layerManagers:
+
+        displayLayers = scene.displayLayers(layerManager)
+
+        assert scene.nodeType(layerManager) == NodeType.LAYER_MANAGER
+        assert scene.numDisplayLayers(layerManager) == 3
+        assert scene.nodeName(displayLayers[0], includeNamespace=False) == 'defaultLayer'
+        assert scene.numLayerNodes(displayLayers[0]) == 0
+
+        for displayLayer in displayLayers[1:]:
+
+            assert scene.nodeType(displayLayer) == NodeType.DISPLAY_LAYER
+            assert scene.parent(displayLayer) == layerManager
+            assert scene.numLayerNodes(displayLayer) == 3
+
+            for node in scene.layerNodes(displayLayer):
+
+                assert scene.nodeType(node) == NodeType.NODE
+                assert scene.layerManager(node) == layerManager
+
+    assert not scene.isReferenced(layerManagers[0])
+    assert scene.isReferenced(layerManagers[1])
+
+
+def test_moveNodes(scene):
+
+    layerManager = scene.layerManagers()[0]
+    defaultLayer, sourceLayer, targetLayer = scene.displayLayers(layerManager)
+    nodes = scene.layerNodes(sourceLayer)
+
+    assert scene.moveNodes(nodes[:2], targetLayer) == 2
+    assert scene.layerNodes(sourceLayer) == nodes[2:]
+    assert scene.layerNodes(targetLayer)[-2:] == nodes[:2]
+    assert all(scene.parent(node) == targetLayer for node in nodes[:2])
+
+
+def test_moveNodesSkipsLayersAndCurrentMembers(scene):
+
+    layerManager = scene.layerManagers()[0]
+    defaultLayer, sourceLayer, targetLayer = scene.displayLayers(layerManager)
+    members = scene.layerNodes(targetLayer)
+
+    assert scene.moveNodes(members, targetLayer) == 0
+    assert scene.moveNodes([sourceLayer, layerManager], targetLayer) == 0
+    assert scene.layerNodes(targetLayer) == members
+
+
+def test_setStatesGetState(scene):
+
+    layerManager = scene.layerManagers()[0]
+    displayLayer = scene.displayLayers(layerManager)[1]
+    node = scene.layerNodes(displayLayer)[0]
+
+    assert scene.getState(displayLayer, layerbackend.VISIBILITY) == 1
+    assert scene.getState(displayLayer, layerbackend.TEMPLATE) is None
+    assert scene.getState(node, layerbackend.DISPLAY_TYPE) is None
+    assert scene.getState(layerManager, layerbackend.VISIBILITY) is None
+
+    states = {
+        (displayLayer, layerbackend.VISIBILITY): 0,
+        (displayLayer, layerbackend.DISPLAY_TYPE): layerbackend.NORMAL,
+        (displayLayer, layerbackend.TEMPLATE): 1,
+        (node, layerbackend.TEMPLATE): 1
+    }
+
+    changed = scene.setStates(states)
+
+    assert sorted(changed) == sorted([(displayLayer, layerbackend.VISIBILITY), (node, layerbackend.TEMPLATE)])
+    assert scene.getState(displayLayer, layerbackend.VISIBILITY) == 0
+    assert scene.getState(node, layerbackend.TEMPLATE) == 1
+    assert scene.setStates(states) == []
+
+
+def test_nodeName(scene):
+
+    localManager, referencedManager = scene.layerManagers()
+    localNode = scene.layerNodes(scene.displayLayers(localManager)[1])[0]
+    referencedNode = scene.layerNodes(scene.displayLayers(referencedManager)[1])[0]
+
+    assert scene.nodeName(localNode) == 'ns0:ns1:node%s' % localNode
+    assert scene.nodeName(localNode, includeNamespace=False) == 'node%s' % localNode
+    assert scene.nodeName(referencedNode) == 'ref1:ns0:ns1:node%s' % referencedNode
+
+    assert scene.renameNode(localNode, 'pCube1')
+    assert scene.nodeName(localNode) == 'ns0:ns1:pCube1'
+
+    assert not scene.renameNode(referencedNode, 'pCube1')
+    assert scene.nodeName(referencedNode, includeNamespace=False) == 'node%s' % referencedNode
@@ -1,6 +1,6 @@
-from maya.api import OpenMaya as om
 from Qt import QtCore, QtWidgets, QtGui
 from . import qlayeritemmodel
+from ...libs.layerbackend import NodeType
 
 import logging
 logging.basicConfig()
@@ -14,6 +14,8 @@ class QLayerItemFilterModel(QtCore.QSortFilterProxyModel):
     """
 
     # region Dunderscores
+    __state_roles__ = (QtCore.Qt.CheckStateRole, QtCore.Qt.BackgroundRole)  # Roles that never affect sorting or filtering!
+
     def __init__(self, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -31,6 +33,8 @@ class QLayerItemFilterModel(QtCore.QSortFilterProxyModel):
         #
         self._hideDefaultLayer = kwargs.get('hideDefaultLayer', True)
         self._hideNodes = kwargs.get('hideNodes', False)
+        self._skipStateChanges = kwargs.get('skipStateChanges', True)
+        self._stateChange = False
     # endregion
 
     # region Mutators
@@ -53,9 +57,75 @@ class QLayerItemFilterModel(QtCore.QSortFilterProxyModel):
 
         self._hideNodes = hideNodes
         self.invalidateFilter()
+
+    def skipStateChanges(self):
+        """
+        Returns the `skipStateChanges` state.
+
+        :rtype: bool
+        """
+
+        return self._skipStateChanges
+
+    def setSkipStateChanges(self, skipStateChanges):
+        """
+        Updates the `skipStateChanges` state.
+        If enabled, then changes to check-state or background roles do not re-sort or re-filter rows!
+
+        :type skipStateChanges: bool
+        :rtype: None
+        """
+
+        self._skipStateChanges = skipStateChanges
     # endregion
 
     # region Methods
+    def setSourceModel(self, sourceModel):
+        """
+        Updates the source model that is to be processed by this proxy model.
+        The `dataChanged` slots are connected around the parent method so they run before and after the proxy's own handler!
+
+        :type sourceModel: QtCore.QAbstractItemModel
+        :rtype: None
+        """
+
+        # Disconnect previous source model
+        #
+        previousModel = self.sourceModel()
+
+        if previousModel is not None:
+
+            previousModel.dataChanged.disconnect(self.on_sourceModel_dataChanged)
+            previousModel.dataChanged.disconnect(self.on_sourceModel_dataChangedProcessed)
+
+        # Call parent method
+        #
+        if sourceModel is not None:
+
+            sourceModel.dataChanged.connect(self.on_sourceModel_dataChanged)
+
+        super(QLayerItemFilterModel, self).setSourceModel(sourceModel)
+
+        if sourceModel is not None:
+
+            sourceModel.dataChanged.connect(self.on_sourceModel_dataChangedProcessed)
+
+    def isStateChange(self, roles):
+        """
+        Evaluates if the supplied data roles only consist of roles that never affect sorting or filtering.
+        An empty list implies that all roles have changed!
+
+        :type roles: Union[List[int], None]
+        :rtype: bool
+        """
+
+        if roles is None or len(roles) == 0:
+
+            return False
+
+        stateRoles = [int(stateRole) for stateRole in self.__state_roles__]
+        return all(int(role) in stateRoles for role in roles)
+
     def filterAcceptsRow(self, row, parent):
         """
         Returns true if the item in the row indicated by the given row and parent should be included in the model.
@@ -65,18 +135,25 @@ class QLayerItemFilterModel(QtCore.QSortFilterProxyModel):
         :rtype: bool
         """
 
-        # Check if default layer should be hidden
+        # Check if state change is being processed
+        # If so, then the row keeps its current visibility!
         #
         model = self.sourceModel()  # type: qlayeritemmodel.QLayerItemModel
         index = model.index(row, 0, parent=parent)
 
-        node = model.nodeFromIndex(index)
+        if self._stateChange:
+
+            return self.mapFromSource(index).isValid()
+
+        # Check if default layer should be hidden
+        #
+        nodeType = model.nodeTypeFromIndex(index)
 
-        if node.hasFn(om.MFn.kDisplayLayerManager):
+        if nodeType == NodeType.LAYER_MANAGER:
 
             return True  # Accept layer managers to prevent DAG nodes from being obscured!
 
-        elif node.hasFn(om.MFn.kDisplayLayer):
+        elif nodeType == NodeType.DISPLAY_LAYER:
 
             # Check if default layer should be hidden
             #
@@ -102,4 +179,56 @@ class QLayerItemFilterModel(QtCore.QSortFilterProxyModel):
             else:
 
                 return super(QLayerItemFilterModel, self).filterAcceptsRow(row, parent)
+
+    def lessThan(self, left, right):
+        """
+        Returns true if the value of the item referred to by the given index left is less than the value of the item referred to by the given index right, otherwise returns false.
+
+        :type left: QtCore.QModelIndex
+        :type right: QtCore.QModelIndex
+        :rtype: bool
+        """
+
+        # Check if state change is being processed
+        # If so, then the current order is preserved to avoid evaluating any sort data!
+        #
+        if self._stateChange:
+
+            proxyLeft, proxyRight = self.mapFromSource(left), self.mapFromSource(right)
+
+            if proxyLeft.isValid() and proxyRight.isValid():
+
+                return proxyLeft.row() < proxyRight.row()
+
+        return super(QLayerItemFilterModel, self).lessThan(left, right)
+    # endregion
+
+    # region Slots
+    @QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+    def on_sourceModel_dataChanged(self, topLeft, bottomRight, roles=None):
+        """
+        Slot method for the source model's `dataChanged` signal.
+        This slot runs before the proxy's own handler and flags changes that cannot affect sorting or filtering!
+
+        :type topLeft: QtCore.QModelIndex
+        :type bottomRight: QtCore.QModelIndex
+        :type roles: List[int]
+        :rtype: None
+        """
+
+        self._stateChange = self._skipStateChanges and self.isStateChange(roles)
+
+    @QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+    def on_sourceModel_dataChangedProcessed(self, topLeft, bottomRight, roles=None):
+        """
+        Slot method for the source model's `dataChanged` signal.
+        This slot runs after the proxy's own handler and resets the flag raised by `on_sourceModel_dataChanged`!
+
+        :type topLeft: QtCore.QModelIndex
+        :type bottomRight: QtCore.QModelIndex
+        :type roles: List[int]
+        :rtype: None
+        """
+
+        self._stateChange = False
     # endregion
@@ -1,9 +1,9 @@
-from maya import cmds as mc
-from maya.api import OpenMaya as om
 from Qt import QtCore, QtWidgets, QtGui
 from enum import IntEnum
+from bisect import bisect_left
 from collections import defaultdict, deque
-from dcc.maya.libs import dagutils, layerutils, plugutils
+from ...libs import layerbackend
+from ...libs.layerbackend import NodeType
 
 import logging
 logging.basicConfig()
@@ -24,20 +24,27 @@ class ViewDetail(IntEnum):
 class QLayerItemModel(QtCore.QAbstractItemModel):
     """
     Overload of `QAbstractItemModel` that interfaces with display layers.
+    All scene access is routed through a layer backend so this model does not depend on Maya!
     """
 
     # region Dunderscores
-    __icons__ = {
-        'displayLayerManager': QtGui.QIcon(':/out_reference.png'),
-        'displayLayer': QtGui.QIcon(':/out_displayLayer.png'),
-        'transform': QtGui.QIcon(':/out_transform.png')
+    __icon_paths__ = {
+        'displayLayerManager': ':/out_reference.png',
+        'displayLayer': ':/out_displayLayer.png',
+        'transform': ':/out_transform.png'
     }
 
+    __icons__ = {}  # Icons are constructed on demand to keep importing this module cheap!
+
+    __pending_color__ = (255, 170, 0, 48)
+    __pending_brush__ = None  # The brush is also constructed on demand!
+
     def __init__(self, **kwargs):
         """
         Private method called after a new instance has been created.
 
         :type parent: QtCore.QObject
+        :type backend: layerbackend.AbstractLayerBackend
         :rtype: None
         """
 
@@ -48,6 +55,7 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         # Declare private variables
         #
+        self._backend = kwargs.get('backend', None)  # type: layerbackend.AbstractLayerBackend
         self._viewDetails = [ViewDetail.NAME, ViewDetail.FROZEN, ViewDetail.PLAYBACK]
         self._headerLabels = [detail.name.title().replace('_', ' ') for detail in self._viewDetails]
         self._uniformRowHeight = kwargs.get('uniformRowHeight', 24.0)
@@ -55,10 +63,25 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
         self._layerManagers = deque()  # type: deque[int]
         self._displayLayers = defaultdict(deque)  # type: defaultdict[int, deque[int]]
         self._layerNodes = defaultdict(deque)  # type: defaultdict[int, deque[int]]
-        self._internalIds = {}
+        self._validateCaches = True
+        self._stagedEdits = kwargs.get('stagedEdits', False)
+        self._pendingStates = {}  # type: dict[tuple[int, str], int]
+
+        if not isinstance(self._backend, layerbackend.AbstractLayerBackend):
+
+            raise TypeError('QLayerItemModel() expects a layer backend (%s given)!' % type(self._backend).__name__)
     # endregion
 
     # region Mutators
+    def backend(self):
+        """
+        Returns the layer backend this model queries.
+
+        :rtype: layerbackend.AbstractLayerBackend
+        """
+
+        return self._backend
+
     def layerManagers(self):
         """
         Returns the root layer managers.
@@ -72,7 +95,7 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
         """
         Updates the root layer managers.
 
-        :type layerManagers: List[Union[str, om.MObject, om.MObjectHandle]]
+        :type layerManagers: List[int]
         :rtype: None
         """
 
@@ -83,19 +106,49 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
         # Reset internal trackers
         #
         self._layerManagers.clear()
-        self._internalIds.clear()
+        self._layerManagers.extend(layerManagers)
 
-        for layerManager in layerManagers:
+        # Notify end of model reset
+        #
+        self.endResetModel()
 
-            layerManagerHandle = dagutils.getMObjectHandle(layerManager)
-            layerManagerHashCode = layerManagerHandle.hashCode()
+    def updateLayerManagers(self, layerManagers):
+        """
+        Updates the root layer managers using targeted row signals rather than a model reset.
+        Missing layer managers are removed along with their subtrees while new layer managers are appended!
+        Returns the hash codes of the removed and added layer managers.
 
-            self._layerManagers.append(layerManagerHashCode)
-            self._internalIds[layerManagerHashCode] = layerManagerHandle
+        :type layerManagers: List[int]
+        :rtype: Tuple[List[int], List[int]]
+        """
 
-        # Notify end of model reset
+        # Remove missing layer managers
         #
-        self.endResetModel()
+        liveManagers = list(dict.fromkeys(layerManagers))
+        removed = [layerManagerHashCode for layerManagerHashCode in self._layerManagers if not self._backend.isAlive(layerManagerHashCode) or layerManagerHashCode not in liveManagers]
+
+        self.removeCachedRows(QtCore.QModelIndex(), removed, self._layerManagers)
+
+        for layerManagerHashCode in removed:
+
+            for displayLayerHashCode in self._displayLayers.pop(layerManagerHashCode, ()):
+
+                self._layerNodes.pop(displayLayerHashCode, None)
+
+        # Append new layer managers
+        #
+        existing = set(self._layerManagers)
+        added = [layerManagerHashCode for layerManagerHashCode in liveManagers if layerManagerHashCode not in existing]
+        numAdded = len(added)
+
+        if numAdded > 0:
+
+            row = len(self._layerManagers)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row + numAdded - 1)
+            self._layerManagers.extend(added)
+            self.endInsertRows()
+
+        return removed, added
 
     def viewDetails(self):
         """
@@ -156,155 +209,588 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
         """
 
         self._showNamespaces = showNamespaces
+
+    def stagedEdits(self):
+        """
+        Returns the `stagedEdits` flag.
+        When enabled, check-state edits are only cached until they are committed!
+
+        :rtype: bool
+        """
+
+        return self._stagedEdits
+
+    def setStagedEdits(self, stagedEdits):
+        """
+        Updates the `stagedEdits` flag.
+        Disabling staged edits will commit any pending check-states!
+
+        :type stagedEdits: bool
+        :rtype: None
+        """
+
+        if not stagedEdits:
+
+            self.commitPendingStates()
+
+        self._stagedEdits = stagedEdits
+
+    def hasPendingStates(self):
+        """
+        Evaluates if there are any staged check-state edits waiting to be committed.
+
+        :rtype: bool
+        """
+
+        return len(self._pendingStates) > 0
     # endregion
 
     # region Methods
-    def getDisplayLayers(self, layerManager):
+    def getDisplayLayers(self, layerManagerHashCode):
         """
         Returns the display layers associated with the supplied layer manager.
 
-        :type layerManager: om.MObject
+        :type layerManagerHashCode: int
         :rtype: deque[int]
         """
 
         # Get cached layers
         #
-        layerManager = dagutils.getMObject(layerManager)
-        layerManagerHandle = dagutils.getMObjectHandle(layerManager)
-        layerManagerHashCode = layerManagerHandle.hashCode()
-
         displayLayers = self._displayLayers[layerManagerHashCode]
         numDisplayLayers = len(displayLayers)
 
         # Check if cache requires updating
+        # Validation is suspended while rows are being removed!
         #
-        displayLayerIdPlug = plugutils.findPlug(layerManager, 'displayLayerId')
-        numConnectedElements = displayLayerIdPlug.numConnectedElements()
+        if not self._validateCaches:
 
-        if numDisplayLayers != numConnectedElements:
+            return displayLayers
+
+        if numDisplayLayers != self._backend.numDisplayLayers(layerManagerHashCode):
 
             displayLayers.clear()
+            displayLayers.extend(self.queryDisplayLayers(layerManagerHashCode, force=False))
 
-            for i in range(numConnectedElements):
+        return displayLayers
 
-                displayLayerIdElement = displayLayerIdPlug.connectionByPhysicalIndex(i)
-                displayLayer = displayLayerIdElement.destinations()[0].node()
-                displayLayerHandle = dagutils.getMObjectHandle(displayLayer)
-                displayLayerHashCode = displayLayerHandle.hashCode()
+    def queryDisplayLayers(self, layerManagerHashCode, force=True):
+        """
+        Returns the hash codes of the display layers under the supplied layer manager from the backend.
+        Unlike `getDisplayLayers`, the model's cache is left untouched and, if forced, the scene is always queried!
 
-                displayLayers.append(displayLayerHashCode)
-                self._internalIds[displayLayerHashCode] = displayLayerHandle
+        :type layerManagerHashCode: int
+        :type force: bool
+        :rtype: List[int]
+        """
 
-        return displayLayers
+        return list(self._backend.displayLayers(layerManagerHashCode, force=force))
 
-    def getLayerNodes(self, displayLayer):
+    def getLayerNodes(self, displayLayerHashCode):
         """
         Returns the nodes associated with the supplied display layer.
 
-        :type displayLayer: om.MObject
-        :rtype: List[om.MObjectHandle]
+        :type displayLayerHashCode: int
+        :rtype: deque[int]
         """
 
         # Get cached layer nodes
         #
-        displayLayer = dagutils.getMObject(displayLayer)
-        displayLayerHandle = dagutils.getMObjectHandle(displayLayer)
-        displayLayerHashCode = displayLayerHandle.hashCode()
-
         layerNodes = self._layerNodes[displayLayerHashCode]
         numLayerNodes = len(layerNodes)
 
         # Check if cache requires updating
+        # Validation is suspended while rows are being removed!
         #
-        drawInfoPlug = plugutils.findPlug(displayLayer, 'drawInfo')
-        destinations = drawInfoPlug.destinations()
+        if not self._validateCaches:
 
-        numDestinations = len(destinations)
+            return layerNodes
 
-        if numLayerNodes != numDestinations:
+        if numLayerNodes != self._backend.numLayerNodes(displayLayerHashCode):
 
             layerNodes.clear()
+            layerNodes.extend(self._backend.layerNodes(displayLayerHashCode))
 
-            for destination in destinations:
+        return layerNodes
 
-                layerNode = destination.node()
-                layerNodeHandle = dagutils.getMObjectHandle(layerNode)
-                layerNodeHashCode = layerNodeHandle.hashCode()
+    def iterLayerManagerHashCodes(self):
+        """
+        Returns a generator that yields the hash codes of the live root layer managers.
 
-                layerNodes.append(layerNodeHashCode)
-                self._internalIds[layerNodeHashCode] = layerNodeHandle
+        :rtype: Iterator[int]
+        """
 
-        return layerNodes
+        for layerManagerHashCode in tuple(self._layerManagers):
+
+            if self._backend.isAlive(layerManagerHashCode):
 
-    def nodeFromIndex(self, index):
+                yield layerManagerHashCode
+
+            else:
+
+                continue
+
+    def iterDisplayLayerHashCodes(self, includeDefault=False):
         """
-        Returns the node associated with the supplied index.
+        Returns a generator that yields the hash codes of the display layers from every layer manager.
 
-        :type index: QtCore.QModelIndex
-        :rtype: om.MObject
+        :type includeDefault: bool
+        :rtype: Iterator[int]
         """
 
-        internalId = index.internalId()
-        handle = self._internalIds.get(internalId, None)
+        for layerManagerHashCode in self.iterLayerManagerHashCodes():
 
-        if isinstance(handle, om.MObjectHandle):
+            for displayLayerHashCode in tuple(self.getDisplayLayers(layerManagerHashCode)):
 
-            return handle.object() if handle.isAlive() else om.MObject.kNullObj
+                if includeDefault or not self.isDefaultLayer(displayLayerHashCode):
 
-        else:
+                    yield displayLayerHashCode
+
+                else:
 
-            return om.MObject.kNullObj
+                    continue
 
-    def indexFromNode(self, node):
+    def iterLayerNodeHashCodes(self, includeDefault=False):
         """
-        Returns the index of the supplied node.
+        Returns a generator that yields the hash codes of the members from every display layer.
 
-        :type node: om.MObject
-        :rtype: QtCore.QModelIndex
+        :type includeDefault: bool
+        :rtype: Iterator[int]
         """
 
-        # Evaluate supplied node
+        for displayLayerHashCode in self.iterDisplayLayerHashCodes(includeDefault=includeDefault):
+
+            yield from tuple(self.getLayerNodes(displayLayerHashCode))
+
+    def reconcileLayerManager(self, layerManagerHashCode):
+        """
+        Reconciles the cached display layers of the supplied layer manager against the scene.
+        If the rows are out-of-date then only the changed rows under this layer manager are removed, moved or inserted!
+
+        :type layerManagerHashCode: int
+        :rtype: bool
+        """
+
+        # Check if layer manager is still alive
         #
-        if node.isNull():
+        if not self._backend.isAlive(layerManagerHashCode):
 
-            return QtCore.QModelIndex()
+            return False
+
+        # Check if cached layers are up-to-date
+        #
+        displayLayers = self._displayLayers[layerManagerHashCode]
+        liveLayers = self.queryDisplayLayers(layerManagerHashCode)
+
+        if list(displayLayers) == liveLayers:
+
+            return False
+
+        # Update changed layer manager rows
+        # The nodes of removed layers are released along with their rows!
+        #
+        parent = self.indexFromHashCode(layerManagerHashCode)
+        removed = self.reconcileCachedRows(parent, displayLayers, liveLayers)
+
+        for displayLayerHashCode in removed:
+
+            self._layerNodes.pop(displayLayerHashCode, None)
+
+        return True
+
+    def reconcileDisplayLayer(self, displayLayerHashCode):
+        """
+        Reconciles the cached nodes of the supplied display layer against the backend.
+        If the rows are out-of-date then only the changed rows under this display layer are removed, moved or inserted.
+        Display layers that have not been fetched yet are fetched without any row signals, since no view has seen their rows!
+
+        :type displayLayerHashCode: int
+        :rtype: bool
+        """
+
+        # Check if display layer is still alive
+        #
+        if not self._backend.isAlive(displayLayerHashCode):
+
+            return False
+
+        # Check if cached nodes are up-to-date
+        #
+        layerNodes = self._layerNodes.get(displayLayerHashCode, None)
+
+        if layerNodes is None:
+
+            self.getLayerNodes(displayLayerHashCode)
+            return False
+
+        liveNodes = list(self._backend.layerNodes(displayLayerHashCode))
+
+        if list(layerNodes) == liveNodes:
+
+            return False
+
+        # Update changed display layer rows
+        #
+        parent = self.indexFromHashCode(displayLayerHashCode)
+        self.reconcileCachedRows(parent, layerNodes, liveNodes)
+
+        return True
+
+    def isDefaultLayer(self, displayLayerHashCode):
+        """
+        Evaluates if the supplied display layer is a default layer.
+
+        :type displayLayerHashCode: int
+        :rtype: bool
+        """
+
+        return self._backend.isDefaultLayer(displayLayerHashCode)
+
+    def rootLayerManager(self):
+        """
+        Returns the hash code of the layer manager that belongs to the open scene rather than a reference.
+        If there is no such layer manager then none is returned!
+
+        :rtype: Union[int, None]
+        """
+
+        for layerManagerHashCode in self.iterLayerManagerHashCodes():
+
+            if not self._backend.isReferenced(layerManagerHashCode):
+
+                return layerManagerHashCode
+
+            else:
+
+                continue
+
+        return None
+
+    @staticmethod
+    def iterContiguousRows(rows, reverse=False):
+        """
+        Returns a generator that yields the start and end of each contiguous run from the supplied rows.
+
+        :type rows: Iterable[int]
+        :type reverse: bool
+        :rtype: Iterator[Tuple[int, int]]
+        """
+
+        sortedRows = sorted(set(rows))
+        numRows = len(sortedRows)
+
+        if numRows == 0:
+
+            return
+
+        runs = []
+        startRow = endRow = sortedRows[0]
+
+        for row in sortedRows[1:]:
+
+            if row == (endRow + 1):
+
+                endRow = row
+
+            else:
+
+                runs.append((startRow, endRow))
+                startRow = endRow = row
+
+        runs.append((startRow, endRow))
+
+        yield from (reversed(runs) if reverse else runs)
+
+    def createItemSelection(self, indices, proxyModel=None):
+        """
+        Returns an item selection from the supplied source indices.
+        If a proxy model is supplied then the indices are mapped, and any filtered indices skipped, before the ranges are created.
+        Rows are grouped by parent and merged into contiguous ranges to minimize the number of selection ranges!
+
+        :type indices: Iterable[QtCore.QModelIndex]
+        :type proxyModel: Union[QtCore.QAbstractProxyModel, None]
+        :rtype: QtCore.QItemSelection
+        """
+
+        # Group visible rows by parent
+        #
+        model = self if proxyModel is None else proxyModel
+
+        parents = {}
+        rows = defaultdict(set)
+
+        for index in indices:
+
+            # Check if index is visible
+            #
+            if proxyModel is not None:
+
+                index = proxyModel.mapFromSource(index)
+
+            if not index.isValid():
+
+                continue
+
+            parent = index.parent()
+            key = (parent.isValid(), parent.internalId())
+
+            parents[key] = parent
+            rows[key].add(index.row())
+
+        # Merge sorted rows into contiguous ranges
+        #
+        items = QtCore.QItemSelection()
+        lastColumn = self.columnCount() - 1
+
+        for (key, parent) in parents.items():
+
+            for (startRow, endRow) in self.iterContiguousRows(rows[key]):
+
+                topLeft = model.index(startRow, 0, parent)
+                bottomRight = model.index(endRow, lastColumn, parent)
+
+                items.append(QtCore.QItemSelectionRange(topLeft, bottomRight))
+
+        return items
+
+    def removeCachedRows(self, parent, hashCodes, cache):
+        """
+        Removes the supplied hash codes from the specified cache using batched row removals.
+        Rows are removed in contiguous runs, from the bottom up, so the remaining rows never require a model reset!
+
+        :type parent: QtCore.QModelIndex
+        :type hashCodes: Iterable[int]
+        :type cache: deque[int]
+        :rtype: int
+        """
+
+        # Collect rows to remove
+        #
+        positions = {hashCode: row for (row, hashCode) in enumerate(cache)}
+        rows = [positions[hashCode] for hashCode in hashCodes if hashCode in positions]
+
+        # Remove contiguous runs
+        # The previous validation state is restored so this can be nested inside other row changes!
+        #
+        validateCaches = self._validateCaches
+
+        try:
+
+            self._validateCaches = False
+
+            for (startRow, endRow) in self.iterContiguousRows(rows, reverse=True):
+
+                self.beginRemoveRows(parent, startRow, endRow)
+
+                for row in range(endRow, startRow - 1, -1):
+
+                    del cache[row]
+
+                self.endRemoveRows()
+
+        finally:
+
+            self._validateCaches = validateCaches
+
+        return len(rows)
+
+    @staticmethod
+    def iterStableHashCodes(cache, hashCodes):
+        """
+        Returns a generator that yields the cached hash codes that are already in the supplied order.
+        These form the longest increasing run of cached rows, so moving every other hash code requires the fewest row moves!
+
+        :type cache: Sequence[int]
+        :type hashCodes: Sequence[int]
+        :rtype: Iterator[int]
+        """
+
+        # Collect cached rows in the supplied order
+        #
+        positions = {hashCode: row for (row, hashCode) in enumerate(cache)}
+        rows = [positions[hashCode] for hashCode in hashCodes if hashCode in positions]
+
+        # Find longest increasing subsequence
+        # See the following for details: https://en.wikipedia.org/wiki/Longest_increasing_subsequence
+        #
+        tails = []  # type: list[int]
+        tailRows = []  # type: list[int]
+        predecessors = [-1] * len(rows)
+
+        for (i, row) in enumerate(rows):
+
+            index = bisect_left(tailRows, row)
+
+            if index > 0:
+
+                predecessors[i] = tails[index - 1]
+
+            if index == len(tails):
+
+                tails.append(i)
+                tailRows.append(row)
+
+            else:
+
+                tails[index] = i
+                tailRows[index] = row
+
+        # Walk back through the predecessors
+        #
+        i = tails[-1] if len(tails) > 0 else -1
+
+        while i != -1:
+
+            yield cache[rows[i]]
+            i = predecessors[i]
+
+    def reconcileCachedRows(self, parent, cache, hashCodes):
+        """
+        Updates the specified cache to match the supplied hash codes using targeted row signals.
+        Missing rows are removed, out-of-order rows are moved and new rows are inserted, the remaining rows are never touched!
+        Returns the hash codes that were removed.
+
+        :type parent: QtCore.QModelIndex
+        :type cache: deque[int]
+        :type hashCodes: List[int]
+        :rtype: List[int]
+        """
+
+        validateCaches = self._validateCaches
+
+        try:
+
+            self._validateCaches = False
+
+            # Remove missing rows
+            #
+            liveHashCodes = set(hashCodes)
+            removed = [hashCode for hashCode in cache if hashCode not in liveHashCodes]
+
+            self.removeCachedRows(parent, removed, cache)
+
+            # Move out-of-order rows
+            # Each moved row is placed directly after its predecessor, which is either stable or has already been moved!
+            #
+            existing = set(cache)
+            orderedHashCodes = [hashCode for hashCode in hashCodes if hashCode in existing]
+            stableHashCodes = set(self.iterStableHashCodes(cache, orderedHashCodes))
+
+            for (i, hashCode) in enumerate(orderedHashCodes):
+
+                if hashCode in stableHashCodes:
+
+                    continue
+
+                row = cache.index(hashCode)
+                destinationRow = 0 if i == 0 else cache.index(orderedHashCodes[i - 1]) + 1
+
+                if destinationRow == row or destinationRow == (row + 1):
+
+                    continue
+
+                if not self.beginMoveRows(parent, row, row, parent, destinationRow):
+
+                    continue
+
+                del cache[row]
+                cache.insert(destinationRow - 1 if destinationRow > row else destinationRow, hashCode)
+
+                self.endMoveRows()
+
+            # Insert new rows in contiguous runs
+            #
+            row = 0
+            numHashCodes = len(hashCodes)
+
+            while row < numHashCodes:
+
+                if row < len(cache) and cache[row] == hashCodes[row]:
+
+                    row += 1
+                    continue
+
+                endRow = row
+
+                while (endRow + 1) < numHashCodes and hashCodes[endRow + 1] not in existing:
+
+                    endRow += 1
+
+                self.beginInsertRows(parent, row, endRow)
+
+                for (offset, hashCode) in enumerate(hashCodes[row:endRow + 1]):
+
+                    cache.insert(row + offset, hashCode)
+
+                self.endInsertRows()
+
+                row = endRow + 1
+
+        finally:
+
+            self._validateCaches = validateCaches
+
+        return removed
+
+    def nodeTypeFromIndex(self, index):
+        """
+        Returns the type of the node associated with the supplied index.
+
+        :type index: QtCore.QModelIndex
+        :rtype: NodeType
+        """
+
+        if not index.isValid():
+
+            return NodeType.NONE
+
+        return self._backend.nodeType(index.internalId())
+
+    def indexFromHashCode(self, hashCode, column=0):
+        """
+        Returns the index of the node associated with the supplied hash code.
+
+        :type hashCode: int
+        :type column: int
+        :rtype: QtCore.QModelIndex
+        """
 
         # Evaluate node type
         #
-        if node.hasFn(om.MFn.kDagNode):
+        nodeType = self._backend.nodeType(hashCode)
 
-            displayLayer = layerutils.getLayerFromNode(node)
+        if nodeType == NodeType.NODE or nodeType == NodeType.DISPLAY_LAYER:
 
-            if displayLayer is None:
+            # Check if node has a parent
+            #
+            parentHashCode = self._backend.parent(hashCode)
 
-                return QtCore.QModelIndex()
+            if parentHashCode is None:
 
-            layerNodes = self.getLayerNodes(displayLayer)
-            layerNodeHashCode = dagutils.getMObjectHandle(node).hashCode()
-            row = layerNodes.index(layerNodeHashCode)
+                return QtCore.QModelIndex()
 
-            return self.createIndex(row, 0, id=layerNodeHashCode)
+            siblings = self.getLayerNodes(parentHashCode) if nodeType == NodeType.NODE else self.getDisplayLayers(parentHashCode)
 
-        elif node.hasFn(om.MFn.kDisplayLayer):
+            try:
 
-            layerManager = layerutils.getManagerFromLayer(node)
+                row = siblings.index(hashCode)
 
-            if layerManager.isNull():
+            except ValueError:
 
                 return QtCore.QModelIndex()
 
-            displayLayers = self.getDisplayLayers(layerManager)
-            displayLayerHashCode = dagutils.getMObjectHandle(node).hashCode()
-            row = displayLayers.index(displayLayerHashCode)
+            return self.createIndex(row, column, id=hashCode)
+
+        elif nodeType == NodeType.LAYER_MANAGER:
 
-            return self.createIndex(row, 0, id=displayLayerHashCode)
+            try:
 
-        elif node.hasFn(om.MFn.kDisplayLayerManager):
+                row = self._layerManagers.index(hashCode)
 
-            layerManagerHashCode = dagutils.getMObjectHandle(node).hashCode()
-            row = self._layerManagers.index(layerManagerHashCode)
+            except ValueError:
+
+                return QtCore.QModelIndex()
 
-            return self.createIndex(row, 0, id=layerManagerHashCode)
+            return self.createIndex(row, column, id=hashCode)
 
         else:
 
@@ -340,21 +826,16 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         else:
 
-            # Evaluate associated node
+            # Evaluate parent type
             #
-            node = self.nodeFromIndex(parent)
+            parentHashCode = parent.internalId()
+            nodeType = self._backend.nodeType(parentHashCode)
 
-            if node.isNull():
-
-                return QtCore.QModelIndex()
-
-            # Evaluate node type
-            #
-            if node.hasFn(om.MFn.kDisplayLayerManager):
+            if nodeType == NodeType.LAYER_MANAGER:
 
                 # Check if row is in range
                 #
-                displayLayers = self.getDisplayLayers(node)
+                displayLayers = self.getDisplayLayers(parentHashCode)
                 maxRow = len(displayLayers)
 
                 if 0 <= row < maxRow:
@@ -365,11 +846,11 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
                     return QtCore.QModelIndex()
 
-            elif node.hasFn(om.MFn.kDisplayLayer):
+            elif nodeType == NodeType.DISPLAY_LAYER:
 
                 # Check if row is in range
                 #
-                layerNodes = self.getLayerNodes(node)
+                layerNodes = self.getLayerNodes(parentHashCode)
                 maxRow = len(layerNodes)
 
                 if 0 <= row < maxRow:
@@ -404,28 +885,21 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
         # Evaluate associated node
         #
         index = args[0]
-        node = self.nodeFromIndex(index)
 
-        if node.isNull():
+        if not index.isValid():
 
             return QtCore.QModelIndex()
 
-        # Evaluate node type
+        # Evaluate parent
         #
-        if node.hasFn(om.MFn.kDagNode):
-
-            layer = layerutils.getLayerFromNode(node)
-            return self.indexFromNode(layer)
+        parentHashCode = self._backend.parent(index.internalId())
 
-        elif node.hasFn(om.MFn.kDisplayLayer):
-
-            manager = layerutils.getManagerFromLayer(node)
-            return self.indexFromNode(manager)
-
-        else:
+        if parentHashCode is None:
 
             return QtCore.QModelIndex()
 
+        return self.indexFromHashCode(parentHashCode)
+
     def rowCount(self, parent=QtCore.QModelIndex()):
         """
         Returns the number of rows under the given parent.
@@ -442,26 +916,21 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
             return len(self._layerManagers)
 
-        # Evaluate associated node
+        # Evaluate parent type
         #
-        node = self.nodeFromIndex(parent)
+        parentHashCode = parent.internalId()
+        nodeType = self._backend.nodeType(parentHashCode)
 
-        if node.isNull():
+        if nodeType == NodeType.LAYER_MANAGER:
 
-            return 0
-
-        # Evaluate node type
-        #
-        if node.hasFn(om.MFn.kDisplayLayerManager):
-
-            displayLayers = self.getDisplayLayers(node)
+            displayLayers = self.getDisplayLayers(parentHashCode)
             numDisplayLayers = len(displayLayers)
 
             return numDisplayLayers
 
-        elif node.hasFn(om.MFn.kDisplayLayer):
+        elif nodeType == NodeType.DISPLAY_LAYER:
 
-            layerNodes = self.getLayerNodes(node)
+            layerNodes = self.getLayerNodes(parentHashCode)
             numLayerNodes = len(layerNodes)
 
             return numLayerNodes
@@ -490,15 +959,15 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
         :rtype: bool
         """
 
-        node = self.nodeFromIndex(parent)
+        nodeType = self.nodeTypeFromIndex(parent) if parent is not None else NodeType.NONE
 
-        if node.isNull():
+        if nodeType == NodeType.NONE:
 
             return True  # All top-level items have children!
 
         else:
 
-            return node.hasFn(om.MFn.kDisplayLayerManager) or node.hasFn(om.MFn.kDisplayLayer)
+            return nodeType == NodeType.LAYER_MANAGER or nodeType == NodeType.DISPLAY_LAYER
 
     def fetchMore(self, parent):
         """
@@ -530,17 +999,16 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         # Evaluate associated node
         #
-        node = self.nodeFromIndex(index)
+        nodeType = self.nodeTypeFromIndex(index)
 
-        if node.isNull():
+        if nodeType == NodeType.NONE:
 
             return QtCore.Qt.NoItemFlags
 
         # Evaluate if index is draggable
         #
-        isLayerManager = node.hasFn(om.MFn.kDisplayLayerManager)
-        isLayer = node.hasFn(om.MFn.kDisplayLayer)
-        isNode = node.hasFn(om.MFn.kDagNode)
+        isLayer = nodeType == NodeType.DISPLAY_LAYER
+        isNode = nodeType == NodeType.NODE
 
         flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
 
@@ -559,17 +1027,17 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
         if isNode:
 
             flags |= QtCore.Qt.ItemNeverHasChildren
-        
+
         # Evaluate if index is editable
         #
         column = index.column()
         isNameColumn = self._viewDetails[column] == ViewDetail.NAME
-        isReferenced = om.MFnDependencyNode(node).isFromReferencedFile
+        isReferenced = self._backend.isReferenced(index.internalId())
 
         if isNameColumn and not isReferenced:
 
             flags |= QtCore.Qt.ItemIsEditable
-        
+
         # Evaluate if index is checkable
         #
         isCheckable = (isNode and isNameColumn) or isLayer
@@ -580,28 +1048,28 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         return flags
 
-    def detail(self, node, detail=ViewDetail.NAME):
+    def detail(self, hashCode, detail=ViewDetail.NAME):
         """
         Returns the detail for the supplied node in the specified column.
 
-        :type node: om.MObject
+        :type hashCode: int
         :type detail: ViewDetail
         :rtype: Any
         """
 
         if detail == ViewDetail.NAME:
 
-            return dagutils.getNodeName(node, includeNamespace=self.showNamespaces())
+            return self._backend.nodeName(hashCode, includeNamespace=self.showNamespaces())
 
         else:
 
             return ''
 
-    def setDetail(self, node, value, detail=ViewDetail.NAME):
+    def setDetail(self, hashCode, value, detail=ViewDetail.NAME):
         """
         Updates the detail for the supplied node in the specified column.
 
-        :type node: om.MObject
+        :type hashCode: int
         :type value: Any
         :type detail: ViewDetail
         :rtype: Any
@@ -609,18 +1077,17 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         if detail == ViewDetail.NAME:
 
-            dagutils.renameNode(node, value)
-            return True
+            return self._backend.renameNode(hashCode, value)
 
         else:
 
             return False
 
-    def decoration(self, node, detail=ViewDetail.NAME):
+    def decoration(self, hashCode, detail=ViewDetail.NAME):
         """
         Returns the decoration for the supplied node in the specified column.
 
-        :type node: om.MObject
+        :type hashCode: int
         :type detail: ViewDetail
         :rtype: Union[QtGui.QIcon, None]
         """
@@ -631,9 +1098,7 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
             # Check if icon already exists
             #
-            fnDependNode = om.MFnDependencyNode(node)
-            typeName = str(fnDependNode.typeName)
-
+            typeName = self._backend.typeName(hashCode)
             icon = self.__icons__.get(typeName, None)
 
             if isinstance(icon, QtGui.QIcon):
@@ -642,7 +1107,20 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
             # Search for icon
             #
-            icon = dagutils.getNodeIcon(node, forOutliner=True)
+            iconPath = self.__icon_paths__.get(typeName, None)
+
+            if iconPath is not None:
+
+                icon = QtGui.QIcon(iconPath)
+
+            else:
+
+                icon = self._backend.nodeIcon(hashCode)
+
+            if not isinstance(icon, QtGui.QIcon):
+
+                icon = QtGui.QIcon()
+
             self.__icons__[typeName] = icon
 
             return icon
@@ -668,183 +1146,442 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         return QtCore.QSize(columnWidth, self._uniformRowHeight)
 
-    def checkState(self, node, detail=ViewDetail.NAME):
+    def stateAttribute(self, hashCode, detail=ViewDetail.NAME):
         """
-        Returns the check-state for the supplied node in the specified column.
+        Returns the name of the attribute that stores the check-state for the supplied node in the specified column.
 
-        :type node: om.MObject
+        :type hashCode: int
         :type detail: ViewDetail
-        :rtype: QtCore.Qt.CheckState
+        :rtype: Union[str, None]
         """
 
         # Evaluate supplied node
         #
-        isLayer = node.hasFn(om.MFn.kDisplayLayer)
-        isNode = node.hasFn(om.MFn.kDagNode)
+        nodeType = self._backend.nodeType(hashCode)
+        isLayer = nodeType == NodeType.DISPLAY_LAYER
+        isNode = nodeType == NodeType.NODE
 
-        if isLayer:
+        if not (isLayer or isNode):
 
-            # Evaluate requested column
-            #
-            buttonName = dagutils.getNodeName(node, includeNamespace=True).lstrip(':')
+            return None
 
-            if detail == ViewDetail.NAME:
+        # Evaluate requested column
+        #
+        if detail == ViewDetail.NAME:
 
-                layerVisible = mc.layerButton(buttonName, query=True, layerVisible=True)
-                return QtCore.Qt.Checked if layerVisible else QtCore.Qt.Unchecked
+            return layerbackend.VISIBILITY
 
-            elif detail == ViewDetail.PLAYBACK:
+        elif detail == ViewDetail.PLAYBACK:
 
-                layerHideOnPlayback = mc.layerButton(buttonName, query=True, layerHideOnPlayback=True)
-                return QtCore.Qt.Checked if layerHideOnPlayback else QtCore.Qt.Unchecked
+            return layerbackend.HIDE_ON_PLAYBACK
 
-            elif detail == ViewDetail.FROZEN:
+        elif detail == ViewDetail.FROZEN:
 
-                layerState = mc.layerButton(buttonName, query=True, layerState=True)
-                return QtCore.Qt.Unchecked if (layerState == 'normal') else QtCore.Qt.Checked
+            return layerbackend.DISPLAY_TYPE if isLayer else layerbackend.TEMPLATE
 
-            else:
+        else:
 
-                return None
+            return None
 
-        elif isNode:
+    @staticmethod
+    def stateFromCheckState(attribute, checkState):
+        """
+        Converts the supplied check-state into a value for the specified state attribute.
+        Display layers are considered frozen whenever they are not in their normal state!
 
-            # Evaluate requested column
-            #
-            if detail == ViewDetail.NAME:
+        :type attribute: str
+        :type checkState: Union[int, QtCore.Qt.CheckState]
+        :rtype: int
+        """
 
-                plug = plugutils.findPlug(node, 'visibility')
-                isVisible = plug.asBool()
+        isChecked = QtCore.Qt.CheckState(checkState) == QtCore.Qt.Checked
 
-                return QtCore.Qt.Checked if isVisible else QtCore.Qt.Unchecked
+        if attribute == layerbackend.DISPLAY_TYPE:
 
-            elif detail == ViewDetail.PLAYBACK:
+            return layerbackend.REFERENCED if isChecked else layerbackend.NORMAL
 
-                plug = plugutils.findPlug(node, 'hideOnPlayback')
-                isHidden = plug.asBool()
+        else:
 
-                return QtCore.Qt.Checked if isHidden else QtCore.Qt.Unchecked
+            return int(isChecked)
 
-            elif detail == ViewDetail.FROZEN:
+    def checkState(self, hashCode, detail=ViewDetail.NAME):
+        """
+        Returns the check-state for the supplied node in the specified column.
 
-                plug = plugutils.findPlug(node, 'template')
-                isTemplate = plug.asBool()
+        :type hashCode: int
+        :type detail: ViewDetail
+        :rtype: QtCore.Qt.CheckState
+        """
 
-                return QtCore.Qt.Checked if isTemplate else QtCore.Qt.Unchecked
+        # Evaluate state attribute
+        #
+        attribute = self.stateAttribute(hashCode, detail=detail)
 
-            else:
+        if attribute is None:
 
-                return None
+            return None
 
-        else:
+        # Evaluate state value
+        # Staged edits take precedence over the scene!
+        #
+        state = self._pendingStates.get((hashCode, attribute), None)
+
+        if state is None:
+
+            state = self._backend.getState(hashCode, attribute)
+
+        if state is None:
 
             return None
 
-    def setCheckState(self, node, checkState, detail=ViewDetail.NAME):
+        return QtCore.Qt.Checked if state != 0 else QtCore.Qt.Unchecked
+
+    def setCheckState(self, hashCode, checkState, detail=ViewDetail.NAME):
         """
         Updates the check-state for the supplied node for the specified detail.
 
-        :type node: om.MObject
+        :type hashCode: int
         :type checkState: Union[int, QtCore.Qt.CheckState]
         :type detail: ViewDetail
         :rtype: bool
         """
 
-        # Evaluate supplied node
+        # Evaluate state attribute
         #
-        isLayer = node.hasFn(om.MFn.kDisplayLayer)
-        isNode = node.hasFn(om.MFn.kDagNode)
+        attribute = self.stateAttribute(hashCode, detail=detail)
 
-        isChecked = QtCore.Qt.CheckState(checkState) == QtCore.Qt.Checked
+        if attribute is None:
 
-        if isLayer:
+            return False
 
-            # Evaluate requested column
-            #
-            buttonName = dagutils.getNodeName(node, includeNamespace=True).lstrip(':')
+        # Update state value
+        #
+        state = self.stateFromCheckState(attribute, checkState)
 
-            if detail == ViewDetail.NAME:
+        if self._stagedEdits:
 
-                plug = plugutils.findPlug(node, 'visibility')
-                plug.setBool(isChecked)
+            self.stageState(hashCode, attribute, state)
 
-                mc.layerButton(buttonName, edit=True, layerVisible=isChecked)
+        else:
 
-            elif detail == ViewDetail.PLAYBACK:
+            self._backend.setStates({(hashCode, attribute): state})
 
-                plug = plugutils.findPlug(node, 'hideOnPlayback')
-                plug.setBool(isChecked)
+        return True
 
-                mc.layerButton(buttonName, edit=True, layerHideOnPlayback=isChecked)
+    def stageState(self, hashCode, attribute, state):
+        """
+        Caches the supplied state for the specified node until the pending states are committed.
+        Returns a boolean that indicates if the displayed state has changed!
 
-            elif detail == ViewDetail.FROZEN:
+        :type hashCode: int
+        :type attribute: str
+        :type state: int
+        :rtype: bool
+        """
 
-                displayType = 2 if isChecked else 0
-                plug = plugutils.findPlug(node, 'displayType')
-                plug.setInt(displayType)
+        # Check if state matches scene
+        # If so, then any pending state can be discarded!
+        #
+        key = (hashCode, attribute)
+        currentState = self._backend.getState(hashCode, attribute)
 
-                layerState = 'reference' if isChecked else 'normal'
-                mc.layerButton(buttonName, edit=True, layerState=layerState)
+        if currentState is None:
 
-            else:
+            return False
 
-                return False
+        elif currentState == state:
 
-            return True
+            return self._pendingStates.pop(key, None) is not None
 
-        elif isNode:
+        else:
 
-            # Evaluate requested column
-            #
-            if detail == ViewDetail.NAME:
+            hasChanged = self._pendingStates.get(key, None) != state
+            self._pendingStates[key] = state
 
-                plug = plugutils.findPlug(node, 'visibility')
+            return hasChanged
 
-                if plug.isConnected:
+    def background(self, hashCode, detail=ViewDetail.NAME):
+        """
+        Returns the background brush for the supplied node in the specified column.
+        Only nodes with a staged check-state have a background!
 
-                    sourcePlug = plug.source()
-                    sourcePlug.setBool(isChecked)
+        :type hashCode: int
+        :type detail: ViewDetail
+        :rtype: Union[QtGui.QBrush, None]
+        """
 
-                else:
+        # Check if node is pending
+        #
+        if not self.isPending(hashCode, detail=detail):
 
-                    plug.setBool(isChecked)
+            return None
 
-            elif detail == ViewDetail.PLAYBACK:
+        # Check if brush already exists
+        #
+        cls = self.__class__
 
-                plug = plugutils.findPlug(node, 'hideOnPlayback')
+        if cls.__pending_brush__ is None:
 
-                if plug.isConnected:
+            cls.__pending_brush__ = QtGui.QBrush(QtGui.QColor(*cls.__pending_color__))
 
-                    sourcePlug = plug.source()
-                    sourcePlug.setBool(isChecked)
+        return cls.__pending_brush__
 
-                else:
+    def isPending(self, hashCode, detail=ViewDetail.NAME):
+        """
+        Evaluates if the supplied node has a staged check-state for the specified column.
 
-                    plug.setBool(isChecked)
+        :type hashCode: int
+        :type detail: ViewDetail
+        :rtype: bool
+        """
 
-            elif detail == ViewDetail.FROZEN:
+        if not self.hasPendingStates():
 
-                plug = plugutils.findPlug(node, 'template')
+            return False
 
-                if plug.isConnected:
+        attribute = self.stateAttribute(hashCode, detail=detail)
+        return (hashCode, attribute) in self._pendingStates
 
-                    sourcePlug = plug.source()
-                    sourcePlug.setBool(isChecked)
+    def commitPendingStates(self):
+        """
+        Commits all staged check-states as a single backend operation.
 
-                else:
+        :rtype: bool
+        """
+
+        # Check if there are any pending states
+        #
+        if not self.hasPendingStates():
+
+            return False
+
+        # Commit state changes
+        #
+        changed = self._backend.setStates(dict(self._pendingStates))
+        self._pendingStates.clear()
+
+        self.notifyStatesChanged()
+
+        return len(changed) > 0
+
+    def discardPendingStates(self):
+        """
+        Discards all staged check-states.
+
+        :rtype: None
+        """
+
+        if self.hasPendingStates():
+
+            self._pendingStates.clear()
+            self.notifyStatesChanged()
+
+    def setCheckStates(self, indices, checkState):
+        """
+        Updates the check-state for the supplied indices as a single backend operation.
+        A single `dataChanged` signal is emitted per parent and column for all modified rows!
+
+        :type indices: List[QtCore.QModelIndex]
+        :type checkState: Union[int, QtCore.Qt.CheckState]
+        :rtype: bool
+        """
 
-                    plug.setBool(isChecked)
+        # Collect state changes
+        #
+        states = {}
+        changes = []
+
+        for index in indices:
+
+            # Evaluate state attribute
+            #
+            hashCode = index.internalId()
+
+            if not index.isValid() or not self._backend.isAlive(hashCode):
+
+                continue
+
+            detail = self._viewDetails[index.column()]
+            attribute = self.stateAttribute(hashCode, detail=detail)
+
+            if attribute is None:
+
+                continue
+
+            # Check if state requires updating
+            # Staged edits are only committed later on!
+            #
+            key = (hashCode, attribute)
+            state = self.stateFromCheckState(attribute, checkState)
+
+            if self._stagedEdits:
+
+                if self.stageState(hashCode, attribute, state):
+
+                    changes.append(index)
 
             else:
 
-                return False
+                states[key] = state
+                changes.append((index, key))
+
+        # Execute state changes
+        # Only the rows whose states actually changed are reported!
+        #
+        if not self._stagedEdits:
+
+            changed = set(self._backend.setStates(states)) if len(states) > 0 else set()
+            changes = [index for (index, key) in changes if key in changed]
+
+        # Group modified rows by parent
+        #
+        parents = {}
+        rows = defaultdict(list)
+
+        for index in changes:
+
+            parent = index.parent()
+            key = (parent.internalId(), index.column())
+
+            parents[key] = parent
+            rows[key].append(index.row())
+
+        # Check if there are any changes
+        #
+        numChanges = len(parents)
+
+        if numChanges == 0:
+
+            return False
+
+        # Notify views of coalesced changes
+        #
+        for (key, parent) in parents.items():
+
+            column = key[1]
+            topLeft = self.index(min(rows[key]), column, parent=parent)
+            bottomRight = self.index(max(rows[key]), column, parent=parent)
+
+            self.dataChanged.emit(topLeft, bottomRight, [QtCore.Qt.CheckStateRole, QtCore.Qt.BackgroundRole])
+
+        return True
+
+    def setLayerStates(self, displayLayers, attribute, values):
+        """
+        Updates the specified state for the supplied display layers as a single backend operation.
+        The values can either be a sequence, with one value per layer, or a single value for all layers.
+        A single `dataChanged` signal is emitted per layer manager for the affected column!
 
-            return True
+        :type displayLayers: List[int]
+        :type attribute: str
+        :type values: Union[bool, int, Sequence[Union[bool, int]]]
+        :rtype: bool
+        """
+
+        # Evaluate supplied values
+        #
+        numLayers = len(displayLayers)
+
+        if isinstance(values, (bool, int)):
+
+            values = [values] * numLayers
 
         else:
 
+            values = list(values)
+            numValues = len(values)
+
+            if numValues != numLayers:
+
+                raise ValueError('setLayerStates() expects %s values (%s given)!' % (numLayers, numValues))
+
+        # Update layer states
+        #
+        states = {(displayLayerHashCode, attribute): int(value) for (displayLayerHashCode, value) in zip(displayLayers, values)}
+        changed = self._backend.setStates(states)
+
+        if len(changed) == 0:
+
             return False
 
+        # Notify views of changes
+        #
+        self.notifyLayerStatesChanged(attribute)
+
+        return True
+
+    def notifyLayerStatesChanged(self, attribute):
+        """
+        Emits a single `dataChanged` signal per layer manager for the column associated with the supplied state attribute.
+
+        :type attribute: str
+        :rtype: None
+        """
+
+        # Evaluate associated column
+        #
+        details = {
+            layerbackend.VISIBILITY: ViewDetail.NAME,
+            layerbackend.DISPLAY_TYPE: ViewDetail.FROZEN,
+            layerbackend.HIDE_ON_PLAYBACK: ViewDetail.PLAYBACK
+        }
+
+        detail = details.get(attribute, None)
+
+        if detail not in self._viewDetails:
+
+            return
+
+        column = self._viewDetails.index(detail)
+
+        # Notify views of changes
+        #
+        for row in range(self.rowCount()):
+
+            parent = self.index(row, 0)
+            numRows = self.rowCount(parent)
+
+            if numRows == 0:
+
+                continue
+
+            topLeft = self.index(0, column, parent=parent)
+            bottomRight = self.index(numRows - 1, column, parent=parent)
+
+            self.dataChanged.emit(topLeft, bottomRight, [QtCore.Qt.CheckStateRole])
+
+    def notifyStatesChanged(self):
+        """
+        Emits a single `dataChanged` signal per cached parent for the check-states of every column.
+
+        :rtype: None
+        """
+
+        # Collect cached parents
+        #
+        parents = []
+
+        for (layerManagerHashCode, displayLayers) in self._displayLayers.items():
+
+            parents.append((layerManagerHashCode, len(displayLayers)))
+            parents.extend((displayLayerHashCode, len(self._layerNodes.get(displayLayerHashCode, ()))) for displayLayerHashCode in displayLayers)
+
+        # Notify views of changes
+        #
+        lastColumn = len(self._viewDetails) - 1
+
+        for (parentHashCode, numChildren) in parents:
+
+            if numChildren == 0 or not self._backend.isAlive(parentHashCode):
+
+                continue
+
+            parent = self.indexFromHashCode(parentHashCode)
+            topLeft = self.index(0, 0, parent=parent)
+            bottomRight = self.index(numChildren - 1, lastColumn, parent=parent)
+
+            self.dataChanged.emit(topLeft, bottomRight, [QtCore.Qt.CheckStateRole])
+
     def data(self, index, role=None):
         """
         Returns the data stored under the given role for the item referred to by the index.
@@ -856,9 +1593,9 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         # Evaluate associated node
         #
-        node = self.nodeFromIndex(index)
+        hashCode = index.internalId()
 
-        if node.isNull():
+        if not index.isValid() or not self._backend.isAlive(hashCode):
 
             return
 
@@ -873,11 +1610,11 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         elif role == QtCore.Qt.EditRole:
 
-            return self.detail(node, detail=detail)
+            return self.detail(hashCode, detail=detail)
 
         elif role == QtCore.Qt.DecorationRole:
 
-            return self.decoration(node, detail=detail)
+            return self.decoration(hashCode, detail=detail)
 
         elif role == QtCore.Qt.SizeHintRole:
 
@@ -885,7 +1622,11 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         elif role == QtCore.Qt.CheckStateRole:
 
-            return self.checkState(node, detail=detail)
+            return self.checkState(hashCode, detail=detail)
+
+        elif role == QtCore.Qt.BackgroundRole:
+
+            return self.background(hashCode, detail=detail)
 
         elif role == QtCore.Qt.TextAlignmentRole:
 
@@ -911,9 +1652,9 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         # Evaluate associated node
         #
-        node = self.nodeFromIndex(index)
+        hashCode = index.internalId()
 
-        if node.isNull():
+        if not index.isValid() or not self._backend.isAlive(hashCode):
 
             return False
 
@@ -924,7 +1665,7 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         if role == QtCore.Qt.EditRole:
 
-            success = self.setDetail(node, value, detail=detail)
+            success = self.setDetail(hashCode, value, detail=detail)
 
             if success:
 
@@ -934,11 +1675,11 @@ class QLayerItemModel(QtCore.QAbstractItemModel):
 
         elif role == QtCore.Qt.CheckStateRole:
 
-            success = self.setCheckState(node, value, detail=detail)
+            success = self.setCheckState(hashCode, value, detail=detail)
 
             if success:
 
-                self.dataChanged.emit(index, index, [role])
+                self.dataChanged.emit(index, index, [role, QtCore.Qt.BackgroundRole])
 
             return success
 
@@ -0,0 +1,928 @@
+from maya.api import OpenMaya as om
+from Qt import QtCore, QtWidgets, QtGui
+from array import array
+from collections import defaultdict
+from dcc.maya.libs import plugutils
+from dcc.maya.decorators import undo
+from . import qlayeritemmodel
+from ...libs import layerbackend, layercache, layersnapshots, mayalayerbackend
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class QMayaLayerItemModel(qlayeritemmodel.QLayerItemModel):
+    """
+    Overload of `QLayerItemModel` that interfaces with the display layers of the open Maya scene.
+    Structural edits, such as creating or deleting layers, are made through undoable modifiers so they remain Maya specific!
+    """
+
+    # region Dunderscores
+    __mime_type__ = 'application/x-layerexplorer-nodes'
+
+    def __init__(self, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :type parent: QtCore.QObject
+        :type layerGraph: layergraph.LayerGraph
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        backend = kwargs.pop('backend', None)
+
+        if backend is None:
+
+            backend = mayalayerbackend.MayaLayerBackend(layerGraph=kwargs.pop('layerGraph', None))
+
+        super(QMayaLayerItemModel, self).__init__(backend=backend, **kwargs)
+    # endregion
+
+    # region Mutators
+    def layerGraph(self):
+        """
+        Returns the shared layer graph this model queries.
+
+        :rtype: layergraph.LayerGraph
+        """
+
+        return self._backend.layerGraph()
+
+    def setLayerManagersFromCache(self, cache):
+        """
+        Updates the root layer managers, along with their display layers, from the supplied warm-start cache.
+        If any cached layer manager no longer exists, or any cached UUID resolves to more than one node, then the cache is rejected and false is returned!
+
+        :type cache: layercache.LayerTreeCache
+        :rtype: bool
+        """
+
+        # Resolve cached nodes
+        # Files that are referenced more than once share their UUIDs so ambiguous nodes cannot be seeded from the cache!
+        #
+        layerTree = []
+
+        for (layerManagerUuid, displayLayerUuids) in cache.iterLayerManagers():
+
+            layerManagers = layercache.getNodesFromUuid(layerManagerUuid)
+
+            if len(layerManagers) != 1:
+
+                return False
+
+            displayLayers = []
+
+            for uuid in displayLayerUuids:
+
+                nodes = layercache.getNodesFromUuid(uuid)
+                numNodes = len(nodes)
+
+                if numNodes > 1:
+
+                    return False
+
+                elif numNodes == 1:
+
+                    displayLayers.append(nodes[0])
+
+                else:
+
+                    log.debug('Unable to locate display layer with UUID: %s' % uuid)
+
+            layerTree.append((layerManagers[0], displayLayers))
+
+        # Notify model reset
+        #
+        self.beginResetModel()
+
+        # Seed internal trackers
+        # Any stale layers are corrected once the tree is reconciled against the scene!
+        #
+        self._layerManagers.clear()
+        self._displayLayers.clear()
+        self._layerNodes.clear()
+
+        for (layerManager, displayLayers) in layerTree:
+
+            layerManagerHashCode = self._backend.registerNode(layerManager)
+            self._layerManagers.append(layerManagerHashCode)
+
+            self._displayLayers[layerManagerHashCode].extend(map(self._backend.registerNode, displayLayers))
+
+        # Notify end of model reset
+        #
+        self.endResetModel()
+
+        return True
+    # endregion
+
+    # region Methods
+    def iterLayerManagers(self):
+        """
+        Returns a generator that yields the root layer managers.
+
+        :rtype: Iterator[om.MObject]
+        """
+
+        yield from map(self.nodeFromHashCode, self.iterLayerManagerHashCodes())
+
+    def iterDisplayLayers(self, includeDefault=False):
+        """
+        Returns a generator that yields the display layers from every layer manager.
+
+        :type includeDefault: bool
+        :rtype: Iterator[om.MObject]
+        """
+
+        yield from map(self.nodeFromHashCode, self.iterDisplayLayerHashCodes(includeDefault=includeDefault))
+
+    def iterLayerNodes(self, includeDefault=False):
+        """
+        Returns a generator that yields the members from every display layer.
+
+        :type includeDefault: bool
+        :rtype: Iterator[om.MObject]
+        """
+
+        yield from map(self.nodeFromHashCode, self.iterLayerNodeHashCodes(includeDefault=includeDefault))
+
+    def exportLayerTree(self):
+        """
+        Returns the UUIDs of the root layer managers paired with the UUIDs of their display layers in row order.
+
+        :rtype: List[Tuple[str, List[str]]]
+        """
+
+        layerTree = []
+
+        for layerManagerHashCode in self.iterLayerManagerHashCodes():
+
+            layerManager = self.nodeFromHashCode(layerManagerHashCode)
+            displayLayers = [self.nodeFromHashCode(displayLayerHashCode) for displayLayerHashCode in self.getDisplayLayers(layerManagerHashCode)]
+
+            layerTree.append((layercache.getNodeUuid(layerManager), list(map(layercache.getNodeUuid, displayLayers))))
+
+        return layerTree
+
+    def captureSnapshot(self):
+        """
+        Returns a snapshot of every state for the cached display layers and their members.
+        The nodes are taken from the model's cache so the layer graph is not walked again!
+
+        :rtype: Dict[str, List[Union[int, None]]]
+        """
+
+        snapshot = {}
+
+        for hashCode in self.iterSnapshotHashCodes():
+
+            node = self.nodeFromHashCode(hashCode)
+
+            if node.isNull():
+
+                continue
+
+            key = layersnapshots.getSnapshotKey(node)
+            snapshot[key] = [self._backend.getState(hashCode, attribute) for attribute in layerbackend.STATE_ATTRIBUTES]
+
+        return snapshot
+
+    def snapshotNodes(self):
+        """
+        Returns the cached display layers and their members keyed by their snapshot keys.
+        Restoring a snapshot resolves its keys against these before falling back on a UUID lookup!
+
+        :rtype: Dict[str, List[om.MObject]]
+        """
+
+        nodesByKey = defaultdict(list)
+
+        for hashCode in self.iterSnapshotHashCodes():
+
+            node = self.nodeFromHashCode(hashCode)
+
+            if not node.isNull():
+
+                nodesByKey[layersnapshots.getSnapshotKey(node)].append(node)
+
+            else:
+
+                continue
+
+        return dict(nodesByKey)
+
+    def iterSnapshotHashCodes(self):
+        """
+        Returns a generator that yields the hash codes of the cached display layers followed by their members.
+
+        :rtype: Iterator[int]
+        """
+
+        yield from self.iterDisplayLayerHashCodes()
+        yield from self.iterLayerNodeHashCodes()
+
+    def isUnusedLayer(self, displayLayer):
+        """
+        Evaluates if the supplied display layer has no members.
+        Cached members are trusted first before falling back on the constant time `drawInfo.isSource` query!
+
+        :type displayLayer: om.MObject
+        :rtype: bool
+        """
+
+        displayLayerHashCode = om.MObjectHandle(displayLayer).hashCode()
+        layerNodes = self._layerNodes.get(displayLayerHashCode, None)
+
+        if layerNodes is not None and len(layerNodes) > 0:
+
+            return False
+
+        else:
+
+            return not plugutils.findPlug(displayLayer, 'drawInfo').isSource
+
+    def isDeletable(self, node):
+        """
+        Evaluates if the supplied node can be deleted.
+        Default layers, referenced nodes and locked nodes cannot be deleted!
+
+        :type node: om.MObject
+        :rtype: bool
+        """
+
+        fnDependNode = om.MFnDependencyNode(node)
+        isDefaultLayer = node.hasFn(om.MFn.kDisplayLayer) and fnDependNode.name().endswith('defaultLayer')
+
+        return not (isDefaultLayer or fnDependNode.isFromReferencedFile or fnDependNode.isLocked)
+
+    def reconcileHashCodes(self, *hashCodes):
+        """
+        Invalidates and reconciles the rows under the supplied layer managers and display layers.
+        Only the rows that changed are removed, moved or inserted so views keep their state!
+
+        :type hashCodes: Union[int, List[int]]
+        :rtype: None
+        """
+
+        self.layerGraph().invalidate(*hashCodes)
+
+        for hashCode in hashCodes:
+
+            nodeType = self._backend.nodeType(hashCode)
+
+            if nodeType == qlayeritemmodel.NodeType.LAYER_MANAGER:
+
+                self.reconcileLayerManager(hashCode)
+
+            elif nodeType == qlayeritemmodel.NodeType.DISPLAY_LAYER:
+
+                self.reconcileDisplayLayer(hashCode)
+
+            else:
+
+                log.debug('Unable to reconcile rows under node: %s' % hashCode)
+
+    def commitModifier(self, modifier, *hashCodes):
+        """
+        Commits the supplied modifier to the undo queue.
+        Undoing or redoing the modifier reconciles the rows under the supplied hash codes so restored rows are not lost!
+
+        :type modifier: om.MDGModifier
+        :type hashCodes: Union[int, List[int]]
+        :rtype: None
+        """
+
+        def doIt():
+
+            modifier.doIt()
+            self.reconcileHashCodes(*hashCodes)
+
+        def undoIt():
+
+            modifier.undoIt()
+            self.reconcileHashCodes(*hashCodes)
+
+        undo.commit(doIt, undoIt)
+
+    @undo.Undo(name='Delete Layers')
+    def deleteDisplayLayers(self, displayLayers):
+        """
+        Deletes the supplied display layers through a single modifier.
+        Only the rows of the deleted layers are removed from the model, and only after the modifier succeeds!
+
+        :type displayLayers: List[om.MObject]
+        :rtype: int
+        """
+
+        # Group deletable layers by layer manager
+        #
+        modifier = om.MDGModifier()
+        layersByManager = defaultdict(list)
+
+        for displayLayer in displayLayers:
+
+            if not self.isDeletable(displayLayer):
+
+                continue
+
+            displayLayerHashCode = self._backend.registerNode(displayLayer)
+            layerManagerHashCode = self._backend.parent(displayLayerHashCode)
+
+            if layerManagerHashCode is None:
+
+                continue
+
+            layersByManager[layerManagerHashCode].append(displayLayerHashCode)
+            modifier.deleteNode(displayLayer)
+
+        numLayers = sum(map(len, layersByManager.values()))
+
+        if numLayers == 0:
+
+            return 0
+
+        # Execute modifier
+        # The rows are only removed once the layers have been deleted!
+        #
+        modifier.doIt()
+        self.commitModifier(modifier, *layersByManager.keys())
+
+        self.layerGraph().invalidate(*layersByManager.keys())
+
+        # Remove deleted layer rows
+        #
+        for (layerManagerHashCode, displayLayerHashCodes) in layersByManager.items():
+
+            parent = self.indexFromHashCode(layerManagerHashCode)
+            self.removeCachedRows(parent, displayLayerHashCodes, self._displayLayers[layerManagerHashCode])
+
+            for displayLayerHashCode in displayLayerHashCodes:
+
+                self._layerNodes.pop(displayLayerHashCode, None)
+
+        return numLayers
+
+    @undo.Undo(name='Remove Objects from Layers')
+    def removeNodesFromLayers(self, nodes, displayLayers):
+        """
+        Removes the supplied nodes from the specified display layers through a single modifier.
+        Only the rows of the removed members are removed from the model, and only after the modifier succeeds!
+
+        :type nodes: List[om.MObject]
+        :type displayLayers: List[om.MObject]
+        :rtype: int
+        """
+
+        # Intersect nodes with cached layer members
+        #
+        nodeHashCodes = {om.MObjectHandle(node).hashCode() for node in nodes}
+        modifier = om.MDGModifier()
+
+        membersByLayer = {}
+
+        for displayLayer in displayLayers:
+
+            displayLayerHashCode = self._backend.registerNode(displayLayer)
+            layerNodes = self.getLayerNodes(displayLayerHashCode)
+            members = nodeHashCodes.intersection(layerNodes)
+
+            if len(members) == 0:
+
+                continue
+
+            membersByLayer[displayLayerHashCode] = members
+
+            # Break draw-info connections
+            #
+            for member in members:
+
+                drawOverridePlug = plugutils.findPlug(self.nodeFromHashCode(member), 'drawOverride')
+                modifier.disconnect(drawOverridePlug.source(), drawOverridePlug)
+
+        numMembers = sum(map(len, membersByLayer.values()))
+
+        if numMembers == 0:
+
+            return 0
+
+        # Execute modifier
+        # The rows are only removed once the connections have been broken!
+        #
+        modifier.doIt()
+        self.commitModifier(modifier, *membersByLayer.keys())
+
+        self.layerGraph().invalidate(*membersByLayer.keys())
+
+        # Remove member rows
+        #
+        for (displayLayerHashCode, members) in membersByLayer.items():
+
+            parent = self.indexFromHashCode(displayLayerHashCode)
+            self.removeCachedRows(parent, members, self._layerNodes[displayLayerHashCode])
+
+        return numMembers
+
+    def deleteUnusedLayers(self):
+        """
+        Deletes every display layer, from every layer manager, that has no members.
+
+        :rtype: int
+        """
+
+        displayLayers = [displayLayer for displayLayer in self.iterDisplayLayers() if self.isUnusedLayer(displayLayer)]
+        return self.deleteDisplayLayers(displayLayers)
+
+    def nodeFromIndex(self, index):
+        """
+        Returns the node associated with the supplied index.
+
+        :type index: QtCore.QModelIndex
+        :rtype: om.MObject
+        """
+
+        return self.nodeFromHashCode(index.internalId())
+
+    def nodeFromHashCode(self, hashCode):
+        """
+        Returns the node associated with the supplied hash code.
+
+        :type hashCode: int
+        :rtype: om.MObject
+        """
+
+        return self._backend.getNode(hashCode)
+
+    def indexFromNode(self, node):
+        """
+        Returns the index of the supplied node.
+
+        :type node: om.MObject
+        :rtype: QtCore.QModelIndex
+        """
+
+        if node.isNull():
+
+            return QtCore.QModelIndex()
+
+        else:
+
+            return self.indexFromHashCode(self._backend.registerNode(node))
+
+    def setLayerStates(self, displayLayers, attribute, values):
+        """
+        Updates the specified state for the supplied display layers as a single undoable operation.
+        The display layers can either be nodes or hash codes!
+
+        :type displayLayers: List[Union[int, om.MObject]]
+        :type attribute: str
+        :type values: Union[bool, int, Sequence[Union[bool, int]]]
+        :rtype: bool
+        """
+
+        displayLayerHashCodes = [displayLayer if isinstance(displayLayer, int) else self._backend.registerNode(displayLayer) for displayLayer in displayLayers]
+        return super(QMayaLayerItemModel, self).setLayerStates(displayLayerHashCodes, attribute, values)
+
+    @undo.Undo(name='Move Layers')
+    def moveDisplayLayers(self, displayLayers, offset):
+        """
+        Moves the supplied display layers up or down by one row within their layer managers.
+        Only the `displayOrder` values of the swapped layers are updated through a single modifier!
+
+        :type displayLayers: List[om.MObject]
+        :type offset: int
+        :rtype: int
+        """
+
+        # Group selected rows by layer manager
+        #
+        rowsByManager = defaultdict(set)
+
+        for displayLayer in displayLayers:
+
+            index = self.indexFromNode(displayLayer)
+
+            if index.isValid():
+
+                rowsByManager[index.parent().internalId()].add(index.row())
+
+        # Plan swaps with unselected neighbours
+        # Display orders are tracked until every swap is planned, since queued values cannot be read back from the plugs!
+        #
+        isUp = offset < 0
+        displayOrders = {}  # type: dict[int, int]
+        swapsByManager = defaultdict(list)
+
+        for (layerManagerHashCode, rows) in rowsByManager.items():
+
+            order = list(self._displayLayers[layerManagerHashCode])
+
+            firstRow = 1 if (len(order) > 0 and self.isDefaultLayer(order[0])) else 0
+            lastRow = len(order) - 1
+            limit = firstRow if isUp else lastRow
+
+            for row in sorted(rows, reverse=not isUp):
+
+                # Check if row can be moved
+                #
+                targetRow = row - 1 if isUp else row + 1
+                canMove = (targetRow >= limit) if isUp else (targetRow <= limit)
+
+                if not canMove:
+
+                    limit = row + 1 if isUp else row - 1
+                    continue
+
+                # Swap display orders
+                #
+                displayLayerHashCode, neighbourHashCode = order[row], order[targetRow]
+
+                for hashCode in (displayLayerHashCode, neighbourHashCode):
+
+                    if hashCode not in displayOrders:
+
+                        displayOrders[hashCode] = plugutils.findPlug(self.nodeFromHashCode(hashCode), 'displayOrder').asInt()
+
+                displayOrders[displayLayerHashCode], displayOrders[neighbourHashCode] = displayOrders[neighbourHashCode], displayOrders[displayLayerHashCode]
+
+                order[row], order[targetRow] = order[targetRow], order[row]
+                swapsByManager[layerManagerHashCode].append((row, targetRow))
+
+                limit = row
+
+        numMoves = sum(map(len, swapsByManager.values()))
+
+        if numMoves == 0:
+
+            return 0
+
+        # Execute modifier
+        # Each layer only receives its final display order!
+        #
+        modifier = om.MDGModifier()
+
+        for (hashCode, displayOrder) in displayOrders.items():
+
+            modifier.newPlugValueInt(plugutils.findPlug(self.nodeFromHashCode(hashCode), 'displayOrder'), displayOrder)
+
+        modifier.doIt()
+        self.commitModifier(modifier, *swapsByManager.keys())
+
+        self.layerGraph().invalidate(*swapsByManager.keys())
+
+        # Move rows
+        # The rows are only moved once the display orders have been updated!
+        #
+        for (layerManagerHashCode, swaps) in swapsByManager.items():
+
+            parent = self.indexFromHashCode(layerManagerHashCode)
+            cache = self._displayLayers[layerManagerHashCode]
+
+            for (row, targetRow) in swaps:
+
+                # The destination is the row before which the moved row is inserted!
+                #
+                destinationRow = targetRow if isUp else targetRow + 1
+                self.beginMoveRows(parent, row, row, parent, destinationRow)
+                cache[row], cache[targetRow] = cache[targetRow], cache[row]
+                self.endMoveRows()
+
+        return numMoves
+
+    @staticmethod
+    def uniqueLayerName(baseName='layer'):
+        """
+        Returns a unique node name derived from the supplied base name.
+
+        :type baseName: str
+        :rtype: str
+        """
+
+        selectionList = om.MSelectionList()
+        suffix = 1
+
+        while True:
+
+            name = '{baseName}{suffix}'.format(baseName=baseName, suffix=suffix)
+
+            try:
+
+                selectionList.add(name)
+                suffix += 1
+
+            except RuntimeError:
+
+                return name
+
+    @undo.Undo(name='Create Layer')
+    def createDisplayLayer(self, nodes, name=None, makeCurrent=False):
+        """
+        Creates a new display layer, under the root layer manager, from the supplied nodes.
+        The layer and all of its member connections are created through a single modifier.
+        Only the new layer row is inserted since its members are fetched lazily, while the previous layers of the members are reconciled!
+
+        :type nodes: List[om.MObject]
+        :type name: Union[str, None]
+        :type makeCurrent: bool
+        :rtype: om.MObject
+        """
+
+        # Evaluate root layer manager
+        #
+        layerManagerHashCode = self.rootLayerManager()
+
+        if layerManagerHashCode is None:
+
+            return om.MObject.kNullObj
+
+        layerManager = self.nodeFromHashCode(layerManagerHashCode)
+        displayLayers = self.getDisplayLayers(layerManagerHashCode)
+        parent = self.indexFromHashCode(layerManagerHashCode)
+
+        # Find next available layer id and display order
+        #
+        displayLayerIdPlug = plugutils.findPlug(layerManager, 'displayLayerId')
+        indices = displayLayerIdPlug.getExistingArrayAttributeIndices()
+        layerId = (max(indices) + 1) if len(indices) > 0 else 1
+
+        displayOrders = [plugutils.findPlug(self.nodeFromHashCode(hashCode), 'displayOrder').asInt() for hashCode in displayLayers]
+        displayOrder = (max(displayOrders) + 1) if len(displayOrders) > 0 else 1
+
+        # Create display layer
+        #
+        modifier = om.MDGModifier()
+
+        displayLayer = modifier.createNode('displayLayer')
+        modifier.renameNode(displayLayer, name if name else self.uniqueLayerName())
+
+        modifier.connect(displayLayerIdPlug.elementByLogicalIndex(layerId), plugutils.findPlug(displayLayer, 'identification'))
+        modifier.newPlugValueInt(plugutils.findPlug(displayLayer, 'displayOrder'), displayOrder)
+
+        if makeCurrent:
+
+            modifier.newPlugValueInt(plugutils.findPlug(layerManager, 'currentDisplayLayer'), layerId)
+
+        # Connect layer members
+        #
+        drawInfoPlug = plugutils.findPlug(displayLayer, 'drawInfo')
+        sourceHashCodes = set()
+
+        for node in nodes:
+
+            drawOverridePlug = plugutils.findPlug(node, 'drawOverride')
+
+            if drawOverridePlug.isDestination:
+
+                sourcePlug = drawOverridePlug.source()
+                sourceHashCodes.add(self._backend.registerNode(sourcePlug.node()))
+
+                modifier.disconnect(sourcePlug, drawOverridePlug)
+
+            modifier.connect(drawInfoPlug, drawOverridePlug)
+
+        # Execute modifier and insert layer row
+        # Cache validation is suspended so the new row is only inserted once!
+        #
+        try:
+
+            self._validateCaches = False
+
+            modifier.doIt()
+            self.commitModifier(modifier, layerManagerHashCode, *sourceHashCodes)
+
+            displayLayerHashCode = self._backend.registerNode(displayLayer)
+            row = len(displayLayers)
+
+            self.beginInsertRows(parent, row, row)
+            displayLayers.append(displayLayerHashCode)
+            self.endInsertRows()
+
+        finally:
+
+            self._validateCaches = True
+
+        self.layerGraph().invalidate(layerManagerHashCode)
+
+        # Remove members from their previous layers
+        #
+        self.reconcileHashCodes(*sourceHashCodes)
+
+        return displayLayer
+
+    def supportedDragActions(self):
+        """
+        Returns the actions supported by the data in this model.
+
+        :rtype: QtCore.Qt.DropActions
+        """
+
+        return QtCore.Qt.MoveAction
+
+    def supportedDropActions(self):
+        """
+        Returns the drop actions supported by this model.
+
+        :rtype: QtCore.Qt.DropActions
+        """
+
+        return QtCore.Qt.MoveAction
+
+    def mimeTypes(self):
+        """
+        Returns the list of allowed MIME types.
+
+        :rtype: List[str]
+        """
+
+        return [self.__mime_type__]
+
+    def mimeData(self, indexes):
+        """
+        Returns an object that contains serialized items of data corresponding to the list of indexes specified.
+        The payload is a compact array of (layer, node) hash code pairs rather than node names!
+
+        :type indexes: List[QtCore.QModelIndex]
+        :rtype: QtCore.QMimeData
+        """
+
+        # Collect unique layer members
+        #
+        pairs = {}
+
+        for index in indexes:
+
+            if self.nodeTypeFromIndex(index) != qlayeritemmodel.NodeType.NODE:
+
+                continue
+
+            pairs[index.internalId()] = index.parent().internalId()
+
+        # Serialize hash code pairs
+        #
+        payload = array('Q')
+
+        for (nodeHashCode, displayLayerHashCode) in pairs.items():
+
+            payload.extend((displayLayerHashCode, nodeHashCode))
+
+        mimeData = QtCore.QMimeData()
+        mimeData.setData(self.__mime_type__, QtCore.QByteArray(payload.tobytes()))
+
+        return mimeData
+
+    def canDropMimeData(self, data, action, row, column, parent):
+        """
+        Returns true if a model can accept a drop of the data.
+
+        :type data: QtCore.QMimeData
+        :type action: QtCore.Qt.DropAction
+        :type row: int
+        :type column: int
+        :type parent: QtCore.QModelIndex
+        :rtype: bool
+        """
+
+        if not data.hasFormat(self.__mime_type__) or action != QtCore.Qt.MoveAction:
+
+            return False
+
+        isLayer = self.nodeTypeFromIndex(parent) == qlayeritemmodel.NodeType.DISPLAY_LAYER
+        return isLayer and not self._backend.isReferenced(parent.internalId())
+
+    def dropMimeData(self, data, action, row, column, parent):
+        """
+        Handles the data supplied by a drag and drop operation that ended with the given action.
+        All dropped nodes are reassigned to the parent layer through a single modifier!
+
+        :type data: QtCore.QMimeData
+        :type action: QtCore.Qt.DropAction
+        :type row: int
+        :type column: int
+        :type parent: QtCore.QModelIndex
+        :rtype: bool
+        """
+
+        # Check if data can be dropped
+        #
+        if not self.canDropMimeData(data, action, row, column, parent):
+
+            return False
+
+        # Deserialize hash code pairs
+        #
+        payload = array('Q')
+        payload.frombytes(bytes(data.data(self.__mime_type__)))
+
+        membersByLayer = defaultdict(list)
+
+        for i in range(0, len(payload), 2):
+
+            membersByLayer[payload[i]].append(payload[i + 1])
+
+        # Move nodes to parent layer
+        #
+        displayLayer = self.nodeFromIndex(parent)
+        numMembers = self.moveNodesToLayer(membersByLayer, displayLayer)
+
+        return numMembers > 0
+
+    @undo.Undo(name='Move Objects to Layer')
+    def moveNodesToLayer(self, membersByLayer, displayLayer):
+        """
+        Moves the supplied layer members to the specified display layer through a single modifier.
+        The members are keyed by the hash code of their current layer so rows can be moved between layer parents!
+
+        :type membersByLayer: Dict[int, List[int]]
+        :type displayLayer: om.MObject
+        :rtype: int
+        """
+
+        # Ensure target layer cache is up-to-date
+        #
+        targetHashCode = self._backend.registerNode(displayLayer)
+        targetNodes = self.getLayerNodes(targetHashCode)
+        targetParent = self.indexFromHashCode(targetHashCode)
+
+        drawInfoPlug = plugutils.findPlug(displayLayer, 'drawInfo')
+        modifier = om.MDGModifier()
+
+        # Reconnect draw-info plugs
+        #
+        numMembers = 0
+        movedMembers = {}
+
+        for (displayLayerHashCode, members) in membersByLayer.items():
+
+            # Check if members are already in target layer
+            #
+            if displayLayerHashCode == targetHashCode or not self._backend.isAlive(displayLayerHashCode):
+
+                continue
+
+            members = [member for member in members if self._backend.isAlive(member)]
+            movedMembers[displayLayerHashCode] = members
+
+            for member in members:
+
+                drawOverridePlug = plugutils.findPlug(self.nodeFromHashCode(member), 'drawOverride')
+
+                if drawOverridePlug.isDestination:
+
+                    modifier.disconnect(drawOverridePlug.source(), drawOverridePlug)
+
+                modifier.connect(drawInfoPlug, drawOverridePlug)
+                numMembers += 1
+
+        if numMembers == 0:
+
+            return 0
+
+        # Execute modifier
+        # The rows are only moved once the members have been reconnected!
+        #
+        modifier.doIt()
+        self.commitModifier(modifier, targetHashCode, *movedMembers.keys())
+
+        self.layerGraph().invalidate(targetHashCode, *movedMembers.keys())
+
+        # Move rows between layer parents
+        #
+        try:
+
+            self._validateCaches = False
+
+            for (displayLayerHashCode, members) in movedMembers.items():
+
+                sourceNodes = self._layerNodes[displayLayerHashCode]
+                sourceParent = self.indexFromHashCode(displayLayerHashCode)
+
+                positions = {hashCode: row for (row, hashCode) in enumerate(sourceNodes)}
+                rows = [positions[member] for member in members if member in positions]
+
+                for (startRow, endRow) in self.iterContiguousRows(rows, reverse=True):
+
+                    canMove = self.beginMoveRows(sourceParent, startRow, endRow, targetParent, len(targetNodes))
+
+                    if not canMove:
+
+                        continue
+
+                    movedNodes = [sourceNodes[row] for row in range(startRow, endRow + 1)]
+
+                    for row in range(endRow, startRow - 1, -1):
+
+                        del sourceNodes[row]
+
+                    targetNodes.extend(movedNodes)
+
+                    self.endMoveRows()
+
+        finally:
+
+            self._validateCaches = True
+
+        return numMembers
+    # endregion
@@ -13,14 +13,33 @@ class QStyledLayerItemDelegate(QtWidgets.QStyledItemDelegate):
     """
 
     # region Dunderscores
-    __checkbox_icons__ = {
-        ViewDetail.NAME: QtGui.QIcon(':layerExplorer/icons/visible.png'),
-        ViewDetail.FROZEN: QtGui.QIcon(':layerExplorer/icons/frozen.png'),
-        ViewDetail.PLAYBACK: QtGui.QIcon(':layerExplorer/icons/playback.png')
+    __checkbox_icon_paths__ = {
+        ViewDetail.NAME: ':layerExplorer/icons/visible.png',
+        ViewDetail.FROZEN: ':layerExplorer/icons/frozen.png',
+        ViewDetail.PLAYBACK: ':layerExplorer/icons/playback.png'
     }
+
+    __checkbox_icons__ = {}  # Icons are constructed on demand to keep importing this module cheap!
     # endregion
 
     # region Methods
+    def checkBoxIcon(self, detail):
+        """
+        Returns the check-box icon for the specified detail.
+
+        :type detail: ViewDetail
+        :rtype: QtGui.QIcon
+        """
+
+        icon = self.__checkbox_icons__.get(detail, None)
+
+        if icon is None:
+
+            icon = QtGui.QIcon(self.__checkbox_icon_paths__[detail])
+            self.__checkbox_icons__[detail] = icon
+
+        return icon
+
     def paint(self, painter, option, index):
         """
         Renders the delegate using the given painter and style option for the item specified by index.
@@ -81,7 +100,7 @@ class QStyledLayerItemDelegate(QtWidgets.QStyledItemDelegate):
             #
             iconMode = QtGui.QIcon.Normal if ((isChecked and isCheckable) or (isEnabled and not isCheckable)) else QtGui.QIcon.Disabled
             iconState = QtGui.QIcon.On if isOpen else QtGui.QIcon.Off
-            checkBoxIcon = self.__checkbox_icons__[detail]
+            checkBoxIcon = self.checkBoxIcon(detail)
 
             # Paint item components
             #
@@ -103,7 +122,7 @@ class QStyledLayerItemDelegate(QtWidgets.QStyledItemDelegate):
 
             mode = QtGui.QIcon.Normal if isActive else QtGui.QIcon.Disabled
             state = QtGui.QIcon.On if isActive else QtGui.QIcon.Off
-            checkBoxIcon = self.__checkbox_icons__[detail]
+            checkBoxIcon = self.checkBoxIcon(detail)
 
             checkBoxIcon.paint(painter, option.rect, QtCore.Qt.AlignCenter, mode, state)
 
@@ -111,6 +130,69 @@ class QStyledLayerItemDelegate(QtWidgets.QStyledItemDelegate):
 
             super(QStyledLayerItemDelegate, self).paint(painter, option, index)
 
+    def selectedIndices(self, index, option):
+        """
+        Returns the selected source indices, in the same column, if the supplied source index is part of the view's selection.
+        Otherwise, an empty list is returned!
+
+        :type index: QtCore.QModelIndex
+        :type option: QtWidgets.QStyleOptionViewItem
+        :rtype: List[QtCore.QModelIndex]
+        """
+
+        # Evaluate view selection
+        #
+        view = option.widget
+
+        if not isinstance(view, QtWidgets.QAbstractItemView):
+
+            return []
+
+        selectionModel = view.selectionModel()
+
+        if selectionModel is None:
+
+            return []
+
+        # Map selected indices to source model
+        #
+        proxyModel = view.model()
+        indices = selectionModel.selection().indexes()
+
+        if isinstance(proxyModel, QtCore.QSortFilterProxyModel):
+
+            indices = [proxyModel.mapToSource(selectedIndex) for selectedIndex in indices]
+
+        column = index.column()
+        indices = [selectedIndex for selectedIndex in indices if selectedIndex.column() == column]
+
+        return indices if index in indices else []
+
+    def toggleCheckState(self, model, index, option):
+        """
+        Toggles the check-state for the supplied source index.
+        If the index is part of a multi-row selection then every selected row is toggled through a single `setCheckStates` call, so the edit is undone in one step!
+
+        :type model: QtCore.QAbstractItemModel
+        :type index: QtCore.QModelIndex
+        :type option: QtWidgets.QStyleOptionViewItem
+        :rtype: bool
+        """
+
+        checkState = index.data(role=QtCore.Qt.CheckStateRole)
+        toggledState = QtCore.Qt.Checked if (checkState == QtCore.Qt.Unchecked) else QtCore.Qt.Unchecked
+
+        indices = self.selectedIndices(index, option)
+
+        if len(indices) >= 2:
+
+            model.setCheckStates(indices, toggledState)
+            return True
+
+        else:
+
+            return model.setData(index, toggledState, role=QtCore.Qt.CheckStateRole)
+
     def editorEvent(self, event, model, option, index):
         """
         When editing of an item starts, this function is called with the event that triggered the editing, the model, the index of the item, and the option used for rendering the item.
@@ -136,7 +218,7 @@ class QStyledLayerItemDelegate(QtWidgets.QStyledItemDelegate):
         # Check if index is checkable
         #
         flags = model.flags(index)
-        isCheckable = flags & QtCore.Qt.ItemIsUserCheckable
+        isCheckable = (flags & QtCore.Qt.ItemIsUserCheckable) and (flags & QtCore.Qt.ItemIsEnabled)
 
         if not isCheckable:
 
@@ -150,47 +232,49 @@ class QStyledLayerItemDelegate(QtWidgets.QStyledItemDelegate):
 
         isNameColumn = detail == ViewDetail.NAME
 
-        if isNameColumn:
-
-            return super(QStyledLayerItemDelegate, self).editorEvent(event, model, option, index)  # Name column uses default alignment!
-
         # Evaluate event type
+        # Key presses are only handled by the name column, same as the default implementation!
         #
+        eventType = event.type()
         isMouseEvent = isinstance(event, QtGui.QMouseEvent)
 
-        if not isMouseEvent:
+        if eventType == QtCore.QEvent.KeyPress:
+
+            isToggleKey = event.key() in (QtCore.Qt.Key_Space, QtCore.Qt.Key_Select)
+            return self.toggleCheckState(model, index, option) if (isNameColumn and isToggleKey) else False
+
+        elif not isMouseEvent:
 
             return super(QStyledLayerItemDelegate, self).editorEvent(event, model, option, index)
 
-        # Evaluate mouse event type
+        # Check if mouse is inside check-box bounds
+        # The name column uses the default alignment while the remaining columns are centered!
         #
-        mouseEventType = event.type()
-        isClickEvent = mouseEventType == QtGui.QMouseEvent.MouseButtonRelease
+        self.initStyleOption(option, index)
+
+        style = QtWidgets.QApplication.instance().style()
+        checkBoxRect = style.subElementRect(QtWidgets.QStyle.SE_ItemViewItemCheckIndicator, option, option.widget)
 
-        if isClickEvent:
+        if not isNameColumn:
 
-            # Initialize style options
-            #
-            self.initStyleOption(option, index)
+            checkBoxRect = QtWidgets.QStyle.alignedRect(option.direction, QtCore.Qt.Alignment(index.data(role=QtCore.Qt.TextAlignmentRole)), checkBoxRect.size(), option.rect)
 
-            # Check if mouse is inside aligned check-box bounds
-            #
-            style = QtWidgets.QApplication.instance().style()
-            checkBoxRect = style.subElementRect(QtWidgets.QStyle.SE_ItemViewItemCheckIndicator, option, option.widget)
-            alignedRect = QtWidgets.QStyle.alignedRect(option.direction, QtCore.Qt.Alignment(index.data(role=QtCore.Qt.TextAlignmentRole)), checkBoxRect.size(), option.rect)
+        wasClicked = event.button() == QtCore.Qt.LeftButton and checkBoxRect.contains(event.pos())
 
-            wasClicked = alignedRect.contains(event.pos())
+        if not wasClicked:
 
-            if wasClicked:
+            return False
 
-                checkState = index.data(role=QtCore.Qt.CheckStateRole)
-                toggledState = QtCore.Qt.Checked if (checkState == QtCore.Qt.Unchecked) else QtCore.Qt.Unchecked
+        # Evaluate mouse event type
+        # The name column swallows presses inside the check-box, same as the default implementation!
+        #
+        if eventType == QtGui.QMouseEvent.MouseButtonRelease:
 
-                return model.setData(index, toggledState, role=QtCore.Qt.CheckStateRole)
+            return self.toggleCheckState(model, index, option)
 
-            else:
+        elif eventType == QtGui.QMouseEvent.MouseButtonPress or eventType == QtGui.QMouseEvent.MouseButtonDblClick:
 
-                return False
+            return isNameColumn
 
         else:
 
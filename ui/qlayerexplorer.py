@@ -1,14 +1,14 @@
 from maya import cmds as mc
 from maya.api import OpenMaya as om
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
-from Qt import QtCore, QtWidgets, QtGui, QtCompat
+from Qt import QtCore, QtWidgets, QtGui
 from dcc.ui import qsingletonwindow
 from dcc.maya.libs import dagutils, layerutils
 from dcc.maya.decorators import undo
 from dcc.ui import qsignalblocker
-from functools import partial
-from . import resources
-from .models import qlayeritemmodel, qlayeritemfiltermodel, qstyledlayeritemdelegate
+from collections import deque
+from ..libs import layerbackend, layerstates, layersnapshots, layercache
+from .models import qmayalayeritemmodel, qlayeritemfiltermodel, qstyledlayeritemdelegate
 
 import logging
 logging.basicConfig()
@@ -16,82 +16,16 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
-def onSceneOpening(*args, **kwargs):
+def initializeResources():
     """
-    Callback method for any pre-scene open delegation.
+    Registers the compiled icon resources.
+    The resource module is only imported once the first window is shown rather than when this module is imported!
 
-    :rtype: None
+    :rtype: module
     """
 
-    # Check if instance exists
-    #
-    instance = QLayerExplorer.getInstance()
-
-    if instance is None:
-
-        return
-
-    # Evaluate if instance is still valid
-    #
-    if QtCompat.isValid(instance):
-
-        instance.sceneOpening(*args, **kwargs)
-
-    else:
-
-        log.warning('Unable to process scene changed callback!')
-
-
-def onSceneOpened(*args, **kwargs):
-    """
-    Callback method for any post-scene openi delegation.
-
-    :rtype: None
-    """
-
-    # Check if instance exists
-    #
-    instance = QLayerExplorer.getInstance()
-
-    if instance is None:
-
-        return
-
-    # Evaluate if instance is still valid
-    #
-    if QtCompat.isValid(instance):
-
-        mc.evalDeferred(partial(instance.sceneOpened, *args, **kwargs))  # Allows scene to fully load before processing changes!
-
-    else:
-
-        log.warning('Unable to process scene changed callback!')
-
-
-def onSelectionChanged(*args, **kwargs):
-    """
-    Callback method for any selection delegation.
-
-    :rtype: None
-    """
-
-    # Check if instance exists
-    #
-    instance = QLayerExplorer.getInstance()
-
-    if instance is None:
-
-        return
-
-    # Evaluate if instance is still valid
-    #
-    if QtCompat.isValid(instance):
-
-        instance.selectionChanged(*args, **kwargs)
-
-    else:
-
-        log.warning('Unable to process selection changed callback!')
+    from . import resources  # Importing the module registers the resource data!
+    return resources
 
 
 class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow):
@@ -100,6 +34,15 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
     """
 
     # region Dunderscores
+    __populate_budget__ = 12  # Milliseconds spent populating per idle slice!
+    __journal_limit__ = 256  # Maximum number of dirty nodes recorded while hidden!
+    __button_icons__ = {
+        'moveLayerUpPushButton': ':/layerExplorer/icons/moveLayerUp.png',
+        'moveLayerDownPushButton': ':/layerExplorer/icons/moveLayerDown.png',
+        'createEmptyLayerPushButton': ':/layerExplorer/icons/newEmptyLayer.png',
+        'createLayerFromSelectedPushButton': ':/layerExplorer/icons/newLayer.png'
+    }
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -115,8 +58,28 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
 
         # Declare private variables
         #
-        self._callbackIds = om.MCallbackIdArray()
         self._dataChanges = QtCore.QItemSelection()
+        self._activeSelection = {}  # type: dict[int, om.MObjectHandle]
+        self._selectionInvalidated = True
+        self._pendingSelectionEvents = 0
+        self._mergedSelectionEvents = 0
+        self._pendingSelected = {}  # type: dict[int, om.MObjectHandle]
+        self._pendingDeselected = {}  # type: dict[int, om.MObjectHandle]
+        self._replaceSelection = False
+        self._propagatingCheckStates = False
+        self._populateQueue = deque()  # type: deque[int]
+        self._populateCount = 0
+        self._verifyLayerManagers = False
+        self._referencesChanged = False
+        self._fingerprints = {}  # type: dict[int, str]
+        self._memberFingerprints = {}  # type: dict[int, str]
+        self._suspended = False
+        self._batching = False
+        self._journal = set()  # type: set[int]
+        self._journalManagers = False
+        self._journalSelection = False
+        self._journalOverflow = False
+        self._iconsInitialized = False
 
     def __setup_ui__(self, *args, **kwargs):
         """
@@ -155,34 +118,43 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.searchLineEdit.setClearButtonEnabled(True)
         self.searchLineEdit.textEdited.connect(self.on_searchLineEdit_textChanged)
 
-        self.moveLayerUpPushButton = QtWidgets.QPushButton(QtGui.QIcon(':/layerExplorer/icons/moveLayerUp.png'), '')
+        self.moveLayerUpPushButton = QtWidgets.QPushButton('')
         self.moveLayerUpPushButton.setObjectName('moveLayerUpPushButton')
         self.moveLayerUpPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed))
         self.moveLayerUpPushButton.setFixedSize(QtCore.QSize(24, 24))
         self.moveLayerUpPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
         self.moveLayerUpPushButton.clicked.connect(self.on_moveLayerUpPushButton_clicked)
 
-        self.moveLayerDownPushButton = QtWidgets.QPushButton(QtGui.QIcon(':/layerExplorer/icons/moveLayerDown.png'), '')
+        self.moveLayerDownPushButton = QtWidgets.QPushButton('')
         self.moveLayerDownPushButton.setObjectName('moveLayerDownPushButton')
         self.moveLayerDownPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed))
         self.moveLayerDownPushButton.setFixedSize(QtCore.QSize(24, 24))
         self.moveLayerDownPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
         self.moveLayerDownPushButton.clicked.connect(self.on_moveLayerDownPushButton_clicked)
 
-        self.createEmptyLayerPushButton = QtWidgets.QPushButton(QtGui.QIcon(':/layerExplorer/icons/newEmptyLayer.png'), '')
+        self.createEmptyLayerPushButton = QtWidgets.QPushButton('')
         self.createEmptyLayerPushButton.setObjectName('createEmptyLayerPushButton')
         self.createEmptyLayerPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed))
         self.createEmptyLayerPushButton.setFixedSize(QtCore.QSize(24, 24))
         self.createEmptyLayerPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
         self.createEmptyLayerPushButton.clicked.connect(self.on_createEmptyLayerPushButton_clicked)
 
-        self.createLayerFromSelectedPushButton = QtWidgets.QPushButton(QtGui.QIcon(':/layerExplorer/icons/newLayer.png'), '')
+        self.createLayerFromSelectedPushButton = QtWidgets.QPushButton('')
         self.createLayerFromSelectedPushButton.setObjectName('createLayerFromSelectedPushButton')
         self.createLayerFromSelectedPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed))
         self.createLayerFromSelectedPushButton.setFixedSize(QtCore.QSize(24, 24))
         self.createLayerFromSelectedPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
         self.createLayerFromSelectedPushButton.clicked.connect(self.on_createLayerFromSelectedPushButton_clicked)
 
+        self.applyPushButton = QtWidgets.QPushButton('Apply')
+        self.applyPushButton.setObjectName('applyPushButton')
+        self.applyPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed))
+        self.applyPushButton.setFixedHeight(24)
+        self.applyPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.applyPushButton.setToolTip('Commits any pending check-state edits.')
+        self.applyPushButton.setVisible(False)
+        self.applyPushButton.clicked.connect(self.on_applyPushButton_clicked)
+
         self.buttonsLayout = QtWidgets.QHBoxLayout()
         self.buttonsLayout.setObjectName('buttonsLayout')
         self.buttonsLayout.setContentsMargins(0, 0, 0, 0)
@@ -191,6 +163,7 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.buttonsLayout.addWidget(self.moveLayerDownPushButton)
         self.buttonsLayout.addWidget(self.createEmptyLayerPushButton)
         self.buttonsLayout.addWidget(self.createLayerFromSelectedPushButton)
+        self.buttonsLayout.addWidget(self.applyPushButton)
 
         centralLayout.addLayout(self.buttonsLayout)
 
@@ -203,6 +176,10 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.layerTreeView.setEditTriggers(QtWidgets.QAbstractItemView.SelectedClicked)
         self.layerTreeView.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.layerTreeView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.layerTreeView.setDragEnabled(True)
+        self.layerTreeView.setAcceptDrops(True)
+        self.layerTreeView.setDragDropMode(QtWidgets.QAbstractItemView.DragDrop)
+        self.layerTreeView.setDefaultDropAction(QtCore.Qt.MoveAction)
         self.layerTreeView.setDropIndicatorShown(False)
         self.layerTreeView.setAlternatingRowColors(True)
         self.layerTreeView.setRootIsDecorated(True)
@@ -211,9 +188,10 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.layerTreeView.setExpandsOnDoubleClick(False)
         self.layerTreeView.header().setMinimumSectionSize(50)
 
-        self.layerItemModel = qlayeritemmodel.QLayerItemModel(parent=self.layerTreeView)
+        self.layerItemModel = qmayalayeritemmodel.QMayaLayerItemModel(parent=self.layerTreeView)
         self.layerItemModel.setObjectName('layerItemModel')
         self.layerItemModel.dataChanged.connect(self.on_layerItemModel_dataChanged)
+        self.layerItemModel.modelReset.connect(self.invalidateSelection)
 
         self.layerItemFilterModel = qlayeritemfiltermodel.QLayerItemFilterModel(parent=self.layerTreeView)
         self.layerItemFilterModel.setObjectName('layerItemFilterModel')
@@ -231,8 +209,22 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.layerSelectionModel.setObjectName('layerSelectionModel')
         self.layerSelectionModel.selectionChanged.connect(self.on_layerSelectionModel_selectionChanged)
 
+        self.layerTreeView.installEventFilter(self)
+        self.layerTreeView.viewport().installEventFilter(self)
+
         centralLayout.addWidget(self.layerTreeView)
 
+        # Initialize populate progress bar
+        #
+        self.populateProgressBar = QtWidgets.QProgressBar()
+        self.populateProgressBar.setObjectName('populateProgressBar')
+        self.populateProgressBar.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.populateProgressBar.setFixedHeight(16)
+        self.populateProgressBar.setFormat('Populating layers... %p%')
+        self.populateProgressBar.setVisible(False)
+
+        centralLayout.addWidget(self.populateProgressBar)
+
         # Initialize menu-bar
         #
         mainMenuBar = QtWidgets.QMenuBar(self)
@@ -277,17 +269,24 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.deleteUnusedLayersAction.setObjectName('deleteUnusedLayersAction')
         self.deleteUnusedLayersAction.triggered.connect(self.on_deleteUnusedLayersAction_triggered)
 
-        self.setAllLayersAction = QtWidgets.QAction('Set All Layers', parent=self.layersMenu)
-        self.setAllLayersAction.setObjectName('setAllLayersAction')
-        self.setAllLayersAction.triggered.connect(self.on_setAllLayersAction_triggered)
+        self.setAllLayersMenu = QtWidgets.QMenu('Set All Layers', parent=self.layersMenu)
+        self.setAllLayersMenu.setObjectName('setAllLayersMenu')
+        self.setAllLayersMenu.triggered.connect(self.on_setAllLayersMenu_triggered)
+        self.addLayerStateActions(self.setAllLayersMenu)
 
-        self.setSelectedLayersAction = QtWidgets.QAction('Set Selected Layers', parent=self.layersMenu)
-        self.setSelectedLayersAction.setObjectName('setSelectedLayersAction')
-        self.setSelectedLayersAction.triggered.connect(self.on_setSelectedLayersAction_triggered)
+        self.setSelectedLayersMenu = QtWidgets.QMenu('Set Selected Layers', parent=self.layersMenu)
+        self.setSelectedLayersMenu.setObjectName('setSelectedLayersMenu')
+        self.setSelectedLayersMenu.triggered.connect(self.on_setSelectedLayersMenu_triggered)
+        self.addLayerStateActions(self.setSelectedLayersMenu)
 
-        self.setOnlySelectedLayersAction = QtWidgets.QAction('Set Only Selected Layers', parent=self.layersMenu)
-        self.setOnlySelectedLayersAction.setObjectName('setOnlySelectedLayersAction')
-        self.setOnlySelectedLayersAction.triggered.connect(self.on_setOnlySelectedLayersAction_triggered)
+        self.setOnlySelectedLayersMenu = QtWidgets.QMenu('Set Only Selected Layers', parent=self.layersMenu)
+        self.setOnlySelectedLayersMenu.setObjectName('setOnlySelectedLayersMenu')
+        self.setOnlySelectedLayersMenu.triggered.connect(self.on_setOnlySelectedLayersMenu_triggered)
+        self.addLayerStateActions(self.setOnlySelectedLayersMenu)
+
+        self.snapshotsMenu = QtWidgets.QMenu('Snapshots', parent=self.layersMenu)
+        self.snapshotsMenu.setObjectName('snapshotsMenu')
+        self.snapshotsMenu.aboutToShow.connect(self.on_snapshotsMenu_aboutToShow)
 
         self.chronologicallyAction = QtWidgets.QAction('Chronologically', parent=self.layersMenu)
         self.chronologicallyAction.setObjectName('chronologicallyAction')
@@ -314,7 +313,11 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.layersMenu.addSeparator()
         self.layersMenu.addActions([self.deleteSelectedLayersAction, self.deleteUnusedLayersAction])
         self.layersMenu.addSeparator()
-        self.layersMenu.addActions([self.setAllLayersAction, self.setSelectedLayersAction, self.setOnlySelectedLayersAction])
+        self.layersMenu.addMenu(self.setAllLayersMenu)
+        self.layersMenu.addMenu(self.setSelectedLayersMenu)
+        self.layersMenu.addMenu(self.setOnlySelectedLayersMenu)
+        self.layersMenu.addSeparator()
+        self.layersMenu.addMenu(self.snapshotsMenu)
         self.layersMenu.addSeparator()
         self.layersMenu.addActions([self.chronologicallyAction, self.alphabeticallyAction])
 
@@ -350,13 +353,25 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.showNodesAction.setChecked(True)
         self.showNodesAction.triggered.connect(self.on_showNodesAction_triggered)
 
+        self.stageEditsAction = QtWidgets.QAction('Stage Check-State Edits', parent=self.optionsMenu)
+        self.stageEditsAction.setObjectName('stageEditsAction')
+        self.stageEditsAction.setCheckable(True)
+        self.stageEditsAction.triggered.connect(self.on_stageEditsAction_triggered)
+
+        self.warmStartAction = QtWidgets.QAction('Warm Start from Cache', parent=self.optionsMenu)
+        self.warmStartAction.setObjectName('warmStartAction')
+        self.warmStartAction.setCheckable(True)
+        self.warmStartAction.setChecked(True)
+
         self.optionsMenu.addActions(
             [
                 self.makeNewLayersCurrentAction,
                 self.addNewObjectsToCurrentLayerAction,
                 self.autoOverridesAction,
                 self.showNamespaceAction,
-                self.showNodesAction
+                self.showNodesAction,
+                self.stageEditsAction,
+                self.warmStartAction
             ]
         )
 
@@ -370,357 +385,1428 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         self.helpOnDisplayLayersAction.triggered.connect(self.on_helpOnDisplayLayersAction_triggered)
 
         self.helpMenu.addAction(self.helpOnDisplayLayersAction)
-    # endregion
 
-    # region Callbacks
-    def sceneOpening(self, *args, **kwargs):
-        """
-        Notifies the layer item model that a new scene is being opened.
+        # Initialize selection timer
+        # A zero interval defers the synchronization until the event loop goes idle!
+        #
+        self.selectionTimer = QtCore.QTimer(parent=self)
+        self.selectionTimer.setObjectName('selectionTimer')
+        self.selectionTimer.setSingleShot(True)
+        self.selectionTimer.setInterval(0)
+        self.selectionTimer.timeout.connect(self.on_selectionTimer_timeout)
+
+        # Initialize selection push timer
+        # This caps the rate at which tree selection changes are pushed to the scene while dragging!
+        # The timer is only started when it is inactive so further changes never push the deadline back.
+        #
+        self.selectionPushTimer = QtCore.QTimer(parent=self)
+        self.selectionPushTimer.setObjectName('selectionPushTimer')
+        self.selectionPushTimer.setSingleShot(True)
+        self.selectionPushTimer.setInterval(100)
+        self.selectionPushTimer.timeout.connect(self.on_selectionPushTimer_timeout)
+
+        # Initialize populate timer
+        # Layers and members are populated in slices whenever the event loop goes idle!
+        #
+        self.populateTimer = QtCore.QTimer(parent=self)
+        self.populateTimer.setObjectName('populateTimer')
+        self.populateTimer.setSingleShot(True)
+        self.populateTimer.setInterval(0)
+        self.populateTimer.timeout.connect(self.on_populateTimer_timeout)
 
-        :key clientData: Any
-        :rtype: None
+    def eventFilter(self, watched, event):
         """
+        Filters events if this object has been installed as an event filter for the watched object.
+        Any pending tree selection changes are pushed to the scene once the mouse button or modifier is released!
 
-        self.clearDisplayLayerManagers()
-
-    def sceneOpened(self, *args, **kwargs):
+        :type watched: QtCore.QObject
+        :type event: QtCore.QEvent
+        :rtype: bool
         """
-        Notifies the layer item model that a new scene has been opened.
 
-        :key clientData: Any
-        :rtype: None
-        """
+        eventType = event.type()
 
-        self.refreshDisplayLayerManagers()
+        if eventType == QtCore.QEvent.MouseButtonRelease:
 
-    def selectionChanged(self, *args, **kwargs):
-        """
-        Notifies layer selection model of a selection change.
+            self.pushSelectionChanges()
 
-        :key clientData: Any
-        :rtype: None
-        """
+        elif eventType == QtCore.QEvent.KeyRelease and event.key() in (QtCore.Qt.Key_Shift, QtCore.Qt.Key_Control):
 
-        self.synchronizeSelection()
-    # endregion
+            self.pushSelectionChanges()
 
-    # region Methods
-    def addCallbacks(self):
+        return super(QLayerExplorer, self).eventFilter(watched, event)
+
+    def showEvent(self, event):
         """
-        Adds any callbacks required by this window.
+        Event method called after the widget has been shown.
+        The icon resources are registered on the first show and any changes recorded while the window was hidden are replayed!
 
+        :type event: QtGui.QShowEvent
         :rtype: None
         """
 
-        # Add callbacks
+        # Call parent method
         #
-        hasCallbacks = len(self._callbackIds) > 0
-
-        if not hasCallbacks:
+        super(QLayerExplorer, self).showEvent(event)
 
-            callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeNew, onSceneOpening)
-            self._callbackIds.append(callbackId)
-
-            callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeOpen, onSceneOpening)
-            self._callbackIds.append(callbackId)
-
-            callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kSceneUpdate, onSceneOpened)
-            self._callbackIds.append(callbackId)
+        # Check if icons have been initialized
+        #
+        if not self._iconsInitialized:
 
-            callbackId = om.MEventMessage.addEventCallback('SelectionChanged', onSelectionChanged)
-            self._callbackIds.append(callbackId)
+            self.initializeIcons()
 
-        # Force scene update
+        # Resume scene tracking
         #
-        self.refreshDisplayLayerManagers()
+        if self._suspended:
 
-    def removeCallbacks(self):
+            self.resumeTracking()
+
+    def hideEvent(self, event):
         """
-        Removes any callbacks created by this window.
+        Event method called after the widget has been hidden.
+        Scene tracking is suspended until the window is shown again!
 
+        :type event: QtGui.QHideEvent
         :rtype: None
         """
 
-        # Remove callbacks
+        # Call parent method
         #
-        hasCallbacks = len(self._callbackIds) > 0
+        super(QLayerExplorer, self).hideEvent(event)
 
-        if hasCallbacks:
+        # Suspend scene tracking
+        #
+        if not self._suspended:
 
-            om.MMessage.removeCallbacks(self._callbackIds)
-            self._callbackIds.clear()
+            self.suspendTracking()
+    # endregion
 
-    def clearDisplayLayerManagers(self):
+    # region Mutators
+    def mergedSelectionEvents(self):
         """
-        Clears all display-layer managers from the tree view.
+        Returns the number of selection events that were merged into a previous synchronization.
 
-        :rtype: None
+        :rtype: int
         """
 
-        self.layerItemModel.setLayerManagers([])
+        return self._mergedSelectionEvents
+    # endregion
 
-    def refreshDisplayLayerManagers(self):
+    # region Callbacks
+    def sceneOpening(self, *args, **kwargs):
         """
-        Refreshes the display-layer managers in the tree view.
+        Notifies the layer item model that a new scene is being opened.
 
+        :key clientData: Any
         :rtype: None
         """
 
-        self.layerItemModel.setLayerManagers(list(dagutils.iterNodes(om.MFn.kDisplayLayerManager)))
+        self._referencesChanged = False
+        self.clearFingerprints()
 
-    def synchronizeSelection(self):
+        self.layerItemModel.discardPendingStates()
+        self.clearDisplayLayerManagers()
+
+        # Reset any unfinished import bracket
+        # Failed imports never send their closing message, so their recorded changes are discarded along with the previous scene!
+        #
+        if self._batching and not self._suspended:
+
+            self.resetJournal()
+
+        self._batching = False
+
+        if self._suspended:
+
+            self.journalChange(overflow=True)
+
+    def sceneOpened(self, *args, **kwargs):
         """
-        Synchronizes the layer selection model with the scene selection.
+        Notifies the layer item model that a new scene has been opened.
+        Scene updates that follow a reference change are skipped since the affected subtrees are already up-to-date!
+        Scene updates that do not change any layer managers are also skipped, otherwise only the changed layer managers are updated!
 
+        :key clientData: Any
         :rtype: None
         """
 
-        # Get associated item indices
+        if self._referencesChanged:
+
+            self._referencesChanged = False
+            return
+
+        if self._suspended:
+
+            self.clearFingerprints()
+            self.journalChange(overflow=True)
+            return
+
+        # Compare layer fingerprints
+        # An empty fingerprint means the tree was cleared by a new or opened scene, these are recorded while the tree is populated instead!
         #
-        selection = dagutils.getActiveSelection(apiType=om.MFn.kDependencyNode)
-        items = QtCore.QItemSelection()
+        if len(self._fingerprints) > 0:
 
-        for selectedNode in selection:
+            fingerprints = self.fingerprintDisplayLayerManagers()
+            previousFingerprints, self._fingerprints = self._fingerprints, fingerprints
 
-            sourceIndex = self.layerItemModel.indexFromNode(selectedNode)
-            index = self.layerItemFilterModel.mapFromSource(sourceIndex)
+            changed = [hashCode for (hashCode, fingerprint) in fingerprints.items() if hashCode in previousFingerprints and previousFingerprints[hashCode] != fingerprint]
+            unchanged = [hashCode for (hashCode, fingerprint) in fingerprints.items() if previousFingerprints.get(hashCode, None) == fingerprint]
+            hasChanged = len(changed) > 0 or fingerprints.keys() != previousFingerprints.keys()
 
-            if index.isValid():
+            if hasChanged:
 
-                items.select(index, index.siblingAtColumn(self.layerItemModel.columnCount() - 1))
+                self.layerItemModel.layerGraph().invalidate(*changed, *self.iterDisplayLayerHashCodes(changed))
+                self.updateDisplayLayerManagers(reconcile=changed)
 
-            else:
+            # Verify the members of unchanged layer managers in the background
+            # Member counts cannot reveal members that swapped layers, so member fingerprints are compared one layer per slice!
+            #
+            self.enqueuePopulate(self.iterDisplayLayerHashCodes(unchanged))
 
-                continue
+            return
 
-        # Update layer selection model
-        #
-        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+        if not self.warmStartDisplayLayerManagers():
 
-            self.layerSelectionModel.select(items, QtCore.QItemSelectionModel.ClearAndSelect)
+            self.refreshDisplayLayerManagers()
 
-    def selectedDisplayLayers(self):
+    def sceneSaved(self, *args, **kwargs):
         """
-        Returns the selected display layers.
+        Notifies the layer item model that the scene has been saved.
 
-        :rtype: List[om.MObject]
+        :key clientData: Any
+        :rtype: None
         """
 
-        return list(dagutils.iterActiveSelection(om.MFn.kDisplayLayer))
+        self.saveLayerCache()
 
-    @undo.Undo(name='Select Objects in Selected Layers')
-    def selectObjectsInSelectedLayers(self):
+    def referenceChanged(self, referenceNode, resolvedPath, clientData=None):
         """
-        Selects the nodes from the current selected layers.
+        Notifies the layer item model that a reference has been loaded, unloaded, created, removed or imported.
+        References that are loaded while a scene is being opened are left to the scene update!
 
+        :type referenceNode: om.MObject
+        :type resolvedPath: om.MFileObject
+        :type clientData: int
         :rtype: None
         """
 
-        # Evaluate layer selection
+        # Check if scene is being opened
         #
-        layers = self.selectedDisplayLayers()
-        numLayers = len(layers)
-        
-        if numLayers == 0:
+        if om.MFileIO.isOpeningFile() or om.MFileIO.isNewingFile():
 
             return
 
-        # Create selection list form layer nodes
+        # Flag the next scene update as redundant
+        # The flag is dropped once the deferred queue is idle, in case no scene update follows!
         #
-        nodes = list(layerutils.iterNodesFromLayers(*layers))
-        selectionList = dagutils.createSelectionList(nodes)
-
-        om.MGlobal.setActiveSelectionList(selectionList)
-    # endregion
-
-    # region Slots
-    @QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
-    def on_layerItemModel_dataChanged(self, topLeft, bottomRight, roles=None):
-        """
-        Slot method for the `layerItemModel` widget's `dataChanged` signal.
+        if not self._referencesChanged:
 
-        :type topLeft: QtCore.QModelIndex
-        :type bottomRight: QtCore.QModelIndex
-        :type roles: List[QtCore.Qt.ItemDataRole]
-        :rtype: None
-        """
+            self._referencesChanged = True
+            mc.evalDeferred(self.resetReferencesChanged, lowestPriority=True)
 
-        # Evaluate data role
+        # Evaluate affected layer managers
+        # Imported layers are merged into the root layer manager so it also requires reconciling!
         #
-        role = QtCore.Qt.ItemDataRole(roles[0]) if len(roles) == 1 else None
-
-        if role != QtCore.Qt.CheckStateRole:
+        reconcile = []
 
-            return
-
-        # Evaluate selection count
-        #
-        itemSelection = self.layerSelectionModel.selection()
-        sourceIndices = [self.layerItemFilterModel.mapToSource(index) for index in itemSelection.indexes()]
+        if clientData == om.MSceneMessage.kAfterImportReference:
 
-        column = topLeft.column()
-        rowIndices = [index for index in sourceIndices if index.column() == column]
-        numRows = len(rowIndices)
+            rootLayerManager = self.layerItemModel.rootLayerManager()
 
-        if not (numRows >= 2):
+            if rootLayerManager is not None:
 
-            return
+                reconcile.append(rootLayerManager)
 
-        # Propagate check state change to other rows
+        # Update affected layer managers
+        # While hidden, or inside an import bracket, the changes are only recorded!
         #
-        model = self.sender()
-        checkState = topLeft.data(role=role)
+        if self._suspended or self._batching:
 
-        with qsignalblocker.QSignalBlocker(model):
-
-            self._dataChanges = itemSelection  # Store current selection in case we need to recreate it later on!
+            self.journalChange(hashCodes=reconcile, managers=True)
 
-            for index in rowIndices:
+        else:
 
-                model.setData(index, checkState, role=role)
+            self.updateDisplayLayerManagers(reconcile=reconcile)
 
-    @QtCore.Slot(QtCore.QItemSelection, QtCore.QItemSelection)
-    def on_layerSelectionModel_selectionChanged(self, selected, deselected):
+    def batchStarted(self, *args, **kwargs):
         """
-        Slot method for the `layerSelectionModel` widget's `selectionChanged` signal.
+        Notifies the layer item model that an import or reference operation has started.
+        Any scene changes are only recorded until the operation has finished!
 
-        :type selected: QtCore.QItemSelection
-        :type deselected: QtCore.QItemSelection
+        :key clientData: int
         :rtype: None
         """
 
-        # Check if any data changes recently occurred
-        # If so, then we need to recreate the original selection!
-        #
-        selectionLost = any([self._dataChanges.contains(index) for index in deselected.indexes()])
-
-        if selectionLost:
+        self._batching = True
 
-            selected.merge(self._dataChanges, QtCore.QItemSelectionModel.Select)
-            self._dataChanges.clear()
+    def batchFinished(self, *args, **kwargs):
+        """
+        Notifies the layer item model that an import or reference operation has finished.
+        All recorded changes are applied in a single incremental update!
 
-            with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+        :key clientData: int
+        :rtype: None
+        """
 
-                self.layerSelectionModel.select(selected, QtCore.QItemSelectionModel.Select)
+        self._batching = False
 
-        # Collect dag nodes from selected indices
+        # Check if scene is being opened
+        # If so, then the scene update will refresh the entire tree!
         #
-        indexes = [self.layerItemFilterModel.mapToSource(index) for index in selected.indexes() if index.column() == 0]
-        nodes = list(map(self.layerItemModel.nodeFromIndex, indexes))
+        if om.MFileIO.isOpeningFile() or om.MFileIO.isNewingFile():
 
-        selectionList = dagutils.createSelectionList(nodes)
+            return
 
-        # Evaluate keyboard modifiers
+        # Record imported layers
+        # Imported layers are merged into the root layer manager so it also requires reconciling!
         #
-        modifiers = QtWidgets.QApplication.keyboardModifiers()
+        rootLayerManager = self.layerItemModel.rootLayerManager()
+        hashCodes = [rootLayerManager] if rootLayerManager is not None else []
 
-        shiftPressed = QtCore.Qt.ShiftModifier & modifiers
-        controlPressed = QtCore.Qt.ControlModifier & modifiers
+        self.journalChange(hashCodes=hashCodes, managers=True)
 
-        if shiftPressed or controlPressed:
-
-            selectionList.merge(om.MGlobal.getActiveSelectionList())
-
-        # Update active selection
+        # Apply recorded changes
+        # While hidden, the changes are replayed once the window is shown again!
         #
-        om.MGlobal.setActiveSelectionList(selectionList)
+        if not self._suspended:
 
-    @QtCore.Slot(str)
-    def on_searchLineEdit_textChanged(self, text):
+            self.replayJournal()
+
+    def selectionChanged(self, *args, **kwargs):
         """
-        Slot method for the `searchLineEdit` widget's `textChanged` signal.
+        Notifies layer selection model of a selection change.
+        Bursts of selection changes are coalesced into a single deferred synchronization!
 
-        :type text: str
+        :key clientData: Any
         :rtype: None
         """
 
-        self.layerItemFilterModel.setFilterWildcard(text)
+        if self._suspended or self._batching:
 
-    @QtCore.Slot()
-    def on_moveLayerUpPushButton_clicked(self):
-        """
-        Slot method for the `moveLayerUpPushButton` widget's `clicked` signal.
+            self.journalChange(selection=True)
+            return
 
-        :rtype: None
-        """
+        self._pendingSelectionEvents += 1
 
-        pass
+        if not self.selectionTimer.isActive():
 
-    @QtCore.Slot()
-    def on_moveLayerDownPushButton_clicked(self):
+            self.selectionTimer.start()
+    # endregion
+
+    # region Methods
+    def initializeIcons(self):
         """
-        Slot method for the `moveLayerDownPushButton` widget's `clicked` signal.
+        Registers the compiled icon resources and assigns the button icons.
+        This is deferred until the window is first shown so constructing a hidden window stays cheap!
 
         :rtype: None
         """
 
-        pass
+        initializeResources()
 
-    @QtCore.Slot()
-    def on_createEmptyLayerPushButton_clicked(self):
-        """
-        Slot method for the `createEmptyLayerPushButton` widget's `clicked` signal.
+        for (objectName, iconPath) in self.__button_icons__.items():
 
-        :rtype: None
-        """
+            getattr(self, objectName).setIcon(QtGui.QIcon(iconPath))
 
-        pass
+        self._iconsInitialized = True
 
-    @QtCore.Slot()
-    def on_createLayerFromSelectedPushButton_clicked(self):
+    def addCallbacks(self):
         """
-        Slot method for the `createLayerFromSelectedPushButton` widget's `clicked` signal.
+        Adds any callbacks required by this window.
+        Scene callbacks are shared with any other subscriber of the layer graph!
 
         :rtype: None
         """
 
-        pass
+        # Subscribe to layer backend
+        #
+        self.layerItemModel.backend().subscribe(self)
 
-    @QtCore.Slot(bool)
-    def on_createEmptyLayerAction_triggered(self, checked=False):
+        # Track application focus
+        # Activation changes are not sent while the window is docked inside Maya's main window!
+        #
+        QtWidgets.QApplication.instance().focusChanged.connect(self.on_application_focusChanged)
+
+        # Force scene update
+        #
+        self.refreshDisplayLayerManagers()
+
+    def removeCallbacks(self):
         """
-        Slot method for the `createEmptyLayerAction` widget's `triggered` signal.
+        Removes any callbacks created by this window.
 
-        :type checked: bool
         :rtype: None
         """
 
-        pass
+        self.layerItemModel.backend().unsubscribe(self)
+        QtWidgets.QApplication.instance().focusChanged.disconnect(self.on_application_focusChanged)
 
-    @QtCore.Slot(bool)
-    def on_createLayerFromSelectedAction_triggered(self, checked=False):
+    def clearDisplayLayerManagers(self):
         """
-        Slot method for the `createLayerFromSelectedAction` widget's `triggered` signal.
+        Clears all display-layer managers from the tree view.
 
-        :type checked: bool
         :rtype: None
         """
 
-        pass
+        self.stopPopulate()
+        self.layerItemModel.setLayerManagers([])
 
-    @QtCore.Slot(bool)
-    def on_selectObjectsInSelectedLayersAction_triggered(self, checked=False):
+    def refreshDisplayLayerManagers(self):
         """
-        Slot method for the `selectObjectsInSelectedLayersAction` widget's `triggered` signal.
+        Refreshes the display-layer managers in the tree view.
+        Only the layer managers are added up front, their layers and members are populated in the background!
 
-        :type checked: bool
         :rtype: None
         """
 
-        self.selectObjectsInSelectedLayers()
+        self.stopPopulate()
+        self.layerItemModel.setLayerManagers(self.layerItemModel.backend().layerManagers())
+        self.startPopulate()
 
-    @QtCore.Slot(bool)
-    def on_removeSelectedObjectsFromSelectedLayersAction_triggered(self, checked=False):
+    def warmStartDisplayLayerManagers(self):
         """
-        Slot method for the `removeSelectedObjectsFromSelectedLayersAction` widget's `triggered` signal.
+        Populates the tree view from the warm-start cache of the open scene.
+        The cached tree is shown immediately and then reconciled against the scene in the background!
 
-        :type checked: bool
-        :rtype: None
+        :rtype: bool
         """
 
-        pass
+        # Check if warm starts are enabled
+        #
+        if not self.warmStartAction.isChecked():
 
-    @QtCore.Slot()
+            return False
+
+        # Check if scene has an up-to-date cache
+        #
+        cache = layercache.readCache(om.MFileIO.currentFile())
+
+        if cache is None:
+
+            return False
+
+        # Populate layer managers from cache
+        #
+        self.stopPopulate()
+
+        with cache:
+
+            success = self.layerItemModel.setLayerManagersFromCache(cache)
+
+        if not success:
+
+            return False
+
+        # Reconcile cached tree in the background
+        #
+        self.startPopulate(verifyLayerManagers=True)
+
+        return True
+
+    def startPopulate(self, verifyLayerManagers=False):
+        """
+        Starts populating the layers and members of every layer manager in idle-time slices.
+        Layer managers are processed before any layers so the layers appear before their members are fetched!
+
+        :type verifyLayerManagers: bool
+        :rtype: None
+        """
+
+        self._populateQueue.clear()
+        self._populateCount = 0
+        self._verifyLayerManagers = verifyLayerManagers
+
+        self.enqueuePopulate(self.layerItemModel.layerManagers())
+
+    def enqueuePopulate(self, hashCodes):
+        """
+        Queues the supplied layer managers, or display layers, for background population.
+        Any population that is already in progress is extended rather than restarted!
+
+        :type hashCodes: Iterable[int]
+        :rtype: None
+        """
+
+        self._populateQueue.extend(hashCodes)
+        numQueued = len(self._populateQueue)
+
+        if numQueued == 0:
+
+            return
+
+        self.populateProgressBar.setRange(0, self._populateCount + numQueued)
+        self.populateProgressBar.setValue(self._populateCount)
+        self.populateProgressBar.setVisible(True)
+
+        if not self.populateTimer.isActive():
+
+            self.populateTimer.start()
+
+    def stopPopulate(self):
+        """
+        Stops any pending background population.
+
+        :rtype: None
+        """
+
+        self.populateTimer.stop()
+        self._populateQueue.clear()
+        self._verifyLayerManagers = False
+
+        self.populateProgressBar.setVisible(False)
+
+    def populateNext(self):
+        """
+        Populates the next queued layer manager or display layer.
+        Layer managers are reconciled against the scene, with targeted row signals, before their layers are queued!
+        Display layers whose member fingerprint is unchanged since they were last populated are skipped.
+        Returns a boolean that indicates if any rows were replaced.
+
+        :rtype: bool
+        """
+
+        # Evaluate next queued node
+        #
+        hashCode = self._populateQueue.popleft()
+        nodeType = self.layerItemModel.backend().nodeType(hashCode)
+
+        self._populateCount += 1
+
+        # Evaluate node type
+        #
+        if nodeType == layerbackend.NodeType.LAYER_MANAGER:
+
+            changed = self.layerItemModel.reconcileLayerManager(hashCode)
+            self._populateQueue.extend(self.layerItemModel.getDisplayLayers(hashCode))
+
+            self.recordFingerprint(hashCode)
+
+            return changed
+
+        elif nodeType == layerbackend.NodeType.DISPLAY_LAYER:
+
+            # Check if members have changed
+            # The layer graph reuses its cached members as long as their number is unchanged, so a changed fingerprint must invalidate the graph!
+            #
+            previousFingerprint = self._memberFingerprints.get(hashCode, None)
+            fingerprint = self.recordMemberFingerprint(hashCode)
+
+            if previousFingerprint is not None and previousFingerprint == fingerprint:
+
+                return False
+
+            elif previousFingerprint is not None:
+
+                self.layerItemModel.layerGraph().invalidate(hashCode)
+
+            return self.layerItemModel.reconcileDisplayLayer(hashCode)
+
+        else:
+
+            return False
+
+    def finishPopulate(self):
+        """
+        Finalizes the background population.
+        Warm-started trees also verify the layer managers themselves, if these differ then the tree is refreshed!
+
+        :rtype: None
+        """
+
+        self.populateProgressBar.setVisible(False)
+        self._populateCount = 0
+
+        if not self._verifyLayerManagers:
+
+            return
+
+        self._verifyLayerManagers = False
+
+        hashCodes = set(self.layerItemModel.backend().layerManagers())
+
+        if hashCodes != set(self.layerItemModel.layerManagers()):
+
+            self.refreshDisplayLayerManagers()
+
+    def updateDisplayLayerManagers(self, reconcile=None):
+        """
+        Updates the display-layer managers in the tree view without a model reset.
+        Only the subtrees of added, removed or reconciled layer managers are touched!
+
+        :type reconcile: Union[List[int], None]
+        :rtype: None
+        """
+
+        # Update layer managers
+        # Removed rows should not be pushed to the scene selection!
+        #
+        layerManagers = self.layerItemModel.backend().layerManagers()
+
+        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+
+            removed, added = self.layerItemModel.updateLayerManagers(layerManagers)
+
+        # Populate affected layer managers in the background
+        #
+        self.enqueuePopulate(added + (reconcile if reconcile is not None else []))
+
+        if len(removed) > 0:
+
+            self.invalidateSelection()
+            self.synchronizeSelection()
+
+    def fingerprintDisplayLayerManagers(self):
+        """
+        Returns the layer fingerprints of every display-layer manager in the scene.
+        These only scale with the number of layers, the members are verified by `populateNext` instead!
+
+        :rtype: Dict[int, str]
+        """
+
+        layerGraph = self.layerItemModel.layerGraph()
+        return {om.MObjectHandle(layerManager).hashCode(): layerGraph.getLayerFingerprint(layerManager) for layerManager in dagutils.iterNodes(om.MFn.kDisplayLayerManager)}
+
+    def recordFingerprint(self, layerManagerHashCode):
+        """
+        Records the layer fingerprint of the supplied layer manager.
+        Only layers and member counts are visited, the members are fingerprinted when each of its layers is populated!
+
+        :type layerManagerHashCode: int
+        :rtype: None
+        """
+
+        layerManager = self.layerItemModel.nodeFromHashCode(layerManagerHashCode)
+
+        if not layerManager.isNull():
+
+            self._fingerprints[layerManagerHashCode] = self.layerItemModel.layerGraph().getLayerFingerprint(layerManager)
+
+    def recordMemberFingerprint(self, displayLayerHashCode):
+        """
+        Records, and returns, the member fingerprint of the supplied display layer.
+        Members are fingerprinted one layer at a time, as each layer is populated, so no single slice walks the entire scene!
+
+        :type displayLayerHashCode: int
+        :rtype: Union[str, None]
+        """
+
+        displayLayer = self.layerItemModel.nodeFromHashCode(displayLayerHashCode)
+
+        if displayLayer.isNull():
+
+            self._memberFingerprints.pop(displayLayerHashCode, None)
+            return None
+
+        fingerprint = self.layerItemModel.layerGraph().getMemberFingerprint(displayLayer)
+        self._memberFingerprints[displayLayerHashCode] = fingerprint
+
+        return fingerprint
+
+    def clearFingerprints(self):
+        """
+        Clears the recorded layer and member fingerprints.
+
+        :rtype: None
+        """
+
+        self._fingerprints.clear()
+        self._memberFingerprints.clear()
+
+    def iterDisplayLayerHashCodes(self, layerManagerHashCodes):
+        """
+        Returns a generator that yields the hash codes of the display layers cached under the supplied layer managers.
+
+        :type layerManagerHashCodes: List[int]
+        :rtype: Iterator[int]
+        """
+
+        for layerManagerHashCode in self.layerItemModel.iterLayerManagerHashCodes():
+
+            if layerManagerHashCode in layerManagerHashCodes:
+
+                yield from self.layerItemModel.getDisplayLayers(layerManagerHashCode)
+
+    def resetReferencesChanged(self):
+        """
+        Resets the flag that marks the next scene update as redundant.
+
+        :rtype: None
+        """
+
+        self._referencesChanged = False
+
+    def suspendTracking(self):
+        """
+        Suspends any model maintenance while the window is hidden.
+        Scene changes are recorded in a compact journal, and any background population is paused, until tracking is resumed!
+
+        :rtype: None
+        """
+
+        self._suspended = True
+
+        self.populateTimer.stop()
+        self.selectionTimer.stop()
+
+        if self._pendingSelectionEvents > 0:
+
+            self._pendingSelectionEvents = 0
+            self.journalChange(selection=True)
+
+    def resumeTracking(self):
+        """
+        Resumes model maintenance by replaying the journal recorded while the window was hidden.
+        If the journal overflowed then the tree is refreshed instead!
+
+        :rtype: None
+        """
+
+        self._suspended = False
+        self.replayJournal()
+
+    def replayJournal(self):
+        """
+        Applies the changes recorded in the journal and then resets it.
+        If the journal overflowed then the tree is refreshed instead!
+
+        :rtype: None
+        """
+
+        # Replay journal
+        #
+        if self._journalOverflow:
+
+            self.refreshDisplayLayerManagers()
+
+        elif self._journalManagers:
+
+            self.updateDisplayLayerManagers(reconcile=list(self._journal))
+
+        else:
+
+            self.enqueuePopulate(self._journal)  # Also resumes any paused population!
+
+        # Synchronize selection
+        #
+        if self._journalSelection or self._journalOverflow:
+
+            self.invalidateSelection()
+            self.synchronizeSelection()
+
+        # Reset journal
+        #
+        self.resetJournal()
+
+    def resetJournal(self):
+        """
+        Discards any changes recorded in the journal.
+
+        :rtype: None
+        """
+
+        self._journal.clear()
+        self._journalManagers = False
+        self._journalSelection = False
+        self._journalOverflow = False
+
+    def journalChange(self, hashCodes=(), managers=False, selection=False, overflow=False):
+        """
+        Records a scene change while the window is hidden or an import is in progress.
+        Once the journal exceeds its limit only a full refresh is recorded!
+
+        :type hashCodes: Iterable[int]
+        :type managers: bool
+        :type selection: bool
+        :type overflow: bool
+        :rtype: None
+        """
+
+        self._journalManagers |= managers
+        self._journalSelection |= selection
+        self._journalOverflow |= overflow
+
+        if self._journalOverflow:
+
+            self._journal.clear()
+            return
+
+        self._journal.update(hashCodes)
+
+        if len(self._journal) > self.__journal_limit__:
+
+            self._journalOverflow = True
+            self._journal.clear()
+
+    def saveLayerCache(self):
+        """
+        Writes the layer tree of the open scene to its warm-start cache.
+
+        :rtype: None
+        """
+
+        # Check if warm starts are enabled
+        #
+        if not self.warmStartAction.isChecked():
+
+            return
+
+        # Write layer tree to cache
+        #
+        scenePath = om.MFileIO.currentFile()
+
+        try:
+
+            layercache.writeCache(scenePath, self.layerItemModel.exportLayerTree())
+
+        except OSError as exception:
+
+            log.warning('Unable to write layer cache for: %s (%s)' % (scenePath, exception))
+
+    def invalidateSelection(self):
+        """
+        Invalidates the cached scene selection.
+        The next synchronization will rebuild the entire layer selection!
+
+        :rtype: None
+        """
+
+        self._activeSelection.clear()
+        self._selectionInvalidated = True
+
+    def createItemSelection(self, handles):
+        """
+        Returns an item selection from the supplied node handles.
+        See `QLayerItemModel.createItemSelection` for how rows are merged into selection ranges!
+
+        :type handles: List[om.MObjectHandle]
+        :rtype: QtCore.QItemSelection
+        """
+
+        indices = [self.layerItemModel.indexFromNode(handle.object()) for handle in handles if handle.isAlive()]
+        return self.layerItemModel.createItemSelection(indices, proxyModel=self.layerItemFilterModel)
+
+    def synchronizeSelection(self):
+        """
+        Synchronizes the layer selection model with the scene selection.
+        Only the nodes that were added or removed since the last synchronization are updated!
+
+        :rtype: None
+        """
+
+        # Diff scene selection against the previous selection
+        #
+        selection = dagutils.getActiveSelection(apiType=om.MFn.kDependencyNode)
+        activeSelection = {handle.hashCode(): handle for handle in map(om.MObjectHandle, selection)}
+
+        if self._selectionInvalidated:
+
+            added = list(activeSelection.values())
+            removed = []
+
+        else:
+
+            added = [activeSelection[hashCode] for hashCode in activeSelection.keys() - self._activeSelection.keys()]
+            removed = [self._activeSelection[hashCode] for hashCode in self._activeSelection.keys() - activeSelection.keys()]
+
+        # Update layer selection model
+        #
+        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+
+            if self._selectionInvalidated:
+
+                self.layerSelectionModel.select(self.createItemSelection(added), QtCore.QItemSelectionModel.ClearAndSelect)
+
+            else:
+
+                if len(removed) > 0:
+
+                    self.layerSelectionModel.select(self.createItemSelection(removed), QtCore.QItemSelectionModel.Deselect)
+
+                if len(added) > 0:
+
+                    self.layerSelectionModel.select(self.createItemSelection(added), QtCore.QItemSelectionModel.Select)
+
+        # Update cached selection
+        #
+        self._activeSelection = activeSelection
+        self._selectionInvalidated = False
+
+    def iterHandlesFromSelection(self, itemSelection):
+        """
+        Returns a generator that yields the node handles from the supplied proxy item selection.
+
+        :type itemSelection: QtCore.QItemSelection
+        :rtype: Iterator[om.MObjectHandle]
+        """
+
+        for selectionRange in itemSelection:
+
+            parent = selectionRange.parent()
+
+            for row in range(selectionRange.top(), selectionRange.bottom() + 1):
+
+                index = self.layerItemFilterModel.index(row, 0, parent)
+                sourceIndex = self.layerItemFilterModel.mapToSource(index)
+                node = self.layerItemModel.nodeFromIndex(sourceIndex)
+
+                if not node.isNull():
+
+                    yield om.MObjectHandle(node)
+
+                else:
+
+                    continue
+
+    def pushSelectionChanges(self):
+        """
+        Pushes any pending tree selection changes to the scene.
+        Extended selections are pushed as add/remove deltas while new selections replace the active selection!
+
+        :rtype: None
+        """
+
+        # Check if there are any pending changes
+        #
+        hasPendingChanges = len(self._pendingSelected) > 0 or len(self._pendingDeselected) > 0
+
+        if not hasPendingChanges:
+
+            return
+
+        self.selectionPushTimer.stop()
+
+        # Evaluate selection operation
+        #
+        if self._replaceSelection:
+
+            handles = self.iterHandlesFromSelection(self.layerSelectionModel.selection())
+            nodes = [handle.object() for handle in handles if handle.isAlive()]
+
+            om.MGlobal.setActiveSelectionList(dagutils.createSelectionList(nodes))
+
+        else:
+
+            addedNodes = [handle.object() for handle in self._pendingSelected.values() if handle.isAlive()]
+            removedNodes = [handle.object() for handle in self._pendingDeselected.values() if handle.isAlive()]
+
+            if len(removedNodes) > 0:
+
+                om.MGlobal.selectCommand(dagutils.createSelectionList(removedNodes), listAdjustment=om.MGlobal.kRemoveFromList)
+
+            if len(addedNodes) > 0:
+
+                om.MGlobal.selectCommand(dagutils.createSelectionList(addedNodes), listAdjustment=om.MGlobal.kAddToList)
+
+        # Reset pending changes
+        #
+        self._pendingSelected.clear()
+        self._pendingDeselected.clear()
+        self._replaceSelection = False
+
+    def addLayerStateActions(self, menu):
+        """
+        Adds the layer state actions to the supplied menu.
+        Each action stores its state attribute and value as data along with the opposite value for unselected layers.
+
+        :type menu: QtWidgets.QMenu
+        :rtype: None
+        """
+
+        states = (
+            ('Visible', layerstates.VISIBILITY, 1, 0),
+            ('Invisible', layerstates.VISIBILITY, 0, 1),
+            (None, None, None, None),
+            ('Frozen', layerstates.DISPLAY_TYPE, layerstates.REFERENCED, layerstates.NORMAL),
+            ('Unfrozen', layerstates.DISPLAY_TYPE, layerstates.NORMAL, layerstates.REFERENCED),
+            (None, None, None, None),
+            ('Show on Playback', layerstates.HIDE_ON_PLAYBACK, 0, 1),
+            ('Hide on Playback', layerstates.HIDE_ON_PLAYBACK, 1, 0)
+        )
+
+        for (text, attribute, value, oppositeValue) in states:
+
+            if text is None:
+
+                menu.addSeparator()
+                continue
+
+            action = QtWidgets.QAction(text, parent=menu)
+            action.setData((attribute, value))
+            action.setProperty('oppositeValue', oppositeValue)
+
+            menu.addAction(action)
+
+    def setLayerStates(self, layers, attribute, values):
+        """
+        Updates the specified state for the supplied display layers as a single batched operation.
+
+        :type layers: List[om.MObject]
+        :type attribute: str
+        :type values: Union[int, List[int]]
+        :rtype: None
+        """
+
+        # Evaluate supplied layers
+        #
+        numLayers = len(layers)
+
+        if numLayers == 0:
+
+            return
+
+        # Update layer states
+        # The model's coalesced signals should not be propagated to the selected rows!
+        #
+        try:
+
+            self._propagatingCheckStates = True
+            self.layerItemModel.setLayerStates(layers, attribute, values)
+
+        finally:
+
+            self._propagatingCheckStates = False
+
+    def createEmptyLayer(self):
+        """
+        Creates a new empty display layer.
+
+        :rtype: om.MObject
+        """
+
+        makeCurrent = self.makeNewLayersCurrentAction.isChecked()
+        return self.layerItemModel.createDisplayLayer([], makeCurrent=makeCurrent)
+
+    def createLayerFromSelected(self):
+        """
+        Creates a new display layer from the selected DAG nodes.
+
+        :rtype: om.MObject
+        """
+
+        nodes = list(dagutils.iterActiveSelection(om.MFn.kDagNode))
+        makeCurrent = self.makeNewLayersCurrentAction.isChecked()
+
+        return self.layerItemModel.createDisplayLayer(nodes, makeCurrent=makeCurrent)
+
+    def saveSnapshot(self, name):
+        """
+        Stores the current state of every layer and layer member on the scene under the specified name.
+
+        :type name: str
+        :rtype: None
+        """
+
+        layersnapshots.saveSnapshot(name, self.layerItemModel.captureSnapshot())
+
+    @undo.Undo(name='Restore Layer Snapshot')
+    def restoreSnapshot(self, name):
+        """
+        Restores the layer states stored on the scene under the specified name.
+        Only the states that differ from the snapshot are updated through a single modifier!
+
+        :type name: str
+        :rtype: None
+        """
+
+        # Check if snapshot exists
+        #
+        snapshot = layersnapshots.loadSnapshot(name)
+
+        if snapshot is None:
+
+            log.warning('Unable to locate snapshot: %s' % name)
+            return
+
+        # Restore changed states
+        #
+        nodesByKey = self.layerItemModel.snapshotNodes()
+        modifier, numChanges = layersnapshots.restoreSnapshot(snapshot, modifier=om.MDGModifier(), nodesByKey=nodesByKey)
+
+        if numChanges == 0:
+
+            return
+
+        modifier.doIt()
+        undo.commit(modifier.doIt, modifier.undoIt)
+
+        # Notify views of changes
+        # The model's coalesced signals should not be propagated to the selected rows!
+        #
+        try:
+
+            self._propagatingCheckStates = True
+            self.layerItemModel.notifyStatesChanged()
+
+        finally:
+
+            self._propagatingCheckStates = False
+
+    def commitPendingStates(self):
+        """
+        Commits any staged check-state edits through a single batched modifier.
+
+        :rtype: None
+        """
+
+        # Check if there are any pending edits
+        #
+        if not self.layerItemModel.hasPendingStates():
+
+            return
+
+        # Commit pending edits
+        # The model's coalesced signals should not be propagated to the selected rows!
+        #
+        try:
+
+            self._propagatingCheckStates = True
+            self.layerItemModel.commitPendingStates()
+
+        finally:
+
+            self._propagatingCheckStates = False
+
+    def selectedDisplayLayers(self):
+        """
+        Returns the selected display layers.
+
+        :rtype: List[om.MObject]
+        """
+
+        return list(dagutils.iterActiveSelection(om.MFn.kDisplayLayer))
+
+    @undo.Undo(name='Select Objects in Selected Layers')
+    def selectObjectsInSelectedLayers(self):
+        """
+        Selects the nodes from the current selected layers.
+
+        :rtype: None
+        """
+
+        # Evaluate layer selection
+        #
+        layers = self.selectedDisplayLayers()
+        numLayers = len(layers)
+        
+        if numLayers == 0:
+
+            return
+
+        # Create selection list form layer nodes
+        #
+        nodes = list(layerutils.iterNodesFromLayers(*layers))
+        selectionList = dagutils.createSelectionList(nodes)
+
+        om.MGlobal.setActiveSelectionList(selectionList)
+    # endregion
+
+    # region Slots
+    @QtCore.Slot(QtWidgets.QWidget, QtWidgets.QWidget)
+    def on_application_focusChanged(self, old, now):
+        """
+        Slot method for the application's `focusChanged` signal.
+        Any staged check-state edits are committed once focus leaves this window!
+
+        :type old: Union[QtWidgets.QWidget, None]
+        :type now: Union[QtWidgets.QWidget, None]
+        :rtype: None
+        """
+
+        # Check if focus left this window
+        #
+        hadFocus = old is not None and (old is self or self.isAncestorOf(old))
+        hasFocus = now is not None and (now is self or self.isAncestorOf(now))
+
+        if hadFocus and not hasFocus:
+
+            self.commitPendingStates()
+
+    @QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+    def on_layerItemModel_dataChanged(self, topLeft, bottomRight, roles=None):
+        """
+        Slot method for the `layerItemModel` widget's `dataChanged` signal.
+
+        :type topLeft: QtCore.QModelIndex
+        :type bottomRight: QtCore.QModelIndex
+        :type roles: List[QtCore.Qt.ItemDataRole]
+        :rtype: None
+        """
+
+        # Evaluate data roles
+        # Programmatic bulk edits never originate from a click so they can be ignored!
+        #
+        role = QtCore.Qt.CheckStateRole
+        hasCheckState = roles is not None and int(role) in [int(changedRole) for changedRole in roles]
+
+        if not hasCheckState or self._propagatingCheckStates:
+
+            return
+
+        # Check if edit was made to a multi-row selection
+        # The delegate toggles every selected row through a single `setCheckStates` call, but the view replaces the selection with the clicked row afterwards!
+        #
+        itemSelection = self.layerSelectionModel.selection()
+        index = self.layerItemFilterModel.mapFromSource(topLeft)
+
+        column = topLeft.column()
+        numRows = len([selectedIndex for selectedIndex in itemSelection.indexes() if selectedIndex.column() == column])
+
+        if numRows >= 2 and itemSelection.contains(index):
+
+            self._dataChanges = itemSelection  # Store current selection in case we need to recreate it later on!
+
+    @QtCore.Slot(QtCore.QItemSelection, QtCore.QItemSelection)
+    def on_layerSelectionModel_selectionChanged(self, selected, deselected):
+        """
+        Slot method for the `layerSelectionModel` widget's `selectionChanged` signal.
+
+        :type selected: QtCore.QItemSelection
+        :type deselected: QtCore.QItemSelection
+        :rtype: None
+        """
+
+        # Check if any data changes recently occurred
+        # If so, then we need to recreate the original selection!
+        #
+        selectionLost = any([self._dataChanges.contains(index) for index in deselected.indexes()])
+
+        if selectionLost:
+
+            selected.merge(self._dataChanges, QtCore.QItemSelectionModel.Select)
+            self._dataChanges.clear()
+
+            with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+
+                self.layerSelectionModel.select(selected, QtCore.QItemSelectionModel.Select)
+
+        # Accumulate selection changes
+        # These will be pushed to the scene once the user releases the mouse button or modifier, or when the push timer elapses!
+        #
+        hasPendingChanges = len(self._pendingSelected) > 0 or len(self._pendingDeselected) > 0
+
+        if not hasPendingChanges:
+
+            modifiers = QtWidgets.QApplication.keyboardModifiers()
+            self._replaceSelection = not (modifiers & (QtCore.Qt.ShiftModifier | QtCore.Qt.ControlModifier))
+
+        for handle in self.iterHandlesFromSelection(deselected):
+
+            hashCode = handle.hashCode()
+            self._pendingSelected.pop(hashCode, None)
+            self._pendingDeselected[hashCode] = handle
+
+        for handle in self.iterHandlesFromSelection(selected):
+
+            hashCode = handle.hashCode()
+            self._pendingDeselected.pop(hashCode, None)
+            self._pendingSelected[hashCode] = handle
+
+        if not self.selectionPushTimer.isActive():
+
+            self.selectionPushTimer.start()
+
+    @QtCore.Slot()
+    def on_selectionTimer_timeout(self):
+        """
+        Slot method for the `selectionTimer` widget's `timeout` signal.
+
+        :rtype: None
+        """
+
+        # Update merged event counter
+        #
+        mergedEvents = max(self._pendingSelectionEvents - 1, 0)
+        self._mergedSelectionEvents += mergedEvents
+        self._pendingSelectionEvents = 0
+
+        log.debug('Merged %s selection events into a single synchronization (%s in total).' % (mergedEvents, self._mergedSelectionEvents))
+
+        # Synchronize layer selection
+        #
+        self.synchronizeSelection()
+
+    @QtCore.Slot()
+    def on_selectionPushTimer_timeout(self):
+        """
+        Slot method for the `selectionPushTimer` widget's `timeout` signal.
+
+        :rtype: None
+        """
+
+        # Push accumulated changes
+        # Any changes made after this are pushed on release or by the next timeout!
+        #
+        self.pushSelectionChanges()
+
+    @QtCore.Slot()
+    def on_populateTimer_timeout(self):
+        """
+        Slot method for the `populateTimer` widget's `timeout` signal.
+        Queued nodes are populated until the frame budget is spent, the remainder is deferred to the next idle slice!
+
+        :rtype: None
+        """
+
+        # Populate queued nodes within frame budget
+        # Rows may be replaced so the selection is resynchronized rather than pushed to the scene!
+        #
+        elapsedTimer = QtCore.QElapsedTimer()
+        elapsedTimer.start()
+
+        changed = False
+
+        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+
+            while len(self._populateQueue) > 0 and elapsedTimer.elapsed() < self.__populate_budget__:
+
+                changed |= self.populateNext()
+
+        if changed:
+
+            self.invalidateSelection()
+            self.synchronizeSelection()
+
+        # Update progress
+        #
+        numQueued = len(self._populateQueue)
+
+        self.populateProgressBar.setMaximum(self._populateCount + numQueued)
+        self.populateProgressBar.setValue(self._populateCount)
+
+        if numQueued > 0:
+
+            self.populateTimer.start()
+
+        else:
+
+            self.finishPopulate()
+
+    @QtCore.Slot(str)
+    def on_searchLineEdit_textChanged(self, text):
+        """
+        Slot method for the `searchLineEdit` widget's `textChanged` signal.
+
+        :type text: str
+        :rtype: None
+        """
+
+        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+
+            self.layerItemFilterModel.setFilterWildcard(text)
+
+        self.invalidateSelection()
+        self.synchronizeSelection()
+
+    @QtCore.Slot()
+    def on_moveLayerUpPushButton_clicked(self):
+        """
+        Slot method for the `moveLayerUpPushButton` widget's `clicked` signal.
+
+        :rtype: None
+        """
+
+        self.layerItemModel.moveDisplayLayers(self.selectedDisplayLayers(), -1)
+
+    @QtCore.Slot()
+    def on_moveLayerDownPushButton_clicked(self):
+        """
+        Slot method for the `moveLayerDownPushButton` widget's `clicked` signal.
+
+        :rtype: None
+        """
+
+        self.layerItemModel.moveDisplayLayers(self.selectedDisplayLayers(), 1)
+
+    @QtCore.Slot()
+    def on_createEmptyLayerPushButton_clicked(self):
+        """
+        Slot method for the `createEmptyLayerPushButton` widget's `clicked` signal.
+
+        :rtype: None
+        """
+
+        self.createEmptyLayer()
+
+    @QtCore.Slot()
+    def on_createLayerFromSelectedPushButton_clicked(self):
+        """
+        Slot method for the `createLayerFromSelectedPushButton` widget's `clicked` signal.
+
+        :rtype: None
+        """
+
+        self.createLayerFromSelected()
+
+    @QtCore.Slot()
+    def on_applyPushButton_clicked(self):
+        """
+        Slot method for the `applyPushButton` widget's `clicked` signal.
+
+        :rtype: None
+        """
+
+        self.commitPendingStates()
+
+    @QtCore.Slot(bool)
+    def on_createEmptyLayerAction_triggered(self, checked=False):
+        """
+        Slot method for the `createEmptyLayerAction` widget's `triggered` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        self.createEmptyLayer()
+
+    @QtCore.Slot(bool)
+    def on_createLayerFromSelectedAction_triggered(self, checked=False):
+        """
+        Slot method for the `createLayerFromSelectedAction` widget's `triggered` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        self.createLayerFromSelected()
+
+    @QtCore.Slot(bool)
+    def on_selectObjectsInSelectedLayersAction_triggered(self, checked=False):
+        """
+        Slot method for the `selectObjectsInSelectedLayersAction` widget's `triggered` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        self.selectObjectsInSelectedLayers()
+
+    @QtCore.Slot(bool)
+    def on_removeSelectedObjectsFromSelectedLayersAction_triggered(self, checked=False):
+        """
+        Slot method for the `removeSelectedObjectsFromSelectedLayersAction` widget's `triggered` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        # Evaluate scene selection
+        #
+        layers = self.selectedDisplayLayers()
+        nodes = list(dagutils.iterActiveSelection(om.MFn.kDagNode))
+
+        if len(layers) == 0 or len(nodes) == 0:
+
+            return
+
+        # Remove selected nodes from selected layers
+        #
+        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+
+            numMembers = self.layerItemModel.removeNodesFromLayers(nodes, layers)
+
+        log.info('Removed %s member(s) from %s layer(s).' % (numMembers, len(layers)))
+
+    @QtCore.Slot()
     def on_membershipAction_triggered(self, checked=False):
         """
         Slot method for the `membershipAction` widget's `triggered` signal.
@@ -762,40 +1848,120 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         :rtype: None
         """
 
-        pass
+        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
 
-    @QtCore.Slot()
-    def on_setAllLayersAction_triggered(self, checked=False):
+            numLayers = self.layerItemModel.deleteUnusedLayers()
+
+        log.info('Deleted %s unused layer(s).' % numLayers)
+
+    @QtCore.Slot(QtWidgets.QAction)
+    def on_setAllLayersMenu_triggered(self, action):
         """
-        Slot method for the `setAllLayersAction` widget's `triggered` signal.
+        Slot method for the `setAllLayersMenu` widget's `triggered` signal.
 
-        :type checked: bool
+        :type action: QtWidgets.QAction
         :rtype: None
         """
 
-        pass
+        attribute, value = action.data()
+        layers = list(self.layerItemModel.iterDisplayLayers())
 
-    @QtCore.Slot()
-    def on_setSelectedLayersAction_triggered(self, checked=False):
+        self.setLayerStates(layers, attribute, value)
+
+    @QtCore.Slot(QtWidgets.QAction)
+    def on_setSelectedLayersMenu_triggered(self, action):
         """
-        Slot method for the `setSelectedLayersAction` widget's `triggered` signal.
+        Slot method for the `setSelectedLayersMenu` widget's `triggered` signal.
 
-        :type checked: bool
+        :type action: QtWidgets.QAction
         :rtype: None
         """
 
-        pass
+        attribute, value = action.data()
+        layers = self.selectedDisplayLayers()
+
+        self.setLayerStates(layers, attribute, value)
+
+    @QtCore.Slot(QtWidgets.QAction)
+    def on_setOnlySelectedLayersMenu_triggered(self, action):
+        """
+        Slot method for the `setOnlySelectedLayersMenu` widget's `triggered` signal.
+        Any unselected layers receive the opposite state!
+
+        :type action: QtWidgets.QAction
+        :rtype: None
+        """
+
+        # Evaluate layer selection
+        #
+        attribute, value = action.data()
+        oppositeValue = action.property('oppositeValue')
+
+        selectedHashCodes = {om.MObjectHandle(layer).hashCode() for layer in self.selectedDisplayLayers()}
+
+        if len(selectedHashCodes) == 0:
+
+            return
+
+        # Update layer states
+        #
+        layers = list(self.layerItemModel.iterDisplayLayers())
+        values = [value if (om.MObjectHandle(layer).hashCode() in selectedHashCodes) else oppositeValue for layer in layers]
+
+        self.setLayerStates(layers, attribute, values)
 
     @QtCore.Slot()
-    def on_setOnlySelectedLayersAction_triggered(self, checked=False):
+    def on_snapshotsMenu_aboutToShow(self):
+        """
+        Slot method for the `snapshotsMenu` widget's `aboutToShow` signal.
+
+        :rtype: None
+        """
+
+        # Clear previous actions
+        #
+        self.snapshotsMenu.clear()
+
+        saveSnapshotAction = self.snapshotsMenu.addAction('Save Snapshot...')
+        saveSnapshotAction.triggered.connect(self.on_saveSnapshotAction_triggered)
+
+        # Add restore and delete actions for each snapshot
+        #
+        names = layersnapshots.listSnapshots()
+
+        if len(names) == 0:
+
+            return
+
+        self.snapshotsMenu.addSeparator()
+        deleteSnapshotMenu = QtWidgets.QMenu('Delete Snapshot', parent=self.snapshotsMenu)
+
+        for name in names:
+
+            restoreAction = self.snapshotsMenu.addAction('Restore "{name}"'.format(name=name))
+            restoreAction.triggered.connect(lambda checked=False, name=name: self.restoreSnapshot(name))
+
+            deleteAction = deleteSnapshotMenu.addAction(name)
+            deleteAction.triggered.connect(lambda checked=False, name=name: layersnapshots.deleteSnapshot(name))
+
+        self.snapshotsMenu.addSeparator()
+        self.snapshotsMenu.addMenu(deleteSnapshotMenu)
+
+    @QtCore.Slot(bool)
+    def on_saveSnapshotAction_triggered(self, checked=False):
         """
-        Slot method for the `setOnlySelectedLayersAction` widget's `triggered` signal.
+        Slot method for the `saveSnapshotAction` widget's `triggered` signal.
 
         :type checked: bool
         :rtype: None
         """
 
-        pass
+        name, ok = QtWidgets.QInputDialog.getText(self, 'Save Snapshot', 'Enter snapshot name:')
+        name = name.strip()
+
+        if ok and len(name) > 0:
+
+            self.saveSnapshot(name)
 
     @QtCore.Slot(bool)
     def on_chronologicallyAction_triggered(self, checked=False):
@@ -872,7 +2038,28 @@ class QLayerExplorer(MayaQWidgetDockableMixin, qsingletonwindow.QSingletonWindow
         :rtype: None
         """
 
-        self.layerItemFilterModel.setHideNodes(not checked)
+        with qsignalblocker.QSignalBlocker(self.layerSelectionModel):
+
+            self.layerItemFilterModel.setHideNodes(not checked)
+
+        self.invalidateSelection()
+        self.synchronizeSelection()
+
+    @QtCore.Slot(bool)
+    def on_stageEditsAction_triggered(self, checked=False):
+        """
+        Slot method for the `stageEditsAction` widget's `triggered` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        if not checked:
+
+            self.commitPendingStates()
+
+        self.layerItemModel.setStagedEdits(checked)
+        self.applyPushButton.setVisible(checked)
 
     @QtCore.Slot(bool)
     def on_helpOnDisplayLayersAction_triggered(self, checked=False):